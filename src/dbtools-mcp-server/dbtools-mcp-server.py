@@ -4,33 +4,64 @@ Licensed under the Universal Permissive License v1.0 as shown at http://oss.orac
 """
 
 import os.path
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
-import json
+import orjson
+import ijson
 import oci
 from oci.signer import Signer
 from oci.resource_search.models import StructuredSearchDetails
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 from fastmcp import FastMCP
 
 MODEL_NAME = os.getenv("MODEL_NAME", "MINILM_L12_V2")
 MODEL_EMBEDDING_DIMENSION = int(os.getenv("MODEL_EMBEDDING_DIMENSION", "384"))
+CONNECTION_DETAIL_WORKERS = 16
 mcp = FastMCP("oci")
 
 
 profile_name = os.getenv("PROFILE_NAME", "DEFAULT")
 
 config = oci.config.from_file(profile_name=profile_name)
-identity_client = oci.identity.IdentityClient(config)
-
-search_client = oci.resource_search.ResourceSearchClient(config)
-database_client = oci.database.DatabaseClient(config)
-dbtools_client = oci.database_tools.DatabaseToolsClient(config)
-vault_client = oci.vault.VaultsClient(config)
-secrets_client = oci.secrets.SecretsClient(config)
-ords_endpoint = dbtools_client.base_client._endpoint.replace("https://", "https://sql.")
-object_storage_client = oci.object_storage.ObjectStorageClient(config)
+
+# OCI clients are built on first use and then reused, so startup doesn't pay
+# for clients a session never touches
+CLIENT_FACTORIES = {
+    "identity": oci.identity.IdentityClient,
+    "search": oci.resource_search.ResourceSearchClient,
+    "database": oci.database.DatabaseClient,
+    "dbtools": oci.database_tools.DatabaseToolsClient,
+    "vault": oci.vault.VaultsClient,
+    "secrets": oci.secrets.SecretsClient,
+    "object_storage": oci.object_storage.ObjectStorageClient,
+}
+
+@lru_cache(maxsize=None)
+def _client(name: str):
+    """Internal function returning the shared OCI client for a service"""
+    return CLIENT_FACTORIES[name](config)
+
+@lru_cache(maxsize=1)
+def _ords_endpoint() -> str:
+    """Internal function returning the regional ORDS endpoint, the dbtools host under sql."""
+    endpoint = urlsplit(_client("dbtools").base_client.endpoint)
+    return urlunsplit(endpoint._replace(netloc=f"sql.{endpoint.netloc}"))
+
+@lru_cache(maxsize=1)
+def _object_storage_namespace() -> str:
+    """Internal function returning the tenancy's Object Storage namespace, which never changes"""
+    return _client("object_storage").get_namespace().data
+
+# Built once: the signer parses the PEM private key on construction
 auth_signer = Signer(
     tenancy=config['tenancy'],
     user=config['user'],
@@ -40,9 +71,39 @@ auth_signer = Signer(
 )
 tenancy_id = os.getenv("TENANCY_ID_OVERRIDE", config['tenancy'])
 
+# One keep-alive session for all ORDS SQL calls, so tools that run several
+# statements in a row don't pay a new TCP+TLS handshake for each of them.
+# Retry's default allowed_methods leave POST out: only connection failures are
+# retried, a statement that reached the database is never re-sent.
+SQL_READ_TIMEOUT = float(os.getenv("SQL_READ_TIMEOUT", "300"))
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+def _oci_default(value):
+    """Internal function to let orjson encode OCI models, falling back to str"""
+    attribute_map = getattr(value, "attribute_map", None)
+    if attribute_map is None:
+        return str(value)
+    return {name: getattr(value, name) for name in attribute_map}
+
+def _dumps(value, indent: bool = False) -> str:
+    """Internal function to encode tool output as JSON text"""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(value, default=_oci_default, option=option).decode()
+
+_loads = orjson.loads
+
+def to_json(value) -> str:
+    """Internal function to serialize OCI models (or lists of them) as JSON"""
+    return _dumps(value)
+
 def list_all_compartments_internal(only_one_page: bool , limit = 100  ):
     """Internal function to get List all compartments in a tenancy"""
-    response = identity_client.list_compartments(
+    response = _client("identity").list_compartments(
             compartment_id=tenancy_id,
             compartment_id_in_subtree=True,
             access_level="ACCESSIBLE",
@@ -50,11 +111,11 @@ def list_all_compartments_internal(only_one_page: bool , limit = 100  ):
             limit = limit
        )
     compartments = response.data
-    compartments.append(identity_client.get_compartment(compartment_id=tenancy_id).data)
+    compartments.append(_client("identity").get_compartment(compartment_id=tenancy_id).data)
     if only_one_page : # limiting the number of items returned
         return  compartments   
     while response.has_next_page:
-        response = identity_client.list_compartments(
+        response = _client("identity").list_compartments(
             compartment_id=tenancy_id,
             compartment_id_in_subtree=True,
             access_level="ACCESSIBLE",
@@ -69,98 +130,128 @@ def list_all_compartments_internal(only_one_page: bool , limit = 100  ):
 @mcp.tool()
 def list_all_compartments() -> str:
     """List all compartments in a tenancy with clear formatting"""
-    return str(list_all_compartments_internal(True))
+    return to_json(list_all_compartments_internal(True))
+
+# Compartments by case-folded name; the hierarchy rarely changes, so the full
+# subtree is listed once per COMPARTMENT_CACHE_TTL seconds
+COMPARTMENT_CACHE_TTL = float(os.getenv("COMPARTMENT_CACHE_TTL", "600"))
+_compartment_cache = None
+_compartment_cache_expires_at = 0.0
+_compartment_cache_lock = threading.RLock()
+
+def _load_compartments() -> dict:
+    """Internal function returning all compartments keyed by case-folded name"""
+    global _compartment_cache, _compartment_cache_expires_at
+    with _compartment_cache_lock:
+        if _compartment_cache is None or _compartment_cache_expires_at <= time.monotonic():
+            compartments = {}
+            for compartment in list_all_compartments_internal(False):
+                # keep the first match, as the previous linear search did
+                compartments.setdefault(compartment.name.casefold(), compartment)
+            _compartment_cache = compartments
+            _compartment_cache_expires_at = time.monotonic() + COMPARTMENT_CACHE_TTL
+        return _compartment_cache
 
 def get_compartment_by_name(compartment_name: str):
     """Internal function to get compartment by name with caching"""
-    compartments = list_all_compartments_internal(False)
-    # Search for the compartment by name
-    for compartment in compartments:
-        if compartment.name.lower() == compartment_name.lower():
-            return compartment
-
-    return None
+    return _load_compartments().get(compartment_name.casefold())
 
 @mcp.tool()
 def get_compartment_by_name_tool(name: str) -> str:
     """Return a compartment matching the provided name"""
     compartment = get_compartment_by_name(name)
     if compartment:
-        return str(compartment)
+        return to_json(compartment)
     else:
-        return json.dumps({"error": f"Compartment '{name}' not found."})
+        return _dumps({"error": f"Compartment '{name}' not found."})
+
+# Search queries that never change are built once at import
+STATIC_SEARCHES = {
+    "all_conns": StructuredSearchDetails(
+        query="query databasetoolsconnection resources",
+        type="Structured",
+        matching_context_type="NONE"
+    ),
+    "all_dbs": StructuredSearchDetails(
+        query="query autonomousdatabase, database, pluggabledatabase, mysqldbsystem resources",
+        type="Structured",
+        matching_context_type="NONE"
+    ),
+}
+
+def _quote_search_value(value: str) -> str:
+    """Internal function to escape a value for use inside a single quoted search string"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+@lru_cache(maxsize=256)
+def connection_search_by_name(display_name: str, all_additional_fields: bool = False) -> StructuredSearchDetails:
+    """Build (and cache) the search for a dbtools connection by display name"""
+    returns = " return allAdditionalFields" if all_additional_fields else ""
+    return StructuredSearchDetails(
+        query=f"query databasetoolsconnection resources{returns} where displayName =~ '{_quote_search_value(display_name)}'",
+        type="Structured",
+        matching_context_type="NONE"
+    )
 
 @mcp.tool()
 def list_autonomous_databases(compartment_name: str) -> str:
     """List all databases in a given compartment name"""
     compartment = get_compartment_by_name(compartment_name)
     if not compartment:
-        return json.dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
+        return _dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
     
-    databases = database_client.list_autonomous_databases(compartment_id=compartment.id).data
-    return str(databases)
+    databases = _client("database").list_autonomous_databases(compartment_id=compartment.id).data
+    return to_json(databases)
 
 @mcp.tool()
 def list_all_databases() -> str:
     """List all databases in the tenancy"""
-    search_details = StructuredSearchDetails(
-        query="query autonomousdatabase, database, pluggabledatabase, mysqldbsystem resources",
-        type="Structured",
-        matching_context_type="NONE"
-    )
-    results = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
-    return str(results)
+    results = _client("search").search_resources(search_details=STATIC_SEARCHES["all_dbs"], tenant_id=config['tenancy']).data
+    return to_json(results)
 
 @mcp.tool()
 def list_dbtools_connection_tool(compartment_name: str) -> str:
     """List all dbtools connections in a given compartment"""
     compartment = get_compartment_by_name(compartment_name)
     if not compartment:
-        return json.dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
+        return _dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
     
-    connections = dbtools_client.list_database_tools_connections(compartment_id=compartment.id).data
-    return str(connections)
+    connections = _client("dbtools").list_database_tools_connections(compartment_id=compartment.id).data
+    return to_json(connections)
 
 @mcp.tool()
 def list_all_connections() -> str:
     """List all database connections across all compartments"""
-    search_details = StructuredSearchDetails(
-        query="query databasetoolsconnection resources",
-        type="Structured",
-        matching_context_type="NONE"
-    )
-    search_results = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
+    search_results = _client("search").search_resources(search_details=STATIC_SEARCHES["all_conns"], tenant_id=config['tenancy']).data
     
     if not hasattr(search_results, 'items'):
-        return json.dumps([])
+        return _dumps([])
 
-    # Get full details for each connection
-    detailed_results = []
-    for item in search_results.items:
+    def get_connection_details(item):
         try:
-            connection = dbtools_client.get_database_tools_connection(item.identifier).data
-            detailed_results.append(connection)
+            return _client("dbtools").get_database_tools_connection(item.identifier).data
         except Exception as e:
             # If we can't get details for a connection, include error info
-            detailed_results.append({
+            return {
                 "error": f"Error getting details for connection {item.display_name}: {str(e)}",
                 "search_result": item.identifier
-            })
+            }
+
+    # Get full details for each connection, fetched concurrently; map keeps
+    # the search result order
+    with ThreadPoolExecutor(max_workers=CONNECTION_DETAIL_WORKERS) as executor:
+        detailed_results = list(executor.map(get_connection_details, search_results.items))
     
-    return str(detailed_results)
+    return to_json(detailed_results)
 
 @mcp.tool()
 def get_dbtools_connection_by_name_tool(display_name: str) -> str:
     """Get a dbtools connection for a given connection name"""
-    search_details = StructuredSearchDetails(
-        query=f"query databasetoolsconnection resources where displayName =~ '{display_name}'",
-        type="Structured",
-        matching_context_type="NONE"
-    )
-    search_results = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
+    search_details = connection_search_by_name(display_name)
+    search_results = _client("search").search_resources(search_details=search_details, tenant_id=config['tenancy']).data
     
     if not hasattr(search_results, 'items') or len(search_results.items) == 0:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -169,21 +260,44 @@ def get_dbtools_connection_by_name_tool(display_name: str) -> str:
     connection_id = search_results.items[0].identifier
     
     # Get the full connection details
-    connection = dbtools_client.get_database_tools_connection(connection_id).data
-    return str(connection)
+    connection = _client("dbtools").get_database_tools_connection(connection_id).data
+    return to_json(connection)
+
+# Connection lookups by display name, cached since nearly every tool resolves
+# the same connection name on each call: {display_name: (expires_at, info)}
+CONN_CACHE_TTL = float(os.getenv("CONN_CACHE_TTL", "300"))
+_connection_cache = {}
+_connection_cache_lock = threading.Lock()
+
+def _invalidate_connection_cache(dbtools_connection_display_name: str = None):
+    """Drop one cached connection lookup, or all of them when no name is given"""
+    with _connection_cache_lock:
+        if dbtools_connection_display_name is None:
+            _connection_cache.clear()
+        else:
+            _connection_cache.pop(dbtools_connection_display_name, None)
 
 def get_minimal_connection_by_name(dbtools_connection_display_name: str):
     """
     Internal function to get minimal connection information from a display name.
     Returns a dictionary with connection details like id, type, and connection string.
+    Successful lookups are cached for CONN_CACHE_TTL seconds.
     """
-    search_details = StructuredSearchDetails(
-        query=f"query databasetoolsconnection resources return allAdditionalFields where displayName =~ '{dbtools_connection_display_name}'",
-        type="Structured",
-        matching_context_type="NONE"
-    )
+    with _connection_cache_lock:
+        cached = _connection_cache.get(dbtools_connection_display_name)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    connection_info = _search_minimal_connection_by_name(dbtools_connection_display_name)
+    if connection_info is not None:
+        with _connection_cache_lock:
+            _connection_cache[dbtools_connection_display_name] = (time.monotonic() + CONN_CACHE_TTL, connection_info)
+    return connection_info
+
+def _search_minimal_connection_by_name(dbtools_connection_display_name: str):
     try:
-        resp = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
+        search_details = connection_search_by_name(dbtools_connection_display_name, all_additional_fields=True)
+        resp = _client("search").search_resources(search_details=search_details, tenant_id=config['tenancy']).data
         
         if not hasattr(resp, 'items') or len(resp.items) == 0:
             return None
@@ -212,10 +326,13 @@ def get_minimal_connection_by_name(dbtools_connection_display_name: str):
         print(f"Error in get_minimal_connection_by_name: {str(e)}")
         return None
 
-def execute_sql_tool_by_connection_id(connection_id: str, sql_script: str, binds: list = None) -> str:
-    """Internal function to execute a SQL script using a connection ID with optional bind variables"""
+def _execute_sql_raw(connection_id: str, sql_script: str, binds: list = None) -> dict:
+    """
+    Internal function to execute a SQL script using a connection ID with optional bind variables.
+    Returns the parsed ORDS response; failures come back as a dict with an "error" key.
+    """
     try:
-        execute_sql_endpoint = f"{ords_endpoint}/ords/{connection_id}/_/sql"
+        execute_sql_endpoint = f"{_ords_endpoint()}/ords/{connection_id}/_/sql"
         
         # Prepare the request payload
         payload = {
@@ -224,24 +341,55 @@ def execute_sql_tool_by_connection_id(connection_id: str, sql_script: str, binds
         if binds:
             payload["binds"] = binds
             
-        response = requests.post(
+        response = _http.post(
             execute_sql_endpoint,
             json=payload,
             auth=auth_signer,
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json"},
+            timeout=(5, SQL_READ_TIMEOUT)
         )
-        
-        # Try to format JSON response if possible
-        try:
-            return json.dumps(response.json(), indent=2)
-        except:
-            return response.text
     except Exception as e:
-        return json.dumps({
+        return {
             "error": f"Error executing SQL: {str(e)}",
             "sql_script": sql_script,
             "binds": binds
-        })
+        }
+
+    try:
+        return _loads(response.content)
+    except orjson.JSONDecodeError:
+        return {
+            "error": f"Unexpected non-JSON response (HTTP {response.status_code})",
+            "response": response.text
+        }
+
+def _stream_sql_rows(connection_id: str, sql_script: str, binds: list = None):
+    """
+    Internal function yielding the result rows of every statement in the script, in
+    order, as they are parsed off the wire, for callers that only need the rows and
+    not the whole ORDS response.
+    """
+    payload = {
+        "statementText": sql_script
+    }
+    if binds:
+        payload["binds"] = binds
+
+    with _http.post(
+        f"{_ords_endpoint()}/ords/{connection_id}/_/sql",
+        json=payload,
+        auth=auth_signer,
+        headers={"Content-Type": "application/json"},
+        timeout=(5, SQL_READ_TIMEOUT),
+        stream=True
+    ) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, "items.item.resultSet.items.item", use_float=True)
+
+def execute_sql_tool_by_connection_id(connection_id: str, sql_script: str, binds: list = None) -> str:
+    """Internal function to execute a SQL script using a connection ID, returning the response as JSON text"""
+    return _dumps(_execute_sql_raw(connection_id, sql_script, binds), indent=True)
 
 @mcp.tool()
 def execute_sql_tool(dbtools_connection_display_name: str, sql_script: str) -> str:
@@ -253,13 +401,110 @@ def execute_sql_tool(dbtools_connection_display_name: str, sql_script: str) -> s
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
     
     return execute_sql_tool_by_connection_id(connection_info['id'], sql_script)
 
+# Oracle column metadata for get_table_info, split into independent dictionary
+# lookups that run concurrently and are stitched together in Python; far
+# cheaper than one statement joining all four views on wide schemas.
+# all_tab_columns also covers system views
+ORACLE_TABLE_INFO_SQL = {
+    "columns": """
+    SELECT owner, column_name, data_type, data_length, nullable, data_default
+    FROM all_tab_columns
+    WHERE table_name = :table_name
+    ORDER BY column_id
+    """,
+    "primary_key": """
+    SELECT acc.column_name
+    FROM all_cons_columns acc
+    JOIN all_constraints ac ON acc.constraint_name = ac.constraint_name
+        AND acc.owner = ac.owner
+    WHERE ac.table_name = :table_name
+    AND ac.constraint_type = 'P'
+    """,
+    "comments": """
+    SELECT owner, column_name, comments
+    FROM all_col_comments
+    WHERE table_name = :table_name
+    """,
+    "num_rows": """
+    SELECT owner, num_rows
+    FROM all_tables
+    WHERE table_name = :table_name
+    """,
+}
+
+def _oracle_table_info(connection_id: str, table_name: str) -> dict:
+    """
+    Internal function running the ORACLE_TABLE_INFO_SQL lookups concurrently.
+    Returns an ORDS-shaped response with one row per column, or the first failed lookup.
+    """
+    binds = [{"name": "table_name", "data_type": "VARCHAR", "value": table_name}]
+    with ThreadPoolExecutor(max_workers=len(ORACLE_TABLE_INFO_SQL)) as executor:
+        futures = {
+            key: executor.submit(_execute_sql_raw, connection_id, sql, binds)
+            for key, sql in ORACLE_TABLE_INFO_SQL.items()
+        }
+    rows = {}
+    for key, future in futures.items():
+        result = future.result()
+        if not result.get('items') or not result['items'][0].get('resultSet'):
+            return result
+        rows[key] = result['items'][0]['resultSet'].get('items', [])
+
+    primary_key = {row['column_name'] for row in rows['primary_key']}
+    comments = {(row['owner'], row['column_name']): row['comments'] for row in rows['comments']}
+    num_rows = {row['owner']: row['num_rows'] for row in rows['num_rows']}
+    columns = [
+        {
+            **col,
+            "comments": comments.get((col['owner'], col['column_name'])),
+            "is_primary_key": 1 if col['column_name'] in primary_key else 0,
+            "num_rows": num_rows.get(col['owner'])
+        }
+        for col in rows['columns']
+    ]
+    return {"items": [{"resultSet": {"items": columns}}]}
+
+def _mysql_string(value: str) -> str:
+    """Escape value for use inside a single-quoted MySQL string literal"""
+    return value.replace("\\", "\\\\").replace("'", "''")
+
+# MySQL column metadata for get_table_info, filled in with % substitution
+TABLE_INFO_SQL = {
+    "MYSQL": """
+    SELECT 
+        c.column_name,
+        c.data_type,
+        c.character_maximum_length as data_length,
+        c.is_nullable as nullable,
+        c.column_default as data_default,
+        c.column_comment as comments,
+        CASE WHEN tc.constraint_type = 'PRIMARY KEY' THEN 1 ELSE 0 END as is_primary_key,
+        t.table_rows as num_rows
+    FROM information_schema.columns c
+    LEFT JOIN information_schema.key_column_usage kcu 
+        ON kcu.table_schema = c.table_schema
+        AND kcu.table_name = c.table_name 
+        AND kcu.column_name = c.column_name
+    LEFT JOIN information_schema.table_constraints tc
+        ON tc.table_schema = kcu.table_schema
+        AND tc.table_name = kcu.table_name
+        AND tc.constraint_name = kcu.constraint_name
+    LEFT JOIN information_schema.tables t
+        ON t.table_schema = c.table_schema
+        AND t.table_name = c.table_name
+    WHERE c.table_name = '%(table_name)s'
+        AND c.table_schema = database()
+    ORDER BY c.ordinal_position
+    """,
+}
+
 @mcp.tool()
 def get_table_info(dbtools_connection_display_name: str, table_name: str) -> str:
     """
@@ -270,7 +515,7 @@ def get_table_info(dbtools_connection_display_name: str, table_name: str) -> str
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -280,79 +525,22 @@ def get_table_info(dbtools_connection_display_name: str, table_name: str) -> str
         db_type = connection_info.get('type')
         
         if db_type == 'ORACLE_DATABASE':
-            # First try with all_tab_columns (includes system views)
-            column_sql = f"""
-            WITH pk_columns AS (
-                SELECT column_name
-                FROM all_cons_columns acc
-                JOIN all_constraints ac ON acc.constraint_name = ac.constraint_name
-                    AND acc.owner = ac.owner
-                WHERE ac.table_name = '{table_name.upper()}'
-                AND ac.constraint_type = 'P'
-            )
-            SELECT 
-                c.column_name,
-                c.data_type,
-                c.data_length,
-                c.nullable,
-                c.data_default,
-                cc.comments,
-                CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END as is_primary_key,
-                t.num_rows
-            FROM all_tab_columns c
-            LEFT JOIN all_col_comments cc 
-                ON cc.table_name = c.table_name 
-                AND cc.column_name = c.column_name
-                AND cc.owner = c.owner
-            LEFT JOIN pk_columns pk 
-                ON pk.column_name = c.column_name
-            LEFT JOIN all_tables t 
-                ON t.table_name = c.table_name
-                AND t.owner = c.owner
-            WHERE c.table_name = '{table_name.upper()}'
-            ORDER BY c.column_id
-            """
-        elif db_type == 'MYSQL':
-            column_sql = f"""
-            SELECT 
-                c.column_name,
-                c.data_type,
-                c.character_maximum_length as data_length,
-                c.is_nullable as nullable,
-                c.column_default as data_default,
-                c.column_comment as comments,
-                CASE WHEN tc.constraint_type = 'PRIMARY KEY' THEN 1 ELSE 0 END as is_primary_key,
-                t.table_rows as num_rows
-            FROM information_schema.columns c
-            LEFT JOIN information_schema.key_column_usage kcu 
-                ON kcu.table_schema = c.table_schema
-                AND kcu.table_name = c.table_name 
-                AND kcu.column_name = c.column_name
-            LEFT JOIN information_schema.table_constraints tc
-                ON tc.table_schema = kcu.table_schema
-                AND tc.table_name = kcu.table_name
-                AND tc.constraint_name = kcu.constraint_name
-            LEFT JOIN information_schema.tables t
-                ON t.table_schema = c.table_schema
-                AND t.table_name = c.table_name
-            WHERE c.table_name = '{table_name}'
-                AND c.table_schema = database()
-            ORDER BY c.ordinal_position
-            """
+            # Oracle stores unquoted identifiers in upper case
+            raw_data = _oracle_table_info(connection_info['id'], table_name.upper())
+        elif db_type in TABLE_INFO_SQL:
+            column_sql = TABLE_INFO_SQL[db_type] % {"table_name": _mysql_string(table_name)}
+            raw_data = _execute_sql_raw(connection_info['id'], column_sql)
         else:
-            return json.dumps({
+            return _dumps({
                 "error": f"Unsupported database type: {db_type}",
                 "supported_types": ["ORACLE_DATABASE", "MYSQL"]
             })
         
-        result = execute_sql_tool_by_connection_id(connection_info['id'], column_sql)
-        
         try:
-            raw_data = json.loads(result)
             if not raw_data.get('items') or not raw_data['items'][0].get('resultSet'):
-                return json.dumps({
+                return _dumps({
                     "error": "No data returned from query",
-                    "raw_result": result
+                    "raw_result": raw_data
                 })
             
             # Extract column data
@@ -379,7 +567,7 @@ def get_table_info(dbtools_connection_display_name: str, table_name: str) -> str
                     row_count = col['num_rows'] or 0
             
             if len(columns) == 0:
-                return json.dumps({
+                return _dumps({
                     "error": "No columns found for table",
                     "table": table_name
                 })
@@ -391,21 +579,16 @@ def get_table_info(dbtools_connection_display_name: str, table_name: str) -> str
                 "row_count": row_count
             }
             
-            return json.dumps(response, indent=2)
+            return _dumps(response, indent=True)
             
-        except json.JSONDecodeError:
-            return json.dumps({
-                "error": "Failed to parse SQL response",
-                "raw_result": result
-            })
         except Exception as e:
-            return json.dumps({
+            return _dumps({
                 "error": f"Error processing results: {str(e)}",
-                "raw_result": result
+                "raw_result": raw_data
             })
             
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": f"Error getting table info: {str(e)}",
             "connection": dbtools_connection_display_name,
             "table": table_name
@@ -421,7 +604,7 @@ def list_tables(dbtools_connection_display_name: str) -> str:
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -448,40 +631,136 @@ def list_tables(dbtools_connection_display_name: str) -> str:
             ORDER BY table_name
             """
         else:
-            return json.dumps({
+            return _dumps({
                 "error": f"Unsupported database type: {db_type}",
                 "supported_types": ["ORACLE_DATABASE", "MYSQL"]
             })
         
-        # Execute SQL and get the response
-        response = execute_sql_tool_by_connection_id(connection_info['id'], sql_script)
-        
-        # Parse the response to extract just the table items
-        try:
-            response_json = json.loads(response)
-            # Navigate to the items array in the complex response structure
-            if response_json['items'] and len(response_json['items']) > 0:
-                first_statement = response_json['items'][0]
-                if 'resultSet' in first_statement and 'items' in first_statement['resultSet']:
-                    # Extract just the table items
-                    tables = first_statement['resultSet']['items']
-                    return json.dumps(tables, indent=2)
-            
-            # If we couldn't find the expected structure, return an empty array
-            return json.dumps([])
-            
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error parsing SQL results: {str(e)}",
-                "raw_response": response[:200] + "..." if len(response) > 200 else response
-            })
+        # Only the table rows are returned; streaming them out of the response
+        # skips building the ORDS envelope, the rows themselves are all kept
+        tables = list(_stream_sql_rows(connection_info['id'], sql_script))
+        return _dumps(tables, indent=True)
             
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": f"Error listing tables: {str(e)}",
             "connection": dbtools_connection_display_name
         })
 
+# Report statements; their text never varies between calls, values are
+# always passed as binds
+REPORT_BOOTSTRAP_SQL = f"""
+    SELECT SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA') AS schema,
+           (SELECT COUNT(*)
+            FROM all_tables
+            WHERE table_name = 'REPORT_DEFINITIONS'
+            AND owner = SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')) AS table_count
+    FROM DUAL;
+
+    DECLARE
+        table_count NUMBER;
+    BEGIN
+        SELECT COUNT(*) INTO table_count
+        FROM all_tables
+        WHERE table_name = 'REPORT_DEFINITIONS'
+        AND owner = SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA');
+        IF table_count = 0 THEN
+            EXECUTE IMMEDIATE '
+                CREATE TABLE report_definitions (
+                    name VARCHAR(4000) PRIMARY KEY,
+                    description VARCHAR(4000),
+                    time_created TIMESTAMP(6),
+                    time_updated TIMESTAMP(6),
+                    sql_definition json,
+                    text_vector VECTOR({MODEL_EMBEDDING_DIMENSION})
+                )';
+        END IF;
+    END;
+    /
+"""
+
+REPORT_INSERT_SQL = f"""
+    INSERT INTO report_definitions (
+        name,
+        description,
+        time_created,
+        time_updated,
+        sql_definition,
+        text_vector
+    ) VALUES (
+        :name,
+        :description,
+        SYSTIMESTAMP,
+        SYSTIMESTAMP,
+        JSON_OBJECT(
+            'sql' VALUE :sql,
+            'binds' VALUE :binds FORMAT JSON
+            ABSENT ON NULL
+            RETURNING CLOB
+        ),
+        VECTOR_EMBEDDING({MODEL_NAME} USING :text_to_embed AS data)
+    )"""
+
+REPORT_DEFINITION_SQL = """
+    SELECT /*+ result_cache */ sql_definition
+    FROM report_definitions
+    WHERE name = :name"""
+
+REPORT_GET_SQL = """
+    SELECT 
+        name,
+        description,
+        TO_CHAR(time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_created,
+        TO_CHAR(time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_updated,
+        sql_definition
+    FROM report_definitions
+    WHERE name = :name"""
+
+REPORT_DELETE_SQL = """
+    DELETE FROM report_definitions
+    WHERE name = :name"""
+
+# Aggregated into one JSON array on the server, NULL when there are no reports
+REPORT_LIST_SQL = """
+SELECT JSON_ARRAYAGG(
+    JSON_OBJECT(
+        'name' VALUE name,
+        'description' VALUE description,
+        'time_created' VALUE TO_CHAR(time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+        'time_updated' VALUE TO_CHAR(time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+    )
+    ORDER BY name
+    RETURNING CLOB
+) as reports
+FROM report_definitions
+"""
+
+REPORT_SEARCH_SQL = f"""
+    WITH q AS (
+        SELECT VECTOR_EMBEDDING({MODEL_NAME} USING :search_text AS data) AS v
+        FROM DUAL
+    )
+    SELECT 
+        r.name as "name",
+        r.description as "description",
+        TO_CHAR(r.time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as "time_created",
+        TO_CHAR(r.time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as "time_updated",
+        JSON_VALUE(r.sql_definition, '$.sql' RETURNING CLOB) as "sql_query",
+        JSON_QUERY(r.sql_definition, '$.binds[*].name' RETURNING JSON WITH ARRAY WRAPPER) as "bind_parameters",
+        ROUND(1 - VECTOR_DISTANCE(r.text_vector, q.v), 4) as "similarity_score"
+    FROM report_definitions r, q
+    WHERE r.text_vector IS NOT NULL
+        AND VECTOR_DISTANCE(r.text_vector, q.v) < 0.7
+    ORDER BY "similarity_score" DESC
+    FETCH FIRST :limit ROWS ONLY
+"""
+
+REPORT_NAME_BIND = {"name": "name", "data_type": "VARCHAR", "value": None}
+
+def report_name_binds(report_name: str) -> list:
+    """Binds for the report statements keyed on :name"""
+    return [{**REPORT_NAME_BIND, "value": report_name}]
+
 @mcp.tool()
 def bootstrap_reports(dbtools_connection_display_name: str) -> str:
     """
@@ -522,99 +801,117 @@ def bootstrap_reports(dbtools_connection_display_name: str) -> str:
     try:
         connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
         if connection_info is None:
-            return json.dumps({
+            return _dumps({
                 "ok": False,
                 "error": f"No connection found with name '{dbtools_connection_display_name}'",
                 "step": "connection"
             })
-        
+    except Exception as e:
+        return _dumps({
+            "ok": False,
+            "error": str(e),
+            "step": "unknown"
+        })
+
+    return _dumps(_bootstrap_reports_with_conn(connection_info))
+
+# find_matching_reports results by (connection id, normalized search text,
+# limit), so repeated searches skip the embedding and the vector query; a
+# connection's entries are dropped whenever one of its reports is created or
+# deleted, or its report_definitions table turns out to be missing
+REPORT_SEARCH_CACHE_SIZE = int(os.getenv("REPORT_SEARCH_CACHE_SIZE", "512"))
+_report_search_cache = {}
+_report_search_cache_lock = threading.Lock()
+
+def _invalidate_report_search_cache(connection_id: str):
+    """Drop the cached report searches of one connection"""
+    with _report_search_cache_lock:
+        for key in [key for key in _report_search_cache if key[0] == connection_id]:
+            del _report_search_cache[key]
+
+# Connection ids whose report_definitions table is known to exist; creating
+# the table is idempotent, so it only needs checking once per connection
+_bootstrapped_connections = set()
+_bootstrapped_connections_lock = threading.Lock()
+
+def _forget_bootstrap_if_table_missing(connection_id: str, result: dict):
+    """Internal function dropping a connection from the bootstrapped set when a report
+    query failed with ORA-00942 (table or view does not exist), i.e. the table was dropped"""
+    statements = result.get("items") or []
+    if any("ORA-00942" in (statement.get("errorMessage") or "") for statement in statements):
+        with _bootstrapped_connections_lock:
+            _bootstrapped_connections.discard(connection_id)
+        _invalidate_report_search_cache(connection_id)
+
+def _bootstrap_reports_with_conn(connection_info: dict) -> dict:
+    """Internal function behind bootstrap_reports for an already resolved connection, returning the status dict"""
+    with _bootstrapped_connections_lock:
+        if connection_info['id'] in _bootstrapped_connections:
+            return {
+                "ok": True,
+                "message": "Table 'report_definitions' exists in current schema"
+            }
+    try:
         # Verify database type early
         db_type = connection_info.get('type', 'ORACLE_DATABASE')
         if db_type != 'ORACLE_DATABASE':
-            return json.dumps({
+            return {
                 "ok": False,
                 "error": f"Unsupported database type: {db_type}. This tool only supports Oracle databases.",
                 "step": "validate_type"
-            })
+            }
 
-        # Check if table exists in current schema
-        check_sql = """
-            SELECT owner, table_name 
-            FROM all_tables 
-            WHERE table_name = 'REPORT_DEFINITIONS'
-            AND owner = SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')
-        """
-        check_result = execute_sql_tool_by_connection_id(connection_info['id'], check_sql)
-        
-        try:
-            check_data = json.loads(check_result)
-            result_set = check_data.get("items", [{}])[0].get("resultSet", {})
-            if result_set.get("items"):
-                schema = result_set["items"][0].get("owner", "current schema")
-                return json.dumps({
-                    "ok": True,
-                    "message": f"Table 'report_definitions' exists in schema {schema}"
-                })
-        except json.JSONDecodeError:
-            return json.dumps({
+        # One script, one round trip: look up the current schema and whether the
+        # table already exists in it, then create the table only if it doesn't
+        bootstrap_data = _execute_sql_raw(connection_info['id'], REPORT_BOOTSTRAP_SQL)
+
+        if "error" in bootstrap_data:
+            return {
                 "ok": False,
-                "error": "Invalid response format while checking table existence",
+                "error": bootstrap_data["error"],
                 "step": "check_table"
-            })
+            }
 
-        # Create table if it doesn't exist
-        ddl = """
-          CREATE TABLE report_definitions (
-              name VARCHAR(4000) PRIMARY KEY,
-              description VARCHAR(4000),
-              time_created TIMESTAMP(6),
-              time_updated TIMESTAMP(6),
-              sql_definition json,
-              text_vector VECTOR({MODEL_EMBEDDING_DIMENSION})
-          )
-        """
-
-        create_resp = execute_sql_tool(dbtools_connection_display_name, ddl)
-        try:
-            create_data = json.loads(create_resp)
-            if "error" in create_data:
-                return json.dumps({
-                    "ok": False,
-                    "error": create_data["error"],
-                    "step": "create_table"
-                })
-            
-            current_schema = None
-            try:
-                # Get current schema for the success message
-                schema_sql = "SELECT SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA') as schema FROM DUAL"
-                schema_result = execute_sql_tool_by_connection_id(connection_info['id'], schema_sql)
-                schema_data = json.loads(schema_result)
-                result_set = schema_data.get("items", [{}])[0].get("resultSet", {})
-                if result_set.get("items"):
-                    current_schema = result_set["items"][0].get("schema")
-            except Exception:
-                pass
-
-            schema_msg = f" in schema {current_schema}" if current_schema else ""
-            return json.dumps({
+        statements = bootstrap_data.get("items", [])
+        check_items = statements[0].get("resultSet", {}).get("items") if statements else None
+        if not check_items:
+            return {
+                "ok": False,
+                "error": "No data returned from query",
+                "step": "check_table"
+            }
+        current_schema = check_items[0].get("schema")
+
+        if check_items[0].get("table_count"):
+            with _bootstrapped_connections_lock:
+                _bootstrapped_connections.add(connection_info['id'])
+            return {
                 "ok": True,
-                "message": f"Table 'report_definitions' created{schema_msg}"
-            })
+                "message": f"Table 'report_definitions' exists in schema {current_schema or 'current schema'}"
+            }
 
-        except json.JSONDecodeError:
-            return json.dumps({
+        create_status = statements[1] if len(statements) > 1 else {"errorMessage": "Table creation did not run"}
+        if create_status.get("errorMessage"):
+            return {
                 "ok": False,
-                "error": "Invalid response format while creating table",
+                "error": create_status["errorMessage"],
                 "step": "create_table"
-            })
+            }
+
+        with _bootstrapped_connections_lock:
+            _bootstrapped_connections.add(connection_info['id'])
+        schema_msg = f" in schema {current_schema}" if current_schema else ""
+        return {
+            "ok": True,
+            "message": f"Table 'report_definitions' created{schema_msg}"
+        }
 
     except Exception as e:
-        return json.dumps({
+        return {
             "ok": False,
             "error": str(e),
             "step": "unknown"
-        })
+        }
 
 @mcp.tool()
 def create_report(dbtools_connection_display_name: str, name: str, sql_query: str, description: str = None, bind_parameters: list = None) -> str:
@@ -630,16 +927,12 @@ def create_report(dbtools_connection_display_name: str, name: str, sql_query: st
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
 
     # Check if table exists first
-    bootstrap_result = bootstrap_reports(dbtools_connection_display_name)
-    try:
-        result = json.loads(bootstrap_result)
-        if "error" in result:
-            return bootstrap_result
-    except:
-        return bootstrap_result
+    bootstrap_result = _bootstrap_reports_with_conn(connection_info)
+    if "error" in bootstrap_result:
+        return _dumps(bootstrap_result)
 
     # Prepare the SQL definition JSON
     sql_definition = {
@@ -655,39 +948,28 @@ def create_report(dbtools_connection_display_name: str, name: str, sql_query: st
     if description:
         text_to_embed = f"{name}. {description}"
     
-    # Insert the new report using direct SQL to avoid bind variable issues
-    insert_sql = f"""
-        INSERT INTO report_definitions (
-            name,
-            description,
-            time_created,
-            time_updated,
-            sql_definition,
-            text_vector
-        ) VALUES (
-            '{name}',
-            '{description or ""}',
-            SYSTIMESTAMP,
-            SYSTIMESTAMP,
-            '{json.dumps(sql_definition).replace("'", "''")}',
-            VECTOR_EMBEDDING({MODEL_NAME} USING '{text_to_embed.replace("'", "''") if text_to_embed else ""}' AS data)
-        )"""
-
-    result = execute_sql_tool_by_connection_id(connection_info['id'], insert_sql)
-    try:
-        # Check for errors
-        json_result = json.loads(result)
-        if "error" in json_result:
-            return json.dumps({
-                "error": "Failed to create report",
-                "details": json_result["error"]
-            })
-    except:
-        pass
+    # Insert the new report with binds so the statement text is the same
+    # on every call and user input never becomes part of the SQL; the
+    # sql_definition document is assembled by the database from the binds
+    insert_binds = [
+        {"name": "name", "data_type": "VARCHAR", "value": name},
+        {"name": "description", "data_type": "VARCHAR", "value": description or ""},
+        {"name": "sql", "data_type": "CLOB", "value": sql_query},
+        {"name": "binds", "data_type": "VARCHAR", "value": _dumps(sql_definition["binds"]) if bind_parameters else None},
+        {"name": "text_to_embed", "data_type": "VARCHAR", "value": text_to_embed}
+    ]
+
+    json_result = _execute_sql_raw(connection_info['id'], REPORT_INSERT_SQL, insert_binds)
+    _invalidate_report_search_cache(connection_info['id'])
+    if "error" in json_result:
+        return _dumps({
+            "error": "Failed to create report",
+            "details": json_result["error"]
+        })
 
-    return json.dumps({
+    return _dumps({
         "ok": True,
-        "execute_output": result,
+        "execute_output": json_result,
         "message": f"Report '{name}' created successfully",
         "report": {
             "name": name,
@@ -709,35 +991,30 @@ def execute_report(dbtools_connection_display_name: str, report_name: str, bind_
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
 
     # Get the report definition
-    get_report_sql = """
-        SELECT sql_definition
-        FROM report_definitions
-        WHERE name = :name"""
+    # Definitions change far less often than reports run, so let the
+    # database serve repeat lookups from its result cache
     
-    get_report_binds = [{"name": "name", "data_type": "VARCHAR", "value": report_name}]
-    
-    result = execute_sql_tool_by_connection_id(connection_info['id'], get_report_sql, get_report_binds)
+    json_result = _execute_sql_raw(connection_info['id'], REPORT_DEFINITION_SQL, report_name_binds(report_name))
     try:
-        json_result = json.loads(result)
         if "error" in json_result:
-            return json.dumps({
+            return _dumps({
                 "error": "Failed to get report definition",
                 "details": json_result["error"]
             })
         
         # Extract the first row's sql_definition
         if "items" not in json_result or not json_result["items"]:
-            return json.dumps({"error": f"Report '{report_name}' not found"})
+            return _dumps({"error": f"Report '{report_name}' not found"})
             
         sql_definition = json_result["items"][0]["resultSet"]["items"][0]["sql_definition"]
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": "Failed to parse report definition",
             "details": str(e),
-            "response": result
+            "response": json_result
         })
 
     # Prepare the binds if needed
@@ -747,7 +1024,7 @@ def execute_report(dbtools_connection_display_name: str, report_name: str, bind_
         for bind_def in sql_definition["binds"]:
             bind_name = bind_def["name"]
             if bind_name not in bind_values:
-                return json.dumps({
+                return _dumps({
                     "error": f"Missing required bind parameter: {bind_name}",
                     "required_binds": [b["name"] for b in sql_definition["binds"]]
                 })
@@ -786,50 +1063,38 @@ def get_report(dbtools_connection_display_name: str, report_name: str) -> str:
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
 
     # Get the report definition
-    get_report_sql = """
-        SELECT 
-            name,
-            description,
-            TO_CHAR(time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_created,
-            TO_CHAR(time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_updated,
-            sql_definition
-        FROM report_definitions
-        WHERE name = :name"""
-    
-    get_report_binds = [{"name": "name", "data_type": "VARCHAR", "value": report_name}]
     
-    result = execute_sql_tool_by_connection_id(connection_info['id'], get_report_sql, get_report_binds)
+    json_result = _execute_sql_raw(connection_info['id'], REPORT_GET_SQL, report_name_binds(report_name))
     try:
-        json_result = json.loads(result)
         if "error" in json_result:
-            return json.dumps({
+            return _dumps({
                 "error": "Failed to get report definition",
                 "details": json_result["error"]
             })
         
         # Extract the first row
         if "items" not in json_result or not json_result["items"]:
-            return json.dumps({"error": f"Report '{report_name}' not found"})
+            return _dumps({"error": f"Report '{report_name}' not found"})
         report = json_result["items"][0]["resultSet"]["items"][0]
         sql_definition = report["sql_definition"]
         
-        return json.dumps({
+        return _dumps({
             "name": report["name"],
             "description": report["description"],
             "time_created": report["time_created"],
             "time_updated": report["time_updated"],
             "sql_query": sql_definition["sql"],
             "bind_parameters": [bind["name"] for bind in sql_definition.get("binds", [])] if "binds" in sql_definition else None
-        }, indent=2)
+        }, indent=True)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": "Failed to parse report definition",
             "details": str(e),
-            "response": result
+            "response": json_result
         })
 
 @mcp.tool()
@@ -844,53 +1109,37 @@ def delete_report(dbtools_connection_display_name: str, report_name: str) -> str
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
 
-    # First check if the report exists
-    get_report_sql = """
-        SELECT name FROM report_definitions WHERE name = :name"""
-    
-    get_report_binds = [{"name": "name", "data_type": "VARCHAR", "value": report_name}]
+    # Delete optimistically and tell "not found" apart by the rows affected,
+    # rather than checking for the report in a separate round trip first
     
-    result = execute_sql_tool_by_connection_id(connection_info['id'], get_report_sql, get_report_binds)
+    json_result = _execute_sql_raw(connection_info['id'], REPORT_DELETE_SQL, report_name_binds(report_name))
+    _invalidate_report_search_cache(connection_info['id'])
     try:
-        json_result = json.loads(result)
         if "error" in json_result:
-            return json.dumps({
-                "error": "Failed to check report existence",
+            return _dumps({
+                "error": "Failed to delete report",
                 "details": json_result["error"]
             })
         
-        if "items" not in json_result or not json_result["items"]:
-            return json.dumps({"error": f"Report '{report_name}' not found"})
-    except Exception as e:
-        return json.dumps({
-            "error": "Failed to check report existence",
-            "details": str(e)
-        })
-
-    # Delete the report
-    delete_sql = """
-        DELETE FROM report_definitions
-        WHERE name = :name"""
-    
-    delete_binds = [{"name": "name", "data_type": "VARCHAR", "value": report_name}]
-    
-    result = execute_sql_tool_by_connection_id(connection_info['id'], delete_sql, delete_binds)
-    try:
-        json_result = json.loads(result)
-        if "error" in json_result:
-            return json.dumps({
+        statement = json_result["items"][0]
+        if statement.get("errorMessage"):
+            return _dumps({
                 "error": "Failed to delete report",
-                "details": json_result["error"]
+                "details": statement["errorMessage"]
             })
         
-        return json.dumps({
+        # ORDS reports the DML row count as the statement result
+        if not statement.get("result"):
+            return _dumps({"error": f"Report '{report_name}' not found"})
+        
+        return _dumps({
             "ok": True,
             "message": f"Report '{report_name}' deleted successfully"
         })
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": "Failed to delete report",
             "details": str(e)
         })
@@ -904,29 +1153,35 @@ def list_reports(dbtools_connection_display_name: str) -> str:
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})    
 
     # Check if table exists first
-    bootstrap_result = bootstrap_reports(dbtools_connection_display_name)
-    try:
-        result = json.loads(bootstrap_result)
-        if "error" in result:
-            return bootstrap_result
-    except:
-        return bootstrap_result
+    bootstrap_result = _bootstrap_reports_with_conn(connection_info)
+    if "error" in bootstrap_result:
+        return _dumps(bootstrap_result)
 
     # Query the reports
-    sql = """
-    SELECT 
-        name,
-        description,
-        TO_CHAR(time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_created,
-        TO_CHAR(time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as time_updated
-    FROM report_definitions
-    ORDER BY name
-    """
     
-    return execute_sql_tool_by_connection_id(connection_info['id'], sql)
+    result = _execute_sql_raw(connection_info['id'], REPORT_LIST_SQL)
+    _forget_bootstrap_if_table_missing(connection_info['id'], result)
+    try:
+        return result["items"][0]["resultSet"]["items"][0]["reports"] or "[]"
+    except (KeyError, IndexError):
+        return _dumps(result, indent=True)
+
+def _matching_reports_response(reports: list, search_text: str) -> str:
+    """Internal function rendering find_matching_reports output for the caller's own search text"""
+    if not reports:
+        return _dumps({
+            "ok": True,
+            "reports": [],
+            "message": f"No similar reports for '{search_text}'"
+        })
+    return _dumps({
+        "ok": True,
+        "reports": reports,
+        "message": f"Found {len(reports)} similar reports for '{search_text}'"
+    })
 
 @mcp.tool()
 def find_matching_reports(dbtools_connection_display_name: str, search_text: str, limit: int = 5) -> str:
@@ -943,85 +1198,147 @@ def find_matching_reports(dbtools_connection_display_name: str, search_text: str
     """
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     if connection_info is None:
-        return json.dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})
+        return _dumps({"error": f"No connection found with name '{dbtools_connection_display_name}'"})
 
     # Check if table exists
-    bootstrap_result = bootstrap_reports(dbtools_connection_display_name)
-    try:
-        result = json.loads(bootstrap_result)
-        if "error" in result:
-            return bootstrap_result
-    except:
-        return bootstrap_result
-
-    # Query similar reports using vector similarity
-    query = f"""
-        SELECT 
-            r.name as "name",
-            r.description as "description",
-            TO_CHAR(r.time_created, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as "time_created",
-            TO_CHAR(r.time_updated, 'YYYY-MM-DD"T"HH24:MI:SS"Z"') as "time_updated",
-            r.sql_definition as "sql_definition",
-            ROUND(1 - VECTOR_DISTANCE(r.text_vector, 
-                VECTOR_EMBEDDING({MODEL_NAME} USING :search_text AS data)), 4) as "similarity_score"
-        FROM report_definitions r
-        WHERE r.text_vector IS NOT NULL
-            AND 1 - VECTOR_DISTANCE(r.text_vector, 
-                VECTOR_EMBEDDING({MODEL_NAME} USING :search_text AS data)) > 0.3
-        ORDER BY "similarity_score" DESC
-        FETCH FIRST :limit ROWS ONLY
-    """
+    bootstrap_result = _bootstrap_reports_with_conn(connection_info)
+    if "error" in bootstrap_result:
+        return _dumps(bootstrap_result)
+
+    cache_key = (connection_info['id'], " ".join(search_text.split()).casefold(), limit)
+    with _report_search_cache_lock:
+        reports = _report_search_cache.get(cache_key)
+    if reports is not None:
+        return _matching_reports_response(reports, search_text)
+
+    # Query similar reports using vector similarity; the search text is embedded
+    # once, and filtering on the raw distance (similarity > 0.3) lets a vector
+    # index on text_vector be used
 
     binds = [
         {"name": "search_text", "data_type": "VARCHAR", "value": search_text},
         {"name": "limit", "data_type": "NUMBER", "value": limit}
     ]
 
-    result = execute_sql_tool_by_connection_id(connection_info['id'], query, binds)
+    json_result = _execute_sql_raw(connection_info['id'], REPORT_SEARCH_SQL, binds)
+    _forget_bootstrap_if_table_missing(connection_info['id'], json_result)
     try:
-        # Parse the results
-        json_result = json.loads(result)
         if "error" in json_result:
-            return json.dumps({
+            return _dumps({
                 "error": "Failed to find matching reports",
                 "details": json_result["error"]
             })
         
-        # Extract the reports from the result
-        reports = []
-        if "items" in json_result and json_result["items"] and "resultSet" in json_result["items"][0]:
-            result_set = json_result["items"][0]["resultSet"]
-            if "items" in result_set:
-                for item in result_set["items"]:
-                    # Handle sql_definition which may already be parsed as JSON
-                    sql_def = item["sql_definition"]
-                    if isinstance(sql_def, str):
-                        try:
-                            sql_def = json.loads(sql_def)
-                        except:
-                            pass
-                    
-                    reports.append({
-                        "name": item["name"],
-                        "description": item["description"],
-                        "time_created": item["time_created"],
-                        "time_updated": item["time_updated"],
-                        "sql_definition": sql_def,
-                        "similarity_score": float(item["similarity_score"])
-                    })
-
-        return json.dumps({
-            "ok": True,
-            "reports": reports,
-            "message": f"Found {len(reports)} similar reports for '{search_text}'"
-        })
+        # Extract the reports from the result; the query already projects the
+        # SQL text and bind names out of sql_definition, so rows map directly
+        statements = json_result.get("items")
+        if statements and statements[0].get("errorMessage"):
+            return _dumps({
+                "error": "Failed to find matching reports",
+                "details": statements[0]["errorMessage"]
+            })
+        items = statements[0].get("resultSet", {}).get("items") if statements else None
+        reports = [{
+            "name": item["name"],
+            "description": item["description"],
+            "time_created": item["time_created"],
+            "time_updated": item["time_updated"],
+            "sql_query": item["sql_query"],
+            "bind_parameters": item["bind_parameters"],
+            "similarity_score": float(item["similarity_score"])
+        } for item in items or []]
+
+        with _report_search_cache_lock:
+            if len(_report_search_cache) >= REPORT_SEARCH_CACHE_SIZE:
+                # evict the oldest entry
+                del _report_search_cache[next(iter(_report_search_cache))]
+            _report_search_cache[cache_key] = reports
+        return _matching_reports_response(reports, search_text)
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": "Failed to process results",
             "details": str(e)
         })
 
 
+RAGIFY_BATCH_SIZE = 1000
+
+# ragify_column has to interpolate table and column names into DDL and DML,
+# so only plain (optionally schema-qualified) identifiers are accepted
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_$#]{0,127}")
+
+@lru_cache(maxsize=256)
+def safe_identifier(name: str, qualified: bool = False) -> str:
+    """Return name unchanged if it is a plain SQL identifier, raise ValueError otherwise"""
+    parts = name.split(".", 1) if qualified else [name]
+    if not all(IDENTIFIER_PATTERN.fullmatch(part) for part in parts):
+        raise ValueError(f"Invalid identifier '{name}'")
+    return name
+
+@lru_cache(maxsize=64)
+def _build_ragify_sql(table: str, cols: tuple, vec_col: str) -> str:
+    """Build the ragify_column script for already validated identifiers"""
+    # Construct the concatenation expression for the source columns
+    # Using COALESCE to handle potential NULLs gracefully, replacing them with empty strings
+    # Concatenating with a space separator
+    concatenated_columns = " || ' ' || ".join(f"COALESCE(TO_CHAR({col}), '')" for col in cols)
+    
+    # Construct the WHERE clause to only update rows where at least one source column is not null
+    where_clause = " OR ".join(f"{col} IS NOT NULL" for col in cols)
+
+    comment_text = f"Vector embedding generated from columns: {', '.join(cols)}"
+    # Ensure comment text isn't too long for Oracle's limit (4000 bytes, but play safe)
+    comment_text = comment_text[:3900] 
+
+    # The whole job goes out as one script, so one REST round trip:
+    # 1. Add the vector column and comment it with its source columns. An existing
+    #    column (ORA-01430) is not an error, so the tool can be rerun to embed rows
+    #    added since the last run.
+    # 2. Populate the vector column in ROWID ranges of RAGIFY_BATCH_SIZE rows, committing
+    #    each one, so undo stays bounded. This is a second block because it can only be
+    #    compiled once the column exists; it prints the number of rows it embedded.
+    # 3. Report how many rows now have an embedding.
+    ragify_sql = f"""
+        SET SERVEROUTPUT ON
+        BEGIN
+            BEGIN
+                EXECUTE IMMEDIATE 'ALTER TABLE {table} ADD ({vec_col} VECTOR({MODEL_EMBEDDING_DIMENSION}))';
+            EXCEPTION
+                WHEN OTHERS THEN
+                    IF SQLCODE != -1430 THEN
+                        RAISE;
+                    END IF;
+            END;
+            EXECUTE IMMEDIATE 'COMMENT ON COLUMN {table}.{vec_col} IS ''{comment_text}''';
+        END;
+        /
+        DECLARE
+            rows_updated NUMBER := 0;
+        BEGIN
+            FOR chunk IN (
+                SELECT MIN(rid) AS lo, MAX(rid) AS hi
+                FROM (
+                    SELECT ROWID AS rid,
+                           FLOOR((ROW_NUMBER() OVER (ORDER BY ROWID) - 1) / {RAGIFY_BATCH_SIZE}) AS bucket
+                    FROM {table}
+                    WHERE {vec_col} IS NULL AND ({where_clause})
+                )
+                GROUP BY bucket
+            ) LOOP
+                UPDATE {table}
+                SET {vec_col} = VECTOR_EMBEDDING({MODEL_NAME} USING ({concatenated_columns}) AS data)
+                WHERE ROWID BETWEEN chunk.lo AND chunk.hi
+                AND {vec_col} IS NULL AND ({where_clause});
+                rows_updated := rows_updated + SQL%ROWCOUNT;
+                COMMIT;
+            END LOOP;
+            DBMS_OUTPUT.PUT_LINE('rows_updated=' || rows_updated);
+        END;
+        /
+        SELECT COUNT({vec_col}) AS embedded_rows FROM {table};
+    """
+    return ragify_sql
+
 @mcp.tool()
 def ragify_column(dbtools_connection_display_name: str, table_name: str, column_names: list[str], vector_column_name: str) -> str:
     """
@@ -1046,78 +1363,40 @@ def ragify_column(dbtools_connection_display_name: str, table_name: str, column_
     # NOTE: Embedding dimension (MODEL_EMBEDDING_DIMENSION) and model name ({MODEL_NAME}) are hardcoded.
 
     if not column_names:
-        return json.dumps({"status": "error", "message": "column_names list cannot be empty."}) 
+        return _dumps({"status": "error", "message": "column_names list cannot be empty."}) 
 
-    # 1. Add the vector column
-    alter_sql = f"ALTER TABLE {table_name} ADD ({vector_column_name} VECTOR({MODEL_EMBEDDING_DIMENSION}))"
-    print(f"Executing ALTER TABLE statement: {alter_sql}")
-    
-    alter_result_str = execute_sql_tool(dbtools_connection_display_name, alter_sql)
     try:
-        # Try to parse the response and log specific errors if possible
-        alter_result = json.loads(alter_result_str)
-        if alter_result.get("items") and len(alter_result["items"]) > 0 and alter_result["items"][0].get("errorCode", 0) != 0:
-             error_message = alter_result['items'][0].get('errorMessage')
-             print(f"Warning during ALTER TABLE: {error_message}. Proceeding anyway.")
-        # If no error code, assume success or non-critical issue, proceed silently.
-    except json.JSONDecodeError:
-        # Handle non-JSON response
-        print(f"Warning: Non-JSON response during ALTER TABLE: {alter_result_str}. Proceeding anyway.")
-    except Exception as e:
-        print(f"Warning: Exception occurred during ALTER TABLE or response handling: {e}. Proceeding anyway.")
-        
-    # Regardless of ALTER outcome/warnings, proceed to COMMENT and UPDATE
-    pass # Proceed to COMMENT and UPDATE steps
+        table_name = safe_identifier(table_name, qualified=True)
+        column_names = [safe_identifier(col) for col in column_names]
+        vector_column_name = safe_identifier(vector_column_name)
+    except ValueError as e:
+        return _dumps({"status": "error", "message": str(e)})
 
-    # 2. Add a comment to the vector column indicating source columns
-    comment_text = f"Vector embedding generated from columns: {', '.join(column_names)}"
-    # Ensure comment text isn't too long for Oracle's limit (4000 bytes, but play safe)
-    comment_text = comment_text[:3900] 
-    comment_sql = f"COMMENT ON COLUMN {table_name}.{vector_column_name} IS '{comment_text}'"
-    print(f"Executing COMMENT ON COLUMN statement: {comment_sql}")
-    
-    comment_result_str = execute_sql_tool(dbtools_connection_display_name, comment_sql)
-    # Basic check for comment result - less critical, so just print errors
-    try:
-        comment_result = json.loads(comment_result_str)
-        if comment_result.get("items") and len(comment_result["items"]) > 0 and comment_result["items"][0].get("errorCode", 0) != 0:
-             print(f"Warning: Error during COMMENT ON COLUMN: {comment_result['items'][0].get('errorMessage')}")
-    except Exception as e:
-        print(f"Warning: Could not parse COMMENT ON COLUMN response or other error: {e}")
-        print(f"COMMENT response raw: {comment_result_str}")
+    connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
+    if connection_info is None:
+        return _dumps({"status": "error", "message": f"No connection found with name '{dbtools_connection_display_name}'"})
 
-    # Construct the concatenation expression for the source columns
-    # Using COALESCE to handle potential NULLs gracefully, replacing them with empty strings
-    # Concatenating with a space separator
-    concatenated_columns = " || ' ' || ".join([f"COALESCE(TO_CHAR({col}), '')" for col in column_names])
-    
-    # Construct the WHERE clause to only update rows where at least one source column is not null
-    where_clause_conditions = [f"{col} IS NOT NULL" for col in column_names]
-    where_clause = " OR ".join(where_clause_conditions)
+    ragify_sql = _build_ragify_sql(table_name, tuple(column_names), vector_column_name)
+    print(f"Executing ragify script: {ragify_sql}")
 
-    # 3. Populate the vector column
-    update_sql = f"UPDATE {table_name}\nSET {vector_column_name} = VECTOR_EMBEDDING({MODEL_NAME} USING ({concatenated_columns}) AS data)\nWHERE {where_clause}"
-    print(f"Executing UPDATE statement: {update_sql}")
+    ragify_result = _execute_sql_raw(connection_info['id'], ragify_sql)
+    if "items" not in ragify_result:
+        print(f"Unexpected response during ragify script: {ragify_result}")
+        return _dumps({"status": "error", "details": ragify_result})
 
-    update_result_str = execute_sql_tool(dbtools_connection_display_name, update_sql)
-    try:
-        update_result = json.loads(update_result_str)
-         # Check for errors in the response items
-        if update_result.get("items") and len(update_result["items"]) > 0 and update_result["items"][0].get("errorCode", 0) != 0:
-             print(f"Error during UPDATE: {update_result['items'][0].get('errorMessage')}")
-             # Even if update fails, the column was likely added. Return the update error.
-             return json.dumps({"status": "error", "step": "UPDATE", "details": update_result})
-        
-        # If both steps seemed okay (or ALTER had non-fatal error like column exists), return success message + final result
-        return json.dumps({"status": "success", "details": update_result})
+    rows_updated = None
+    for item in ragify_result["items"]:
+        if item.get("errorCode", 0) != 0:
+            print(f"Error during ragify script: {item.get('errorMessage')}")
+            return _dumps({"status": "error", "statement": item.get("statementText"), "details": ragify_result})
+        for line in item.get("response") or []:
+            if line.startswith("rows_updated="):
+                rows_updated = int(line.split("=", 1)[1])
 
-    except json.JSONDecodeError:
-         print(f"Non-JSON response during UPDATE: {update_result_str}")
-         # If ALTER reported 'column exists', this non-JSON might be less critical, but still report as warning.
-         return json.dumps({"status": "warning", "step": "UPDATE", "message": "ALTER TABLE step completed (possibly with warnings like 'column exists'), but UPDATE step returned non-JSON response.", "details": update_result_str})
-    except Exception as e:
-        print(f"Unexpected error parsing UPDATE response: {e}")
-        return json.dumps({"status": "error", "step": "UPDATE", "details": f"Unexpected error: {str(e)}"})
+    return _dumps({"status": "success", "rows_updated": rows_updated, "details": ragify_result})
+
+# NL2ML leaves a JSON document in @nl2ml_response; only its text field is fetched
+HEATWAVE_ASK_HELP_SQL = "CALL sys.NL2ML('%(question)s', @nl2ml_response); SELECT JSON_UNQUOTE(JSON_EXTRACT(@nl2ml_response, '$.text')) AS text"
 
 @mcp.tool()
 def heatwave_ask_help(dbtools_connection_display_name: str, question: str) -> str:
@@ -1131,7 +1410,7 @@ def heatwave_ask_help(dbtools_connection_display_name: str, question: str) -> st
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -1139,29 +1418,27 @@ def heatwave_ask_help(dbtools_connection_display_name: str, question: str) -> st
     try:
         # Verify this is a MySQL connection
         if connection_info.get('type') != 'MYSQL':
-            return json.dumps({
+            return _dumps({
                 "error": "This connection is not a MySQL database. Heatwave ask help tool is only available for MySQL databases.",
                 "suggestion": "Please provide a MySQL database connection."
             })
             
         # Execute the heatwave chat query
-        nl2ml_call = f"call sys.NL2ML('{question}', @nl2ml_response); select @nl2ml_response"
-        response = execute_sql_tool_by_connection_id(connection_info['id'], nl2ml_call)
-        
-        # return response
+        nl2ml_call = HEATWAVE_ASK_HELP_SQL % {"question": _mysql_string(question)}
+        response_data = _execute_sql_raw(connection_info['id'], nl2ml_call)
     
         # Parse the response
-        if isinstance(response, str):
-            response_data = json.loads(response)
-            if 'items' in response_data and len(response_data['items']) > 0:
-                json_column_name = response_data['items'][1]['resultSet']['metadata'][0]['jsonColumnName']
-            return json.loads(response_data['items'][1]['resultSet']['items'][0][json_column_name])["text"]
+        if len(response_data.get('items', [])) > 1:
+            json_column_name = response_data['items'][1]['resultSet']['metadata'][0]['jsonColumnName']
+            return response_data['items'][1]['resultSet']['items'][0][json_column_name]
             
-        return json.dumps({"error": "Unexpected response format from Heatwave ask help"})
+        return _dumps({"error": "Unexpected response format from Heatwave ask help"})
     except Exception as e:
-        return json.dumps({"error": f"Error with Heatwave ask help: {str(e)}"})
+        return _dumps({"error": f"Error with Heatwave ask help: {str(e)}"})
+
 
 
+HEATWAVE_VECTOR_STORE_LOAD_SQL = "SET @vsl_options=JSON_OBJECT('schema_name', '%(schema_name)s', 'table_name', '%(table_name)s'); CALL sys.VECTOR_STORE_LOAD('%(uri)s', @vsl_options);"
 
 @mcp.tool()
 def heatwave_load_vector_store(dbtools_connection_display_name: str, namespace: str, bucket_name: str, document_prefix: str, schema_name: str, table_name: str) -> str:
@@ -1186,7 +1463,7 @@ def heatwave_load_vector_store(dbtools_connection_display_name: str, namespace:
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -1194,18 +1471,22 @@ def heatwave_load_vector_store(dbtools_connection_display_name: str, namespace:
     try:
         # Verify this is a MySQL connection
         if connection_info.get('type') != 'MYSQL':
-            return json.dumps({
+            return _dumps({
                 "error": "This connection is not a MySQL database. Heatwave load vector store is only available for MySQL databases.",
                 "suggestion": "Please provide a MySQL database connection."
             })
             
-        vsload = f"SET @vsl_options=JSON_OBJECT('schema_name', '{schema_name}', 'table_name', '{table_name}'); CALL sys.VECTOR_STORE_LOAD('oci://{bucket_name}@{namespace}/{document_prefix}', @vsl_options);"
+        vsload = HEATWAVE_VECTOR_STORE_LOAD_SQL % {
+            "schema_name": _mysql_string(schema_name),
+            "table_name": _mysql_string(table_name),
+            "uri": _mysql_string(f"oci://{bucket_name}@{namespace}/{document_prefix}")
+        }
         response = execute_sql_tool_by_connection_id(connection_info['id'], vsload)
         
         return response
     
     except Exception as e:
-        return json.dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
+        return _dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
 
 @mcp.tool()
 def object_storage_list_buckets(compartment_name: str) -> str:
@@ -1214,19 +1495,18 @@ def object_storage_list_buckets(compartment_name: str) -> str:
     """
     compartment = get_compartment_by_name(compartment_name)
     if not compartment:
-        return json.dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
-
-    namespace = object_storage_client.get_namespace().data
+        return _dumps({"error": f"Compartment '{compartment_name}' not found. Use list_compartment_names() to see available compartments."})
 
     try:
+        namespace = _object_storage_namespace()
         # List buckets in the specified compartment
-        list_buckets_response = object_storage_client.list_buckets(namespace_name = namespace,
+        list_buckets_response = _client("object_storage").list_buckets(namespace_name = namespace,
                                                                    compartment_id = compartment.id
                                                                    )
     except Exception as e:
-        return json.dumps({"error": f"Error with listing available buckets in a compartment: {str(e)}"})
+        return _dumps({"error": f"Error with listing available buckets in a compartment: {str(e)}"})
 
-    return str(list_buckets_response.data)
+    return to_json(list_buckets_response.data)
 
 
 @mcp.tool()
@@ -1236,13 +1516,17 @@ def object_storage_list_objects(namespace: str, bucket_name: str) -> str:
     """
     try:
         # List objects in a specified bucket
-        list_object_response = object_storage_client.list_objects(namespace_name = namespace,
+        list_object_response = _client("object_storage").list_objects(namespace_name = namespace,
                                                                   bucket_name = bucket_name
                                                                   )
     except Exception as e:
-        return json.dumps({"error": f"Error with listing objects in a specified bucket: {str(e)}"})
+        return _dumps({"error": f"Error with listing objects in a specified bucket: {str(e)}"})
+
+    return to_json(list_object_response.data.objects)
 
-    return str(list_object_response.data.objects)
+# ml_rag with skip_generate only retrieves; the citations hold the matching segments
+# and are the only part of @response sent back
+HEATWAVE_ML_RAG_SQL = "SET @options = NULL; CALL sys.ml_rag('%(question)s', @response, JSON_OBJECT('skip_generate', true)); SELECT JSON_EXTRACT(@response, '$.citations') AS citations"
 
 @mcp.tool()
 def heatwave_ask_ml_rag(dbtools_connection_display_name: str, question: str) -> str:
@@ -1257,7 +1541,7 @@ def heatwave_ask_ml_rag(dbtools_connection_display_name: str, question: str) ->
     connection_info = get_minimal_connection_by_name(dbtools_connection_display_name)
     
     if connection_info is None:
-        return json.dumps({
+        return _dumps({
             "error": f"No connection found with name '{dbtools_connection_display_name}'",
             "suggestion": "Use list_all_connections() to see available connections"
         })
@@ -1265,25 +1549,24 @@ def heatwave_ask_ml_rag(dbtools_connection_display_name: str, question: str) ->
     try:
         # Verify this is a MySQL connection
         if connection_info.get('type') != 'MYSQL':
-            return json.dumps({
+            return _dumps({
                 "error": "This connection is not a MySQL database. Heatwave ML_RAG is only available for MySQL databases.",
                 "suggestion": "Please provide a MySQL database connection."
             })
             
         # Execute the heatwave chat query
-        ask_ml_rag = f"set @options = NULL; call sys.ml_rag('{question}', @response, JSON_OBJECT('skip_generate', true)); SELECT @response;"
-        response = execute_sql_tool_by_connection_id(connection_info['id'], ask_ml_rag)
+        ask_ml_rag = HEATWAVE_ML_RAG_SQL % {"question": _mysql_string(question)}
+        response_data = _execute_sql_raw(connection_info['id'], ask_ml_rag)
         
         # Parse the response
-        if isinstance(response, str):
-            response_data = json.loads(response)
-            if 'items' in response_data and len(response_data['items']) > 0:
-                json_column_name = response_data['items'][2]['resultSet']['metadata'][0]['jsonColumnName']
-            return json.loads(response_data['items'][2]['resultSet']['items'][0][json_column_name])
+        if len(response_data.get('items', [])) > 2:
+            json_column_name = response_data['items'][2]['resultSet']['metadata'][0]['jsonColumnName']
+            # Already a JSON document, handed back as is
+            return response_data['items'][2]['resultSet']['items'][0][json_column_name]
             
-        return json.dumps({"error": "Unexpected response format from Heatwave ML_RAG"})
+        return _dumps({"error": "Unexpected response format from Heatwave ML_RAG"})
     except Exception as e:
-        return json.dumps({"error": f"Error with ML_RAG: {str(e)}"})
+        return _dumps({"error": f"Error with ML_RAG: {str(e)}"})
 
 if __name__ == "__main__":
     # Initialize and run the server
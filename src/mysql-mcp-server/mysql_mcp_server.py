@@ -4,20 +4,51 @@ Licensed under the Universal Permissive License v1.0 as shown at http://oss.orac
 """
 
 import contextlib
-import json
-import re
+import io
+import itertools
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 
 import oci
+import orjson
 from fastmcp import FastMCP
 from mysql import connector
+from mysql.connector import pooling
 from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.errors import PoolError
 
 from utils import DatabaseConnectionError, get_ssh_command, load_mysql_config, Mode, OciInfo
 
 MIN_CONTEXT_SIZE = 10
 DEFAULT_CONTEXT_SIZE = 20
 MAX_CONTEXT_SIZE = 100
+FETCH_BATCH_SIZE = 1000
+MODE_CACHE_TTL_SECONDS = 300
+CONNECTION_PROBE_WORKERS = 32
+CONNECTION_POOL_SIZE = 4
+COMPARTMENT_CACHE_TTL_SECONDS = 300
+COMPARTMENT_PROBE_WORKERS = 16
+
+# Deletes every legal identifier character, so any leftover means the name is invalid
+_STRIP_NAME_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+
+
+def _json_default(value):
+    """Internal orjson default hook: bytes driver values (user variables, BINARY/BLOB) are decoded, Decimal and other types fall back to str"""
+    if isinstance(value, (bytes, bytearray)):
+        return _decode_bytes(value)
+    return str(value)
+
+
+def _dumps(value) -> str:
+    """Internal function to encode tool output as JSON text"""
+    return orjson.dumps(value, default=_json_default).decode()
+
+
+_loads = orjson.loads
 
 ###############################################################
 # Start setup
@@ -29,7 +60,7 @@ config_error_msg: Optional[str] = None
 try:
     config = load_mysql_config()
 except Exception as e:
-    config_error_msg = json.dumps({
+    config_error_msg = _dumps({
         "error" : f"Error loading config. Fix configuration file and try restarting MCP server {str(e)}."
     })
 
@@ -39,7 +70,7 @@ oci_error_msg: Optional[str] = None # None if OCI available, otherwise a json fo
 try:
     oci_info = OciInfo()
 except Exception as e:
-    oci_error_msg = json.dumps({
+    oci_error_msg = _dumps({
         "error" : "object store unavailable. If object store is required, the MCP server must be restarted with a valid"
                  f" OCI config. OCI connection attempt yielded error {str(e)}."
     })
@@ -65,33 +96,50 @@ def _validate_name(name: str) -> str:
         ValueError: If the name does not meet format requirements.
     """
     # Accepts only letters, digits, and underscores; change as needed
-    if not (isinstance(name, str) and re.match(r"^[A-Za-z0-9_]+$", name)):
+    if not isinstance(name, str) or not name or name.translate(_STRIP_NAME_CHARS):
         raise ValueError(f"Unsupported name format {name}")
 
     return name
 
 
-def _get_mode(connection_id: str) -> Mode:
+# connection_id -> (mode, time.monotonic() when resolved)
+_mode_cache: dict[str, tuple[Mode, float]] = {}
+
+
+def _get_mode(
+    connection_id: str, connection: Optional[MySQLConnectionAbstract] = None
+) -> Mode:
     """
     Resolve the current provider Mode for a given connection.
 
+    Args:
+        connection_id: MySQL connection key, also used as the cache key.
+        connection: Optional already-open connection to run the query on instead of opening a new one.
+
     Raises:
         Exception: If the provider cannot be fetched or the value is unrecognized.
 
     Returns:
-        Mode: The resolved provider mode.
+        Mode: The resolved provider mode, cached per connection_id for MODE_CACHE_TTL_SECONDS.
     """
-    provider_result = _execute_sql_tool(
-        connection_id, "SELECT @@rapid_cloud_provider;"
-    )
-    if check_error(provider_result):
-        raise Exception(
-            f"Exception occurred while fetching cloud provider {str(provider_result)}"
-        )
+    cached = _mode_cache.get(connection_id)
+    if cached is not None and time.monotonic() - cached[1] < MODE_CACHE_TTL_SECONDS:
+        return cached[0]
 
-    provider = fetch_one(provider_result)
+    try:
+        provider = _execute_sql_scalar(
+            connection if connection is not None else connection_id,
+            "SELECT @@rapid_cloud_provider;",
+        )
+    except Exception as e:
+        _mode_cache.pop(connection_id, None)
+        raise Exception(
+            f"Exception occurred while fetching cloud provider {str(e)}"
+        ) from e
 
-    return Mode.from_string(provider)
+    mode = Mode.from_string(provider)
+    _mode_cache[connection_id] = (mode, time.monotonic())
+    return mode
 
 
 def get_error(json_str: Optional[str]) -> Optional[str]:
@@ -108,8 +156,8 @@ def get_error(json_str: Optional[str]) -> Optional[str]:
         return None
 
     try:
-        payload = json.loads(json_str)
-    except json.JSONDecodeError:
+        payload = _loads(json_str)
+    except orjson.JSONDecodeError:
         return None
 
     if isinstance(payload, dict):
@@ -134,55 +182,116 @@ def check_error(json_str: Optional[str]) -> bool:
     return get_error(json_str) is not None
 
 
-def fetch_one(json_str: str) -> str:
-    result = json.loads(json_str)
-
-    if len(result) != 1:
-        raise Exception(
-            json.dumps(
-                {
-                    "error": f"Unexpected response invalid number of rows actual {len(result)}, expected 1"
-                }
-            )
-        )
-
-    return result[0][0]
+def _decode_bytes(value):
+    """
+    Decode bytes/bytearray driver values (e.g. user variables like @response) to str; other values pass through.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode()
+    return value
 
 
 @contextlib.contextmanager
-def _get_database_connection_cm(connection_id: str):
+def _get_database_connection_cm(connection_id: str, pooled: bool = True):
     """
     Context manager for a MySQLConnection using configuration from load_mysql_config().
 
+    Args:
+        connection_id: MySQL connection key.
+        pooled: Check the connection out of the connection_id's pool (see _get_db_connection).
+
     Yields:
-        mysql.connector.MySQLConnection: An active connection, automatically closed after the block.
+        mysql.connector.MySQLConnection: An active connection, automatically closed (returned to its pool) after the block.
 
     Raises:
         DatabaseConnectionError: If the connection could not be established or connection_id is invalid.
     """
-    conn = _get_db_connection(connection_id)
+    conn = _get_db_connection(connection_id, pooled=pooled)
     try:
         yield conn
     finally:
+        _close_connection(conn)
+
+
+def _close_connection(conn: MySQLConnectionAbstract) -> None:
+    """
+    Close conn, returning it to its pool when pooled.
+
+    A pooled close resets the session, which raises when the connection has died (e.g. an idle
+    timeout through a bastion). The connection is handed back to the pool regardless and
+    reconnected on its next checkout, so the error is dropped to keep the caller's own result or error.
+    """
+    try:
         conn.close()
+    except Exception:
+        pass
+
+
+# connection_id -> pool of warm connections, created on first pooled use
+_pools: dict[str, pooling.MySQLConnectionPool] = {}
+_pool_locks: dict[str, threading.Lock] = {}
+_pool_locks_lock = threading.Lock()
+_pool_ids = itertools.count()
 
 
-def _get_db_connection(connection_id: str) -> MySQLConnectionAbstract:
+def _get_connection_pool(connection_id: str, connection_info: dict) -> pooling.MySQLConnectionPool:
+    """
+    Return the connection pool for connection_id, creating it (and its connections) on first use.
+
+    Creation holds a lock for this connection_id only, so a slow or unreachable server does not
+    hold up pool creation for other connections.
+    """
+    pool = _pools.get(connection_id)
+    if pool is not None:
+        return pool
+
+    with _pool_locks_lock:
+        lock = _pool_locks.setdefault(connection_id, threading.Lock())
+
+    with lock:
+        pool = _pools.get(connection_id)
+        if pool is None:
+            pool = pooling.MySQLConnectionPool(
+                pool_name=f"mysql_mcp_{next(_pool_ids)}",
+                pool_size=CONNECTION_POOL_SIZE,
+                **connection_info,
+            )
+            _pools[connection_id] = pool
+    return pool
+
+
+def _get_db_connection(connection_id: str, pooled: bool = True) -> MySQLConnectionAbstract:
+    """
+    Open a connection for connection_id.
+
+    Args:
+        connection_id: MySQL connection key.
+        pooled: When True, check the connection out of the connection_id's pool (close() returns it),
+            falling back to a dedicated connection when every pooled connection is in use.
+            When False, always open a dedicated connection, e.g. for a reachability probe.
+    """
     if config_error_msg is not None:
         raise DatabaseConnectionError("Configuration file is not loaded")
 
-    if connection_id not in config["server_infos"]:
+    connection_info = config["server_infos"].get(connection_id)
+    if connection_info is None:
         raise DatabaseConnectionError(
             f"Connection '{connection_id}' is not a valid connection. "
             "Use list_all_connections() to see available connections."
         )
 
-    connection_info = config["server_infos"][connection_id]
     if "database" not in connection_info:
         raise DatabaseConnectionError("Database must be specified in config.")
 
     try:
-        conn = connector.connect(**connection_info)
+        if not pooled:
+            conn = connector.connect(**connection_info)
+        else:
+            try:
+                conn = _get_connection_pool(connection_id, connection_info).get_connection()
+            except PoolError:
+                # Pool exhausted
+                conn = connector.connect(**connection_info)
     except Exception as e:
         raise DatabaseConnectionError(
             f"Connection failed with error: {e}. "
@@ -208,8 +317,8 @@ def list_all_connections() -> str:
             }
 
     Notes:
-        - Attempts to open a connection for each configured key and records success/failure.
-        - For valid connections, also resolves the provider Mode via _get_mode.
+        - Attempts to open a connection for each configured key (concurrently) and records success/failure.
+        - For valid connections, also resolves the provider Mode via _get_mode on the same connection.
 
     MCP usage example:
         - name: list_all_connections
@@ -218,22 +327,40 @@ def list_all_connections() -> str:
     if config_error_msg is not None:
         return config_error_msg
 
+    connection_ids = list(config["server_infos"].keys())
     valid_keys, invalid_keys = [], []
-    for connection_id in config["server_infos"].keys():
-        try:
-            with _get_database_connection_cm(connection_id):
-                valid_keys.append(
-                    {"key": connection_id, "mode": _get_mode(connection_id).value}
-                )
-        except Exception as e:
-            invalid_keys.append(
-                {
-                    "key": connection_id,
-                    "error": str(e),
-                    "hint": f"Bastion/jump host may be down. Try starting it with {get_ssh_command(config)}"
-                }
-            )
-    return json.dumps({"valid keys": valid_keys, "invalid keys": invalid_keys})
+    if not connection_ids:
+        return _dumps({"valid keys": valid_keys, "invalid keys": invalid_keys})
+
+    # Probes are I/O bound, so run them concurrently; map keeps the config order
+    workers = min(CONNECTION_PROBE_WORKERS, len(connection_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for is_valid, entry in executor.map(_probe_connection, connection_ids):
+            (valid_keys if is_valid else invalid_keys).append(entry)
+
+    return _dumps({"valid keys": valid_keys, "invalid keys": invalid_keys})
+
+
+def _probe_connection(connection_id: str) -> tuple[bool, dict]:
+    """
+    Internal helper for list_all_connections: open a dedicated connection and resolve its mode.
+
+    The probe does not go through the pool, so checking reachability never opens a full pool of connections.
+
+    Returns:
+        tuple[bool, dict]: (True, valid key entry) or (False, invalid key entry with error and hint).
+    """
+    try:
+        with _get_database_connection_cm(connection_id, pooled=False) as db_connection:
+            mode = _get_mode(connection_id, db_connection)
+            return True, {"key": connection_id, "mode": mode.value}
+    except Exception as e:
+        _mode_cache.pop(connection_id, None)
+        return False, {
+            "key": connection_id,
+            "error": str(e),
+            "hint": f"Bastion/jump host may be down. Try starting it with {get_ssh_command(config)}"
+        }
 
 
 @mcp.tool()
@@ -284,7 +411,7 @@ def _execute_sql_tool(
         try:
             db_connection = _get_db_connection(connection)
         except Exception as e:
-            return json.dumps(
+            return _dumps(
                 {"error": f"unable to establish a database connection {str(e)}"}
             )
     else:
@@ -292,27 +419,45 @@ def _execute_sql_tool(
 
     try:
         with db_connection.cursor() as cursor:
-            results = []
+            # Rows are encoded batch by batch straight into one JSON array, so the
+            # full result set is never held as Python rows and JSON text at once
+            buffer = io.BytesIO()
+            buffer.write(b"[")
+            has_rows = False
+            needs_commit = False
             cursor.execute(sql_script, params or [])
 
             # Read results from possibly multiple statements
             while True:
-                if cursor.with_rows:
-                    results.extend(cursor.fetchall())
+                if not cursor.with_rows:
+                    # DML/DDL/CALL status results may have changed data
+                    needs_commit = True
+                else:
+                    while True:
+                        rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+                        if not rows:
+                            break
+                        if has_rows:
+                            buffer.write(b",")
+                        buffer.write(orjson.dumps(rows, default=_json_default)[1:-1])
+                        has_rows = True
 
                 # Move to the next result set
                 if not cursor.nextset():
                     break
 
-            if len(results) == 0:
-                results = None
+            # Scripts made only of row-returning statements (plain SELECTs) skip the commit round trip
+            if needs_commit:
+                db_connection.commit()
 
-            db_connection.commit()
+            if not has_rows:
+                return _dumps(None)
 
-            return json.dumps(results)
+            buffer.write(b"]")
+            return buffer.getvalue().decode()
 
     except Exception as e:
-        return json.dumps(
+        return _dumps(
             {
                 "error": f"Error executing SQL: {str(e)}",
                 "sql_script": sql_script,
@@ -321,7 +466,75 @@ def _execute_sql_tool(
         )
     finally:
         if should_close:
-            db_connection.close()
+            _close_connection(db_connection)
+
+
+def _execute_sql_scalar(
+    connection: Union[str, MySQLConnectionAbstract],
+    sql_script: str,
+    params: list = None,
+):
+    """
+    Execute a SQL script that produces a single row and return its first column.
+
+    Unlike _execute_sql_tool, the value is returned as the driver's Python object, skipping the JSON encode/decode round trip.
+
+    Args:
+        connection: Union[str, MySQLConnectionAbstract]: Information defining the database connection to use. Allows for reusing a db connection.
+        sql_script (str): The SQL statement(s) to execute. Rows from every result set are counted.
+        params (list, optional): List of parameters to use for parameterized SQL scripts. If None, executes with no bind variables.
+
+    Returns:
+        The first column of the single result row, with bytes values decoded to str.
+
+    Raises:
+        DatabaseConnectionError: If a connection_id is given and the connection could not be established.
+        ValueError: If the script does not produce exactly one row.
+        Exception: Any driver error raised while executing the script.
+    """
+    should_close = isinstance(connection, str)
+    db_connection = _get_db_connection(connection) if should_close else connection
+
+    try:
+        with db_connection.cursor() as cursor:
+            rows = []
+            needs_commit = False
+            cursor.execute(sql_script, params or [])
+
+            # Scalar scripts may still be multi-statement (e.g. CALL ...; SELECT @var)
+            while True:
+                if cursor.with_rows:
+                    rows.extend(cursor.fetchall())
+                else:
+                    needs_commit = True
+
+                if not cursor.nextset():
+                    break
+
+            if needs_commit:
+                db_connection.commit()
+    finally:
+        if should_close:
+            _close_connection(db_connection)
+
+    if len(rows) != 1:
+        raise ValueError(
+            f"Unexpected response invalid number of rows actual {len(rows)}, expected 1"
+        )
+
+    return _decode_bytes(rows[0][0])
+
+
+def _discard_results(cursor) -> None:
+    """
+    Read and drop any result sets left on the cursor (e.g. by a CALL) so the next statement can run.
+    """
+    while True:
+        if cursor.with_rows:
+            cursor.fetchall()
+
+        if not cursor.nextset():
+            break
 
 
 @mcp.tool()
@@ -345,23 +558,24 @@ def ml_generate(connection_id: str, question: str) -> str:
           arguments: {"connection_id": "example_local_server", "question": "Summarize the latest logs."}
     """
     ml_generate_call = "SELECT sys.ML_GENERATE(%s, NULL)"
-    response = _execute_sql_tool(
-        connection_id,
-        ml_generate_call,
-        params=[
-            question,
-        ],
-    )
-
-    if check_error(response):
-        return json.dumps({"error": f"Error with ML_GENERATE: {response}"})
+    try:
+        response_data = _execute_sql_scalar(
+            connection_id,
+            ml_generate_call,
+            params=[
+                question,
+            ],
+        )
+    except ValueError:
+        return _dumps({"error": "Unexpected response format from ML_GENERATE"})
+    except Exception as e:
+        return _dumps({"error": f"Error with ML_GENERATE: {str(e)}"})
 
     try:
-        response_data = fetch_one(response)
-        response_data = json.loads(response_data)
+        response_data = _loads(response_data)
         return response_data["text"]
     except:
-        return json.dumps({"error": "Unexpected response format from ML_GENERATE"})
+        return _dumps({"error": "Unexpected response format from ML_GENERATE"})
 
 
 @mcp.tool()
@@ -418,7 +632,7 @@ def ragify_column(
             params=[qualified_text_column_name, vector_store_column_name],
         )
         if check_error(response):
-            return json.dumps(
+            return _dumps(
                 {
                     "error": f"Error with ML_EMBED_TABLE: {response}",
                 }
@@ -453,16 +667,15 @@ def list_vector_store_files_local(connection_id: str) -> str:
                 f"Connection is {mode} not MySQL AI use list_vector_store_files_object_store"
             )
 
-        result_str = _execute_sql_tool(
+        result = _execute_sql_scalar(
             connection_id,
             "SELECT LIST_FILES(CONCAT('file://', @@secure_file_priv), NULL);",
         )
-        result = fetch_one(result_str)
-        result = json.loads(result)
+        result = _loads(result)
 
-        return json.dumps([elem["name"][len("file://") :] for elem in result])
+        return _dumps([elem["name"][len("file://") :] for elem in result])
     except Exception as e:
-        return json.dumps({"error": f"Error with LIST_FILES: {str(e)}"})
+        return _dumps({"error": f"Error with LIST_FILES: {str(e)}"})
 
 
 @mcp.tool()
@@ -492,7 +705,8 @@ def load_vector_store_local(connection_id: str, file_path: str) -> str:
                 f"Connection is {mode} not MySQL AI try load_vector_store_oci"
             )
 
-        with _get_database_connection_cm(connection_id) as db_connection:
+        # A dedicated connection: autocommit would otherwise stick to a pooled one across checkouts
+        with _get_database_connection_cm(connection_id, pooled=False) as db_connection:
             file_path = f"file://{file_path}"
             db_connection.autocommit = True
             return _execute_sql_tool(
@@ -501,7 +715,7 @@ def load_vector_store_local(connection_id: str, file_path: str) -> str:
                 params=[file_path],
             )
     except Exception as e:
-        return json.dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
+        return _dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
 
 
 @mcp.tool()
@@ -561,7 +775,7 @@ def load_vector_store_oci(
             params=[file_path],
         )
     except Exception as e:
-        return json.dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
+        return _dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
 
 
 @mcp.tool()
@@ -586,10 +800,12 @@ def ask_ml_rag_vector_store(connection_id: str, question: str, context_size: int
           arguments: {"connection_id": "example_local_server", "question": "Find information about refunds."}
     """
     if context_size < MIN_CONTEXT_SIZE or MAX_CONTEXT_SIZE < context_size:
-        return json.dumps({"error": f"Error choose a context_size in [{MIN_CONTEXT_SIZE}, {MAX_CONTEXT_SIZE}]"})
+        return _dumps({"error": f"Error choose a context_size in [{MIN_CONTEXT_SIZE}, {MAX_CONTEXT_SIZE}]"})
 
     return _ask_ml_rag_helper(
-        connection_id, question, f"JSON_OBJECT('skip_generate', true, 'n_citations', {context_size})"
+        connection_id,
+        question,
+        _dumps({"skip_generate": True, "n_citations": context_size}),
     )
 
 
@@ -618,7 +834,7 @@ def ask_ml_rag_innodb(
         str: Scalar result from SELECT @response (often JSON). On error, a JSON-encoded object.
 
     Implementation details:
-        - Uses options: JSON_OBJECT('skip_generate', true, 'segment', '<segment_col>', 'segment_embedding', '<embedding_col>')
+        - Uses options: {"skip_generate": true, "n_citations": <context_size>, "vector_store_columns": {"segment": "<segment_col>", "segment_embedding": "<embedding_col>"}}
         - Retrieval-only; use ml_generate to produce text from retrieved context.
 
     MCP usage example:
@@ -626,21 +842,21 @@ def ask_ml_rag_innodb(
           arguments: {"connection_id": "example_local_server", "question": "Search product docs", "segment_col": "body", "embedding_col": "embedding"}
     """
     if context_size < MIN_CONTEXT_SIZE or MAX_CONTEXT_SIZE < context_size:
-        return json.dumps({"error": f"Error choose a context_size in [{MIN_CONTEXT_SIZE}, {MAX_CONTEXT_SIZE}]"})
+        return _dumps({"error": f"Error choose a context_size in [{MIN_CONTEXT_SIZE}, {MAX_CONTEXT_SIZE}]"})
 
     try:
         # prevent possible injection
         _validate_name(segment_col)
         _validate_name(embedding_col)
     except Exception as e:
-        return json.dumps({"error": f"Error validating names {str(e)}"})
+        return _dumps({"error": f"Error validating names {str(e)}"})
 
-    return _ask_ml_rag_helper(
-        connection_id,
-        question,
-        f"JSON_OBJECT('skip_generate', true, 'n_citations', {context_size}, 'vector_store_columns', "
-        f"JSON_OBJECT('segment', '{segment_col}', 'segment_embedding', '{embedding_col}'))",
-    )
+    options = {
+        "skip_generate": True,
+        "n_citations": context_size,
+        "vector_store_columns": {"segment": segment_col, "segment_embedding": embedding_col},
+    }
+    return _ask_ml_rag_helper(connection_id, question, _dumps(options))
 
 
 def _ask_ml_rag_helper(connection_id: str, question: str, options_json_str: str) -> str:
@@ -650,36 +866,34 @@ def _ask_ml_rag_helper(connection_id: str, question: str, options_json_str: str)
     Args:
         connection_id (str): MySQL connection key.
         question (str): Natural language question.
-        options_json_str (str): JSON_OBJECT(...) string specifying ML_RAG options.
+        options_json_str (str): JSON document specifying ML_RAG options, bound as a parameter and cast to JSON.
 
     Returns:
         str: Scalar result from SELECT @response (often JSON). On error, a JSON-encoded object.
 
     Implementation details:
-        - Sets @options, invokes ML_RAG, then reads @response in the same session.
+        - Sets @options, invokes ML_RAG, then reads @response on a single cursor in the same session.
     """
     with _get_database_connection_cm(connection_id) as db_connection:
-        # Execute the heatwave chat query
-        set_response = _execute_sql_tool(db_connection, "SET @options = NULL;")
-        if check_error(set_response):
-            return json.dumps({"error": f"Error with ML_RAG: {set_response}"})
+        try:
+            with db_connection.cursor() as cursor:
+                # Execute the heatwave chat query
+                cursor.execute("SET @options = NULL;")
+                cursor.execute(
+                    "CALL sys.ML_RAG(%s, @response, CAST(%s AS JSON));",
+                    [question, options_json_str],
+                )
+                _discard_results(cursor)
 
-        rag_response = _execute_sql_tool(
-            db_connection,
-            f"CALL sys.ML_RAG(%s, @response, {options_json_str});",
-            params=[question],
-        )
-        if check_error(rag_response):
-            return json.dumps({"error": f"Error with ML_RAG: {rag_response}"})
+                cursor.execute("SELECT @response;")
+                row = cursor.fetchone()
+        except Exception as e:
+            return _dumps({"error": f"Error with ML_RAG: {str(e)}"})
 
-        fetch_response = _execute_sql_tool(db_connection, "SELECT @response;")
-        if check_error(fetch_response):
-            return json.dumps({"error": f"Error with ML_RAG: {fetch_response}"})
+        if row is None:
+            return _dumps({"error": "Unexpected response format from ML_GENERATE"})
 
-        try:
-            return fetch_one(fetch_response)
-        except:
-            return json.dumps({"error": "Unexpected response format from ML_GENERATE"})
+        return _decode_bytes(row[0])
 
 
 @mcp.tool()
@@ -719,17 +933,13 @@ def heatwave_ask_help(connection_id: str, question: str) -> str:
 
         nl2ml_call = "call sys.NL2ML(%s, @nl2ml_response); select @nl2ml_response"
 
-        response = _execute_sql_tool(
+        return _execute_sql_scalar(
             connection_id,
             nl2ml_call,
             params=[question],
         )
-        if check_error(response):
-            raise Exception(f"Exception occured while executing NL2ML call {response}")
-
-        return fetch_one(response)
     except Exception as e:
-        return json.dumps({"error": f"Error with NL2ML: {str(e)}"})
+        return _dumps({"error": f"Error with NL2ML: {str(e)}"})
 
 
 """
@@ -748,15 +958,35 @@ def verify_compartment_access(compartments):
             "errors": []
         }
 
-        # Test Object Storage
+    if not compartments:
+        return access_report
+
+    # The namespace is per tenancy, so fetch it once for every compartment
+    try:
+        namespace = oci_info.object_storage_client.get_namespace().data
+    except Exception as e:
+        for compartment in compartments:
+            access_report[compartment.name]["errors"].append(f"Object Storage: {str(e)}")
+        return access_report
+
+    def _probe_object_storage(compartment) -> Optional[str]:
         try:
-            namespace = oci_info.object_storage_client.get_namespace().data
-            list_buckets_response = oci_info.object_storage_client.list_buckets(
+            oci_info.object_storage_client.list_buckets(
                 namespace_name=namespace, compartment_id=compartment.id
             )
-            access_report[compartment.name]["object_storage"] = True
+            return None
         except Exception as e:
-            access_report[compartment.name]["errors"].append(f"Object Storage: {str(e)}")
+            return f"Object Storage: {str(e)}"
+
+    # Test Object Storage; the probes are independent HTTP calls, so run them concurrently
+    workers = min(COMPARTMENT_PROBE_WORKERS, len(compartments))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = executor.map(_probe_object_storage, compartments)
+        for compartment, error in zip(compartments, errors):
+            if error is None:
+                access_report[compartment.name]["object_storage"] = True
+            else:
+                access_report[compartment.name]["errors"].append(error)
 
     return access_report
 
@@ -769,7 +999,7 @@ def list_all_compartments() -> str:
         None
 
     Returns:
-        str: Stringified per-compartment access report:
+        str: JSON-encoded per-compartment access report:
              {
                "<compartment_name>": {
                  "compartment_id": "<ocid>",
@@ -796,11 +1026,48 @@ def list_all_compartments() -> str:
             oci_info.tenancy_id
         ).data
     except Exception as e:
-        return json.dumps({"error": f"Error with list_compartments: {str(e)}"})
+        return _dumps({"error": f"Error with list_compartments: {str(e)}"})
 
     access_report = verify_compartment_access(compartments)
 
-    return str(access_report)
+    return _dumps(access_report)
+
+
+# (lower-cased compartment name -> compartment, time.monotonic() when listed)
+_compartments_cache: Optional[tuple[dict, float]] = None
+
+
+def _get_compartments_by_name() -> dict:
+    """
+    Internal helper returning accessible compartments (subtree plus root tenancy) keyed by lower-cased name.
+
+    The listing is cached for COMPARTMENT_CACHE_TTL_SECONDS so new compartments are picked up eventually.
+    May raise exception.
+    """
+    global _compartments_cache
+    cached = _compartments_cache
+    if cached is not None and time.monotonic() - cached[1] < COMPARTMENT_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    compartments = oci_info.identity_client.list_compartments(
+        compartment_id=oci_info.tenancy_id,
+        compartment_id_in_subtree=True,
+        access_level="ACCESSIBLE",
+        lifecycle_state="ACTIVE",
+    )
+    compartments.data.append(
+        oci_info.identity_client.get_compartment(
+            compartment_id=oci_info.tenancy_id
+        ).data
+    )
+
+    # First match wins, as with the previous linear scan
+    compartments_by_name = {}
+    for compartment in compartments.data:
+        compartments_by_name.setdefault(compartment.name.lower(), compartment)
+
+    _compartments_cache = (compartments_by_name, time.monotonic())
+    return compartments_by_name
 
 
 def _get_compartment_by_name(
@@ -818,31 +1085,14 @@ def _get_compartment_by_name(
             - None if not found
 
     Notes:
-        - Searches accessible compartments in subtree and includes the root tenancy.
+        - Searches accessible compartments in subtree and includes the root tenancy (cached, see _get_compartments_by_name).
         - Intended for internal use by Object Storage helpers.
         - May raise exception
     """
     if oci_error_msg is not None:
         return None
 
-    compartments = oci_info.identity_client.list_compartments(
-        compartment_id=oci_info.tenancy_id,
-        compartment_id_in_subtree=True,
-        access_level="ACCESSIBLE",
-        lifecycle_state="ACTIVE",
-    )
-    compartments.data.append(
-        oci_info.identity_client.get_compartment(
-            compartment_id=oci_info.tenancy_id
-        ).data
-    )
-
-    # Search for the compartment by name
-    for compartment in compartments.data:
-        if compartment.name.lower() == compartment_name.lower():
-            return compartment
-
-    return None
+    return _get_compartments_by_name().get(compartment_name.lower())
 
 
 @mcp.tool()
@@ -879,7 +1129,7 @@ def object_storage_list_buckets(
         )
         return str(list_buckets_response.data)
     except Exception as e:
-        return json.dumps({"error": f"Error listing buckets: {str(e)}"})
+        return _dumps({"error": f"Error listing buckets: {str(e)}"})
 
 
 @mcp.tool()
@@ -908,7 +1158,7 @@ def object_storage_list_objects(namespace: str, bucket_name: str) -> str:
             namespace_name=namespace, bucket_name=bucket_name
         )
     except Exception as e:
-        return json.dumps(
+        return _dumps(
             {"error": f"Error with listing objects in a specified bucket: {str(e)}"}
         )
 
@@ -3,9 +3,11 @@ import importlib.util
 import json
 import os
 import sys
+import threading
 import types
 import unittest
 import uuid
+from decimal import Decimal
 from unittest import mock
 
 import mysql_mcp_server as m
@@ -104,6 +106,9 @@ OCI_SKIP_MSG = "Skip OCI Dependent Test"
 
 
 class TestMysqlMcpUtilities(unittest.TestCase):
+    def setUp(self):
+        m._mode_cache.clear()
+
     # ---- Mode ----
     def test_mode_from_string_valid(self):
         self.assertEqual(m.Mode.from_string("LCL"), m.Mode.MYSQL_AI)
@@ -133,6 +138,9 @@ class TestMysqlMcpUtilities(unittest.TestCase):
             "dash-",
             "dot.",
             "slash/",
+            "trailing_newline\n",
+            "",
+            "na\u00efve",
         ]:
             with self.assertRaises(ValueError, msg=f"Expected failure for {bad}"):
                 m._validate_name(bad)
@@ -159,42 +167,81 @@ class TestMysqlMcpUtilities(unittest.TestCase):
         self.assertEqual(m.get_error(err), "boom")
         self.assertTrue(m.check_error(err))
 
-    # ---- fetch_one ----
-    def test_fetch_one_success(self):
-        self.assertEqual(m.fetch_one(json.dumps([["value"]])), "value")
-        self.assertEqual(m.fetch_one(json.dumps([[123]])), 123)
+    # ---- _execute_sql_scalar (cursor mocked) ----
+    def _scalar_connection(self, result_sets):
+        cursor = mock.MagicMock()
+        cursor.with_rows = True
+        cursor.fetchall.side_effect = result_sets
+        cursor.nextset.side_effect = [True] * (len(result_sets) - 1) + [None]
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return conn
+
+    def test_execute_sql_scalar_returns_first_column_of_single_row(self):
+        conn = self._scalar_connection([[], [("value", "ignored")]])
+        self.assertEqual(m._execute_sql_scalar(conn, "SELECT @v"), "value")
+        conn.close.assert_not_called()
+        conn.commit.assert_not_called()
+
+    def test_execute_sql_scalar_commits_after_status_result(self):
+        conn = self._scalar_connection([[("value",)]])
+        cursor = conn.cursor.return_value.__enter__.return_value
+        # CALL status result without rows, then the SELECT @v row
+        type(cursor).with_rows = mock.PropertyMock(side_effect=[False, True])
+        cursor.nextset.side_effect = [True, None]
+        self.assertEqual(m._execute_sql_scalar(conn, "CALL p(); SELECT @v"), "value")
+        conn.commit.assert_called_once()
+
+    def test_execute_sql_scalar_decodes_bytes_values(self):
+        conn = self._scalar_connection([[(bytearray(b'{"text": "ok"}'),)]])
+        self.assertEqual(m._execute_sql_scalar(conn, "SELECT @v"), '{"text": "ok"}')
+
+    def test_execute_sql_scalar_wrong_rowcount_raises_value_error(self):
+        for result_sets in ([[]], [[("a",), ("b",)]]):
+            conn = self._scalar_connection(result_sets)
+            with self.assertRaises(ValueError) as ctx:
+                m._execute_sql_scalar(conn, "SELECT 1")
+            self.assertIn("invalid number of rows", str(ctx.exception))
+
+    def test_execute_sql_tool_decodes_bytes_values(self):
+        mock_conn = mock.MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.with_rows = True
+        mock_cursor.fetchmany.side_effect = [
+            [(bytearray(b'{"a":1}'), b"raw", Decimal("1.50"))],
+            [],
+        ]
+        mock_cursor.nextset.return_value = None
 
-    def test_fetch_one_wrong_rowcount(self):
-        with self.assertRaises(Exception) as ctx:
-            m.fetch_one(json.dumps([["a"], ["b"]]))
-        self.assertIn("Unexpected response invalid number of rows", str(ctx.exception))
+        out = m._execute_sql_tool(mock_conn, "SELECT @response, b, d")
 
-        with self.assertRaises(Exception):
-            m.fetch_one(json.dumps([]))
+        self.assertEqual(json.loads(out), [['{"a":1}', "raw", "1.50"]])
+        self.assertEqual(
+            json.loads(m._dumps({"response": bytearray(b"ok")})), {"response": "ok"}
+        )
+
+    def test_execute_sql_scalar_closes_connection_opened_by_id(self):
+        conn = self._scalar_connection([[(1,)]])
+        with mock.patch.object(m, "_get_db_connection", return_value=conn):
+            self.assertEqual(m._execute_sql_scalar("cid", "SELECT 1"), 1)
+        conn.close.assert_called_once()
 
     # ---- _get_mode (all DB calls mocked) ----
     def test_get_mode_success_mysql_ai(self):
         # Simulate SELECT @@rapid_cloud_provider; returning a single row 'LCL'
-        provider_result = json.dumps([["LCL"]])
-        with mock.patch.object(
-            m, "_execute_sql_tool", return_value=provider_result
-        ):
+        with mock.patch.object(m, "_execute_sql_scalar", return_value="LCL"):
             mode = m._get_mode("any_conn")
             self.assertEqual(mode, m.Mode.MYSQL_AI)
 
     def test_get_mode_success_oci(self):
-        provider_result = json.dumps([["OCI"]])
-        with mock.patch.object(
-            m, "_execute_sql_tool", return_value=provider_result
-        ):
+        with mock.patch.object(m, "_execute_sql_scalar", return_value="OCI"):
             mode = m._get_mode("any_conn")
             self.assertEqual(mode, m.Mode.OCI)
 
-    def test_get_mode_error_from_check_error(self):
-        # If the tool returns an error JSON dict, check_error returns True -> raises Exception
-        provider_result = json.dumps({"error": "driver failure"})
+    def test_get_mode_error_from_driver(self):
+        # A failing SELECT @@rapid_cloud_provider is wrapped with context
         with mock.patch.object(
-            m, "_execute_sql_tool", return_value=provider_result
+            m, "_execute_sql_scalar", side_effect=Exception("driver failure")
         ):
             with self.assertRaises(Exception) as ctx:
                 m._get_mode("any_conn")
@@ -204,12 +251,41 @@ class TestMysqlMcpUtilities(unittest.TestCase):
 
     def test_get_mode_invalid_provider_value(self):
         # Single row but invalid provider value -> Mode.from_string raises ValueError
-        provider_result = json.dumps([["XYZ"]])
+        with mock.patch.object(m, "_execute_sql_scalar", return_value="XYZ"):
+            with self.assertRaises(ValueError):
+                m._get_mode("any_conn")
+
+    def test_get_mode_is_cached_per_connection_id(self):
+        with mock.patch.object(
+            m, "_execute_sql_scalar", return_value="OCI"
+        ) as execute:
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.OCI)
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.OCI)
+            self.assertEqual(m._get_mode("other_conn"), m.Mode.OCI)
+        self.assertEqual(execute.call_count, 2)
+
+    def test_get_mode_cache_expires_and_is_dropped_on_error(self):
         with mock.patch.object(
-            m, "_execute_sql_tool", return_value=provider_result
+            m, "_execute_sql_scalar", return_value="LCL"
+        ), mock.patch.object(m.time, "monotonic", return_value=0.0):
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.MYSQL_AI)
+
+        with mock.patch.object(
+            m, "_execute_sql_scalar", side_effect=Exception("down")
+        ), mock.patch.object(
+            m.time, "monotonic", return_value=m.MODE_CACHE_TTL_SECONDS + 1.0
         ):
-            with self.assertRaises(ValueError):
+            with self.assertRaises(Exception):
                 m._get_mode("any_conn")
+        self.assertNotIn("any_conn", m._mode_cache)
+
+    def test_get_mode_uses_given_connection(self):
+        conn = mock.MagicMock()
+        with mock.patch.object(
+            m, "_execute_sql_scalar", return_value="OCI"
+        ) as execute:
+            m._get_mode("any_conn", conn)
+        self.assertIs(execute.call_args[0][0], conn)
 
 
 class TestLoadMySQLConfig(unittest.TestCase):
@@ -270,7 +346,13 @@ class TestLoadMySQLConfig(unittest.TestCase):
 
 
 class TestDbConnectionUtilities(unittest.TestCase):
-    def test_get_db_connection_success_calls_connector(self):
+    def setUp(self):
+        m._pools.clear()
+
+    def tearDown(self):
+        m._pools.clear()
+
+    def test_get_db_connection_success_uses_one_pool_per_connection_id(self):
         cfg = {
             "server_infos": {
                 "good": {
@@ -282,11 +364,34 @@ class TestDbConnectionUtilities(unittest.TestCase):
                 }
             }
         }
+        mock_conn = mock.Mock(name="PooledMySQLConnection")
+
+        with mock.patch.object(m, "config", cfg), mock.patch.object(
+            m.pooling, "MySQLConnectionPool"
+        ) as pool_cls:
+            pool_cls.return_value.get_connection.return_value = mock_conn
+            first = m._get_db_connection("good")
+            second = m._get_db_connection("good")
+
+        self.assertIs(first, mock_conn)
+        self.assertIs(second, mock_conn)
+        pool_cls.assert_called_once_with(
+            pool_name=mock.ANY,
+            pool_size=m.CONNECTION_POOL_SIZE,
+            **cfg["server_infos"]["good"],
+        )
+        self.assertEqual(pool_cls.return_value.get_connection.call_count, 2)
+
+    def test_get_db_connection_pool_exhausted_falls_back_to_connector(self):
+        cfg = {"server_infos": {"good": {"database": "testdb", "user": "u"}}}
         mock_conn = mock.Mock(name="MySQLConnection")
 
         with mock.patch.object(m, "config", cfg), mock.patch.object(
+            m.pooling, "MySQLConnectionPool"
+        ) as pool_cls, mock.patch.object(
             m.connector, "connect", return_value=mock_conn
         ) as connect_mock:
+            pool_cls.return_value.get_connection.side_effect = m.PoolError("exhausted")
             conn = m._get_db_connection("good")
 
         self.assertIs(conn, mock_conn)
@@ -304,14 +409,56 @@ class TestDbConnectionUtilities(unittest.TestCase):
                 m._get_db_connection("bad")
         self.assertIn("Database must be specified in config", str(ctx.exception))
 
+    def test_get_connection_pool_creation_does_not_block_other_connection_ids(self):
+        started, release = threading.Event(), threading.Event()
+
+        def make_pool(pool_name, pool_size, **info):
+            if info["database"] == "slow":
+                # Stands in for connect timeouts against an unreachable server
+                started.set()
+                release.wait(5)
+            return mock.Mock(name=pool_name)
+
+        with mock.patch.object(m.pooling, "MySQLConnectionPool", side_effect=make_pool):
+            slow = threading.Thread(
+                target=m._get_connection_pool, args=("slow", {"database": "slow"})
+            )
+            slow.start()
+            self.assertTrue(started.wait(5))
+            fast = m._get_connection_pool("fast", {"database": "fast"})
+            self.assertNotIn("slow", m._pools)
+            release.set()
+            slow.join(5)
+
+        self.assertIs(m._pools["fast"], fast)
+        self.assertIn("slow", m._pools)
+
+    def test_get_db_connection_unpooled_bypasses_pool(self):
+        cfg = {"server_infos": {"good": {"database": "testdb", "user": "u"}}}
+        mock_conn = mock.Mock(name="MySQLConnection")
+
+        with mock.patch.object(m, "config", cfg), mock.patch.object(
+            m.pooling, "MySQLConnectionPool"
+        ) as pool_cls, mock.patch.object(
+            m.connector, "connect", return_value=mock_conn
+        ) as connect_mock:
+            conn = m._get_db_connection("good", pooled=False)
+
+        self.assertIs(conn, mock_conn)
+        connect_mock.assert_called_once_with(**cfg["server_infos"]["good"])
+        pool_cls.assert_not_called()
+        self.assertNotIn("good", m._pools)
+
     def test_get_db_connection_connect_failure_wrapped(self):
         cfg = {"server_infos": {"good": {"database": "testdb", "user": "u"}}}
         with mock.patch.object(m, "config", cfg), mock.patch.object(
-            m.connector, "connect", side_effect=RuntimeError("driver down")
+            m.pooling, "MySQLConnectionPool", side_effect=RuntimeError("driver down")
         ):
             with self.assertRaises(m.DatabaseConnectionError) as ctx:
                 m._get_db_connection("good")
         self.assertIn("Connection failed with error: driver down", str(ctx.exception))
+        # A pool that failed to connect is not kept, so the next call retries
+        self.assertNotIn("good", m._pools)
 
     def test_get_db_connection_config_error_msg_not_none_raises(self):
         error_msg = json.dumps({"error": "Config failed"})
@@ -336,6 +483,34 @@ class TestDbConnectionUtilities(unittest.TestCase):
                     raise ValueError("boom")
             mock_conn.close.assert_called_once()
 
+    def test_get_database_connection_cm_keeps_error_when_pooled_close_fails(self):
+        # A pooled close resets the session, which raises once the connection has died
+        mock_conn = mock.Mock(name="PooledMySQLConnection")
+        mock_conn.close.side_effect = m.connector.errors.OperationalError(
+            "MySQL Connection not available."
+        )
+        with mock.patch.object(m, "_get_db_connection", return_value=mock_conn):
+            with self.assertRaisesRegex(RuntimeError, "Lost connection"):
+                with m._get_database_connection_cm("any"):
+                    raise RuntimeError("Lost connection to MySQL server")
+        mock_conn.close.assert_called_once()
+
+    def test_execute_sql_tool_returns_driver_error_when_pooled_close_fails(self):
+        mock_conn = mock.MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.execute.side_effect = m.connector.errors.OperationalError(
+            "Lost connection to MySQL server during query"
+        )
+        mock_conn.close.side_effect = m.connector.errors.OperationalError(
+            "MySQL Connection not available."
+        )
+
+        with mock.patch.object(m, "_get_db_connection", return_value=mock_conn):
+            out = m._execute_sql_tool("good_conn", "SELECT 1")
+
+        self.assertIn("Lost connection", json.loads(out)["error"])
+        mock_conn.close.assert_called_once()
+
 
 class TestListAllConnections(unittest.TestCase):
     def test_list_all_connections_config_error_msg_not_none(self):
@@ -348,7 +523,7 @@ class TestListAllConnections(unittest.TestCase):
         cfg = {"server_infos": {"conn1": {"database": "db1"}, "conn2": {"database": "db2"}}}
 
         @contextlib.contextmanager
-        def ok_cm(_cid):
+        def ok_cm(_cid, pooled=True):
             yield None
 
         with mock.patch.object(
@@ -375,7 +550,7 @@ class TestListAllConnections(unittest.TestCase):
         cfg = {"server_infos": {"good": {"database": "db"}, "bad": {"database": "db"}}}
 
         @contextlib.contextmanager
-        def mixed_cm(cid):
+        def mixed_cm(cid, pooled=True):
             if cid == "bad":
                 raise RuntimeError("boom")
             yield None
@@ -408,7 +583,7 @@ class TestListAllConnections(unittest.TestCase):
     def test_list_all_connections_all_invalid_mocked(self):
         cfg = {"server_infos": {"k1": {"database": "db"}, "k2": {"database": "db"}}}
 
-        def failing_cm(_cid):
+        def failing_cm(_cid, pooled=True):
             raise m.DatabaseConnectionError("cannot connect")
 
         with mock.patch.object(
@@ -433,6 +608,34 @@ class TestListAllConnections(unittest.TestCase):
         self.assertEqual(payload["valid keys"], [])
         self.assertEqual(payload["invalid keys"], [])
 
+    def test_list_all_connections_preserves_config_order_mocked(self):
+        cfg = {"server_infos": {f"conn{i}": {"database": "db"} for i in range(8)}}
+
+        @contextlib.contextmanager
+        def odd_fails_cm(cid, pooled=True):
+            # Probes check reachability on a dedicated connection, never the pool
+            self.assertFalse(pooled)
+            if int(cid[len("conn"):]) % 2:
+                raise RuntimeError("down")
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=odd_fails_cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ):
+            out = src_module.list_all_connections()
+
+        payload = json.loads(out)
+        self.assertEqual(
+            [v["key"] for v in payload["valid keys"]], ["conn0", "conn2", "conn4", "conn6"]
+        )
+        self.assertEqual(
+            [x["key"] for x in payload["invalid keys"]], ["conn1", "conn3", "conn5", "conn7"]
+        )
+
     def test_list_all_connections_real_json_and_at_least_one_valid(self):
         out = src_module.list_all_connections()
         self.assertIsInstance(out, str)
@@ -488,6 +691,7 @@ class TestExecuteSqlTool(unittest.TestCase):
         mock_cursor_cm = mock.MagicMock()
         mock_cursor = mock_cursor_cm.__enter__.return_value
         mock_cursor.description = None  # no rows
+        mock_cursor.with_rows = False
         mock_cursor.nextset.return_value = None
         mock_conn = mock.MagicMock()
         mock_conn.cursor.return_value = mock_cursor_cm
@@ -502,6 +706,7 @@ class TestExecuteSqlTool(unittest.TestCase):
         mock_cursor_cm = mock.MagicMock()
         mock_cursor = mock_cursor_cm.__enter__.return_value
         mock_cursor.description = None  # No result set -> JSON null
+        mock_cursor.with_rows = False
         mock_cursor.nextset.return_value = None
         mock_conn.cursor.return_value = mock_cursor_cm
 
@@ -524,7 +729,8 @@ class TestExecuteSqlTool(unittest.TestCase):
         mock_conn.cursor.return_value = mock_cursor_cm
         mock_cursor = mock_cursor_cm.__enter__.return_value
         mock_cursor.description = [("col",)]  # Indicate a result set
-        mock_cursor.fetchall.return_value = [[1]]  # JSON-serializable rows
+        mock_cursor.with_rows = True
+        mock_cursor.fetchmany.side_effect = [[(1,)], []]  # one batch, then exhausted
         mock_cursor.nextset.return_value = None
         mock_conn.cursor.return_value = mock_cursor_cm
 
@@ -537,6 +743,24 @@ class TestExecuteSqlTool(unittest.TestCase):
         self.assertEqual(json.loads(out), [[1]])
         mock_conn.close.assert_called_once()
 
+    def test_execute_sql_tool_streams_batches_across_result_sets(self):
+        mock_conn = mock.MagicMock()
+        mock_cursor_cm = mock.MagicMock()
+        mock_cursor = mock_cursor_cm.__enter__.return_value
+        mock_cursor.with_rows = True
+        # First result set spans two batches, second result set is a single batch
+        mock_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], [], [(4,)], []]
+        mock_cursor.nextset.side_effect = [True, None]
+        mock_conn.cursor.return_value = mock_cursor_cm
+
+        out = src_module._execute_sql_tool(mock_conn, "SELECT 1; SELECT 2;")
+
+        self.assertFalse(src_module.check_error(out))
+        self.assertEqual(json.loads(out), [[1], [2], [3], [4]])
+        mock_cursor.fetchmany.assert_called_with(src_module.FETCH_BATCH_SIZE)
+        # Only row-returning statements ran, so there is nothing to commit
+        mock_conn.commit.assert_not_called()
+
     def test_execute_sql_tool_by_connection_id_wrapper_delegates(self):
         with mock.patch.object(
             src_module, "_execute_sql_tool", return_value="[]"
@@ -577,21 +801,15 @@ class TestMlGenerate(unittest.TestCase):
     def test_ml_generate_returns_plain_text_on_success(self):
         # Simulate SELECT sys.ML_GENERATE returning a single-row JSON string with {"text": "..."}
         row = json.dumps({"text": "hello world"})
-        with mock.patch.object(
-            src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([[row]]),
-        ):
+        with mock.patch.object(src_module, "_execute_sql_scalar", return_value=row):
             out = src_module.ml_generate("any", "Q")
         self.assertFalse(src_module.check_error(out))
         self.assertIsInstance(out, str)
         self.assertEqual(out, "hello world")
 
-    def test_ml_generate_propagates_error_when_check_error_true(self):
+    def test_ml_generate_propagates_driver_error(self):
         with mock.patch.object(
-            src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps({"error": "forced"}),
+            src_module, "_execute_sql_scalar", side_effect=Exception("forced")
         ):
             out = src_module.ml_generate("any", "Q")
         self.assertTrue(src_module.check_error(out))
@@ -599,11 +817,9 @@ class TestMlGenerate(unittest.TestCase):
         self.assertIn("Error with ML_GENERATE", payload["error"])
 
     def test_ml_generate_unexpected_format_when_non_json_string_in_row(self):
-        # fetch_one will succeed but json.loads(response_data) will fail
+        # The scalar fetch succeeds but decoding the response fails
         with mock.patch.object(
-            src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([["not-json"]]),
+            src_module, "_execute_sql_scalar", return_value="not-json"
         ):
             out = src_module.ml_generate("any", "Q")
         self.assertTrue(src_module.check_error(out))
@@ -612,22 +828,17 @@ class TestMlGenerate(unittest.TestCase):
     def test_ml_generate_unexpected_format_when_missing_text_key(self):
         # JSON string but missing "text" key -> KeyError -> caught -> error JSON
         row = json.dumps({"not_text": "value"})
-        with mock.patch.object(
-            src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([[row]]),
-        ):
+        with mock.patch.object(src_module, "_execute_sql_scalar", return_value=row):
             out = src_module.ml_generate("any", "Q")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("Unexpected response format", json.loads(out)["error"])
 
     def test_ml_generate_unexpected_format_when_wrong_rowcount(self):
-        # fetch_one raises due to wrong row count -> caught -> error JSON
-        row = json.dumps({"text": "ignored"})
+        # _execute_sql_scalar raises ValueError on a wrong row count -> caught -> error JSON
         with mock.patch.object(
             src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([[row], [row]]),
+            "_execute_sql_scalar",
+            side_effect=ValueError("Unexpected response invalid number of rows"),
         ):
             out = src_module.ml_generate("any", "Q")
         self.assertTrue(src_module.check_error(out))
@@ -764,12 +975,12 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
             {"name": "file:///secure/path/doc1.pdf"},
             {"name": "file:///secure/path/sub/doc2.txt"},
         ]
-        execute_result = json.dumps([[json.dumps(files_payload)]])
+        execute_result = json.dumps(files_payload)
 
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
         ), mock.patch.object(
-            src_module, "_execute_sql_tool", return_value=execute_result
+            src_module, "_execute_sql_scalar", return_value=execute_result
         ):
             out = src_module.list_vector_store_files_local("cid")
 
@@ -789,26 +1000,24 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
         self.assertIn("not MySQL AI", json.loads(out)["error"])
 
     def test_list_vector_store_files_local_malformed_result_mocked(self):
-        # Cause fetch_one to raise (e.g., unexpected rowcount)
+        # Cause the scalar fetch to raise (e.g., unexpected rowcount)
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
         ), mock.patch.object(
             src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([["x"], ["y"]]),
+            "_execute_sql_scalar",
+            side_effect=ValueError("Unexpected response invalid number of rows"),
         ):
             out = src_module.list_vector_store_files_local("cid")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("Error with LIST_FILES", json.loads(out)["error"])
 
     def test_list_vector_store_files_local_bad_json_payload_mocked(self):
-        # fetch_one returns a string that isn't JSON -> json.loads fails -> caught -> error JSON
+        # The scalar fetch returns a string that isn't JSON -> decoding fails -> caught -> error JSON
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
         ), mock.patch.object(
-            src_module,
-            "_execute_sql_tool",
-            return_value=json.dumps([["not-json"]]),
+            src_module, "_execute_sql_scalar", return_value="not-json"
         ):
             out = src_module.list_vector_store_files_local("cid")
         self.assertTrue(src_module.check_error(out))
@@ -825,160 +1034,105 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
 
 
 class TestAskMlRagHelper(unittest.TestCase):
-    def test_success_path_returns_scalar_string(self):
-        # Capture the connection object to ensure it is passed to _execute_sql_tool
-        captured = {}
+    def _mock_connection(self, response_row=("final-answer",), fail_on=None):
+        # One cursor shared by SET @options, CALL sys.ML_RAG and SELECT @response
+        cursor = mock.MagicMock()
+        cursor.with_rows = False
+        cursor.nextset.return_value = None
+        cursor.fetchone.return_value = response_row
+
+        def execute(sql, params=None):
+            if fail_on is not None and sql.startswith(fail_on):
+                raise RuntimeError(f"{fail_on} failed")
+
+        cursor.execute.side_effect = execute
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
 
         @contextlib.contextmanager
         def cm(_cid):
-            conn = object()
-            captured["conn"] = conn
             yield conn
 
-        calls = []
+        return cm, cursor
 
-        def exec_side_effect(conn, sql, params=None):
-            # Validate the same connection object is used for all calls
-            self.assertIs(conn, captured["conn"])
-            calls.append((sql, params))
-            if sql.startswith("SET @options"):
-                return json.dumps(None)
-            if sql.startswith("CALL sys.ML_RAG"):
-                # Ensure question param is passed
-                self.assertEqual(params, ["What is up?"])
-                return json.dumps(None)
-            if sql.startswith("SELECT @response"):
-                # Single-row scalar string that fetch_one should return directly
-                return json.dumps([["final-answer"]])
-            self.fail(f"Unexpected SQL: {sql}")
+    def _executed_sql(self, cursor):
+        return [c.args[0] for c in cursor.execute.call_args_list]
 
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
+    def test_success_path_returns_scalar_string(self):
+        cm, cursor = self._mock_connection()
+
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
             out = m._ask_ml_rag_helper(
-                "cid", "What is up?", "JSON_OBJECT('skip_generate', true)"
+                "cid", "What is up?", '{"skip_generate": true}'
             )
 
         self.assertFalse(m.check_error(out))
         self.assertEqual(out, "final-answer")
-        # Ensure expected sequence of calls
-        self.assertEqual(len(calls), 3)
-        self.assertTrue(calls[0][0].startswith("SET @options"))
-        self.assertTrue(calls[1][0].startswith("CALL sys.ML_RAG"))
-        self.assertTrue(calls[2][0].startswith("SELECT @response"))
+        # Ensure expected sequence of statements on the one cursor
+        executed = self._executed_sql(cursor)
+        self.assertEqual(len(executed), 3)
+        self.assertTrue(executed[0].startswith("SET @options"))
+        self.assertTrue(executed[1].startswith("CALL sys.ML_RAG"))
+        self.assertTrue(executed[2].startswith("SELECT @response"))
+        self.assertEqual(
+            cursor.execute.call_args_list[1].args[1],
+            ["What is up?", '{"skip_generate": true}'],
+        )
 
     def test_set_options_error_short_circuit(self):
-        @contextlib.contextmanager
-        def cm(_cid):
-            yield object()
+        cm, cursor = self._mock_connection(fail_on="SET @options")
 
-        def exec_side_effect(conn, sql, params=None):
-            if sql.startswith("SET @options"):
-                return json.dumps({"error": "failed to set options"})
-            self.fail("Subsequent calls should not execute when set fails")
-
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
-            out = m._ask_ml_rag_helper("cid", "Q", "JSON_OBJECT('skip_generate', true)")
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
+            out = m._ask_ml_rag_helper("cid", "Q", '{"skip_generate": true}')
 
         self.assertTrue(m.check_error(out))
         self.assertIn("Error with ML_RAG", json.loads(out)["error"])
+        self.assertEqual(len(self._executed_sql(cursor)), 1)
 
     def test_ml_rag_call_error_short_circuit(self):
-        @contextlib.contextmanager
-        def cm(_cid):
-            yield object()
-
-        def exec_side_effect(conn, sql, params=None):
-            if sql.startswith("SET @options"):
-                return json.dumps(None)
-            if sql.startswith("CALL sys.ML_RAG"):
-                return json.dumps({"error": "ml_rag failed"})
-            self.fail("SELECT @response should not be called")
+        cm, cursor = self._mock_connection(fail_on="CALL sys.ML_RAG")
 
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
-            out = m._ask_ml_rag_helper("cid", "Q", "JSON_OBJECT('skip_generate', true)")
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
+            out = m._ask_ml_rag_helper("cid", "Q", '{"skip_generate": true}')
 
         self.assertTrue(m.check_error(out))
         self.assertIn("Error with ML_RAG", json.loads(out)["error"])
+        self.assertEqual(len(self._executed_sql(cursor)), 2)
+        cursor.fetchone.assert_not_called()
 
     def test_fetch_response_error_short_circuit(self):
-        @contextlib.contextmanager
-        def cm(_cid):
-            yield object()
+        cm, cursor = self._mock_connection(fail_on="SELECT @response")
 
-        def exec_side_effect(conn, sql, params=None):
-            if sql.startswith("SET @options"):
-                return json.dumps(None)
-            if sql.startswith("CALL sys.ML_RAG"):
-                return json.dumps(None)
-            if sql.startswith("SELECT @response"):
-                return json.dumps({"error": "fetch failed"})
-            self.fail("Unexpected SQL")
-
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
-            out = m._ask_ml_rag_helper("cid", "Q", "JSON_OBJECT('skip_generate', true)")
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
+            out = m._ask_ml_rag_helper("cid", "Q", '{"skip_generate": true}')
 
         self.assertTrue(m.check_error(out))
         self.assertIn("Error with ML_RAG", json.loads(out)["error"])
+        cursor.fetchone.assert_not_called()
 
-    def test_unexpected_response_format_from_fetch_one(self):
-        @contextlib.contextmanager
-        def cm(_cid):
-            yield object()
+    def test_unexpected_response_format_when_no_row(self):
+        cm, _cursor = self._mock_connection(response_row=None)
 
-        def exec_side_effect(conn, sql, params=None):
-            if sql.startswith("SET @options"):
-                return json.dumps(None)
-            if sql.startswith("CALL sys.ML_RAG"):
-                return json.dumps(None)
-            if sql.startswith("SELECT @response"):
-                # Multiple rows -> fetch_one should raise and be caught
-                return json.dumps([["x"], ["y"]])
-            self.fail("Unexpected SQL")
-
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
-            out = m._ask_ml_rag_helper("cid", "Q", "JSON_OBJECT('skip_generate', true)")
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
+            out = m._ask_ml_rag_helper("cid", "Q", '{"skip_generate": true}')
 
         self.assertTrue(m.check_error(out))
         self.assertIn("Unexpected response format", json.loads(out)["error"])
 
     def test_passes_correct_options_and_params(self):
-        # Verifies that options_json_str is embedded in the CALL statement and question is passed as param
-        @contextlib.contextmanager
-        def cm(_cid):
-            yield object()
-
-        observed = {"rag_sql": None, "rag_params": None}
+        # Verifies that the question and options_json_str are both passed as bind params
+        cm, cursor = self._mock_connection(response_row=("ok",))
 
-        def exec_side_effect(conn, sql, params=None):
-            if sql.startswith("SET @options"):
-                return json.dumps(None)
-            if sql.startswith("CALL sys.ML_RAG"):
-                observed["rag_sql"] = sql
-                observed["rag_params"] = params
-                return json.dumps(None)
-            if sql.startswith("SELECT @response"):
-                return json.dumps([["ok"]])
-            self.fail("Unexpected SQL")
-
-        options = "JSON_OBJECT('skip_generate', true, 'extra', 1)"
-        with mock.patch.object(
-            m, "_get_database_connection_cm", new=cm
-        ), mock.patch.object(m, "_execute_sql_tool", side_effect=exec_side_effect):
+        options = '{"skip_generate": true, "extra": 1}'
+        with mock.patch.object(m, "_get_database_connection_cm", new=cm):
             out = m._ask_ml_rag_helper("cid", "my-question", options)
 
         self.assertEqual(out, "ok")
-        self.assertIsNotNone(observed["rag_sql"])
-        self.assertIn(options, observed["rag_sql"])
-        self.assertEqual(observed["rag_params"], ["my-question"])
+        rag_sql, rag_params = cursor.execute.call_args_list[1].args
+        # Options are bound, never interpolated into the statement
+        self.assertIn("CAST(%s AS JSON)", rag_sql)
+        self.assertNotIn("extra", rag_sql)
+        self.assertEqual(rag_params, ["my-question", options])
 
 
 class TestAskMlRagVectorStore(unittest.TestCase):
@@ -1073,10 +1227,14 @@ class TestAskMlRagInnoDB(unittest.TestCase):
         self.assertEqual(out, "ok")
         self.assertEqual(observed["conn"], "cid")
         self.assertEqual(observed["question"], "Find docs")
-        self.assertIn("JSON_OBJECT('skip_generate', true", observed["options"])
-        self.assertIn("'vector_store_columns'", observed["options"])
-        self.assertIn("'segment', 'body'", observed["options"])
-        self.assertIn("'segment_embedding', 'embedding'", observed["options"])
+        self.assertEqual(
+            json.loads(observed["options"]),
+            {
+                "skip_generate": True,
+                "n_citations": src_module.DEFAULT_CONTEXT_SIZE,
+                "vector_store_columns": {"segment": "body", "segment_embedding": "embedding"},
+            },
+        )
 
     def test_helper_error_bubbles_as_error_json(self):
         with mock.patch.object(
@@ -1159,9 +1317,11 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
                 self.autocommit = False
 
         fake_conn = FakeConn()
+        cm_pooled = []
 
         @contextlib.contextmanager
-        def cm(_cid):
+        def cm(_cid, pooled=True):
+            cm_pooled.append(pooled)
             yield fake_conn
 
         with mock.patch.object(
@@ -1177,8 +1337,10 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
         self.assertIsInstance(out, str)
         self.assertFalse(m.check_error(out))
         self.assertIsNone(json.loads(out))
-        # autocommit should be turned on before calling the procedure
+        # autocommit should be turned on before calling the procedure, on a
+        # dedicated connection so it doesn't stick to a pooled one
         self.assertTrue(fake_conn.autocommit)
+        self.assertEqual(cm_pooled, [False])
         # Ensure correct call with prefixed file path
         exec_mock.assert_called_once()
         args, kwargs = exec_mock.call_args
@@ -1199,7 +1361,7 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
                 self.autocommit = False
 
         @contextlib.contextmanager
-        def cm(_cid):
+        def cm(_cid, pooled=True):
             yield FakeConn()
 
         with mock.patch.object(
@@ -1222,7 +1384,7 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
                 self.autocommit = False
 
         @contextlib.contextmanager
-        def cm(_cid):
+        def cm(_cid, pooled=True):
             events["entered"] = True
             try:
                 yield FakeConn()
@@ -1246,6 +1408,11 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
 
 
 class TestOciTools(unittest.TestCase):
+    def setUp(self):
+        src_module._compartments_cache = None
+
+    def tearDown(self):
+        src_module._compartments_cache = None
 
     def test_list_all_compartments_unavailable(self):
         with mock.patch.object(src_module, "oci_error_msg", "error message"):
@@ -1352,13 +1519,20 @@ class TestOciTools(unittest.TestCase):
             mock.patch.object(src_module, "oci_error_msg", None):
             result = src_module.list_all_compartments()
 
-        # Result is a stringified dict; assert expected substrings
-        self.assertIn("CompA", result)
-        self.assertIn("ocid1.compartment.oc1..compa", result)
-        self.assertIn("'object_storage': True", result)
-        self.assertIn("'databases': False", result)
-        # No error strings expected when object storage succeeds
-        self.assertNotIn("Object Storage:", result)
+        # Result is a JSON-encoded report keyed by compartment name
+        report = json.loads(result)
+        self.assertEqual(
+            report,
+            {
+                "CompA": {
+                    "compartment_id": "ocid1.compartment.oc1..compa",
+                    "object_storage": True,
+                    "databases": False,
+                    # No error strings expected when object storage succeeds
+                    "errors": [],
+                }
+            },
+        )
 
     def test_list_all_compartments_access_report_records_errors_on_object_storage_failure(self):
         mock_oci_info = mock.MagicMock()
@@ -1380,10 +1554,39 @@ class TestOciTools(unittest.TestCase):
             mock.patch.object(src_module, "oci_error_msg", None):
             result = src_module.list_all_compartments()
 
-        self.assertIn("CompB", result)
-        self.assertIn("ocid1.compartment.oc1..compb", result)
-        self.assertIn("'object_storage': False", result)
-        self.assertIn("Object Storage: boom ns", result)
+        report = json.loads(result)
+        self.assertEqual(report["CompB"]["compartment_id"], "ocid1.compartment.oc1..compb")
+        self.assertFalse(report["CompB"]["object_storage"])
+        self.assertEqual(report["CompB"]["errors"], ["Object Storage: boom ns"])
+
+    def test_verify_compartment_access_fetches_namespace_once(self):
+        compartments = []
+        for i in range(5):
+            compartment = mock.MagicMock()
+            compartment.name = f"Comp{i}"
+            compartment.id = f"ocid1.compartment.oc1..c{i}"
+            compartments.append(compartment)
+
+        def list_buckets(namespace_name, compartment_id):
+            self.assertEqual(namespace_name, "ns")
+            if compartment_id.endswith("c3"):
+                raise Exception("denied")
+            return mock.MagicMock()
+
+        mock_oci_info = mock.MagicMock()
+        mock_oci_info.object_storage_client.get_namespace.return_value.data = "ns"
+        mock_oci_info.object_storage_client.list_buckets.side_effect = list_buckets
+
+        with mock.patch.object(src_module, "oci_info", mock_oci_info):
+            report = src_module.verify_compartment_access(compartments)
+
+        mock_oci_info.object_storage_client.get_namespace.assert_called_once()
+        self.assertEqual(list(report), [c.name for c in compartments])
+        self.assertEqual(
+            [report[c.name]["object_storage"] for c in compartments],
+            [True, True, True, False, True],
+        )
+        self.assertEqual(report["Comp3"]["errors"], ["Object Storage: denied"])
 
     # ---- object_storage_list_buckets error: missing compartment id ----
     def test_object_storage_list_buckets_missing_compartmentid(self):
@@ -1489,6 +1692,25 @@ class TestOciTools(unittest.TestCase):
 
         self.assertIn("bucket1", result)
 
+    def test_get_compartment_by_name_lists_compartments_once(self):
+        fake_compartment = mock.MagicMock()
+        fake_compartment.name = "MySQL-GenAI"
+        root = mock.MagicMock()
+        root.name = "tenancy"
+
+        mock_oci_info = mock.MagicMock()
+        mock_oci_info.identity_client.list_compartments.return_value.data = [fake_compartment]
+        mock_oci_info.identity_client.get_compartment.return_value.data = root
+
+        with mock.patch.object(src_module, "oci_info", mock_oci_info), \
+            mock.patch.object(src_module, "oci_error_msg", None):
+            self.assertIs(src_module._get_compartment_by_name("mysql-genai"), fake_compartment)
+            self.assertIs(src_module._get_compartment_by_name("TENANCY"), root)
+            self.assertIsNone(src_module._get_compartment_by_name("missing"))
+
+        mock_oci_info.identity_client.list_compartments.assert_called_once()
+        mock_oci_info.identity_client.get_compartment.assert_called_once()
+
     # ---- object_storage_list_objects success/minimal set ----
     def test_object_storage_list_objects_success(self):
         mock_oci_info = mock.MagicMock()
@@ -1640,7 +1862,7 @@ class TestHeatwaveAskHelp(unittest.TestCase):
     def test_heatwave_ask_help_success_mocked(self):
         # Mode must be OCI and NL2ML returns a single-row scalar JSON string
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
-             mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps([[json.dumps({"text": "ok"})]])):
+             mock.patch.object(src_module, "_execute_sql_scalar", return_value=json.dumps({"text": "ok"})):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertFalse(src_module.check_error(out))
         self.assertIsInstance(out, str)
@@ -1654,17 +1876,17 @@ class TestHeatwaveAskHelp(unittest.TestCase):
         self.assertIn("does not support NL2ML", json.loads(out)["error"])
 
     def test_heatwave_ask_help_execute_returns_error_mocked(self):
-        # If the NL2ML call returns an error JSON, it should be surfaced
+        # If the NL2ML call fails, the driver error should be surfaced
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
-             mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps({"error": "forced"})):
+             mock.patch.object(src_module, "_execute_sql_scalar", side_effect=Exception("forced")):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("forced", json.loads(out)["error"])
 
     def test_heatwave_ask_help_unexpected_rowcount_error_mocked(self):
-        # Multiple rows cause fetch_one to raise; tool should return an NL2ML error JSON
+        # Multiple rows cause the scalar fetch to raise; tool should return an NL2ML error JSON
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
-             mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps([["x"], ["y"]])):
+             mock.patch.object(src_module, "_execute_sql_scalar", side_effect=ValueError("invalid number of rows")):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("Error with NL2ML", json.loads(out)["error"])
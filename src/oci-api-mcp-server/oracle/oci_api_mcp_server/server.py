@@ -7,9 +7,11 @@ https://oss.oracle.com/licenses/upl.
 import json
 import os
 import subprocess
+from importlib.util import find_spec
 from logging import Logger
 from typing import Annotated
 
+import anyio
 import oci
 from fastmcp import FastMCP
 from oracle.oci_api_mcp_server import __project__, __version__
@@ -172,7 +174,9 @@ def run_oci_command(
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
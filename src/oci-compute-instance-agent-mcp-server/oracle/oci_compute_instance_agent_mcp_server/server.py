@@ -4,10 +4,13 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Annotated
 
+import anyio
 import oci
 from fastmcp import FastMCP
 from oci.compute_instance_agent.models import (
@@ -21,16 +24,19 @@ from oci.compute_instance_agent.models import (
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP(name=__project__)
 
 
+# ~/.oci/config is parsed once per profile, not on every client build
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
 def get_compute_instance_agent_client():
-    logger.info("entering get_compute_instance_agent_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
 
     user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
@@ -134,7 +140,9 @@ def list_instance_agent_commands(compartment_id: str, instance_id: str) -> list[
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
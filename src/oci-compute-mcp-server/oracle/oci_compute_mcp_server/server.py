@@ -4,11 +4,17 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
-from typing import Annotated
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Annotated, Any
 
+import anyio
 import oci
+import orjson
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 from oracle.oci_compute_mcp_server.models import (
     Image,
@@ -18,33 +24,108 @@ from oracle.oci_compute_mcp_server.models import (
     map_instance,
     map_response,
 )
+from pydantic import BaseModel
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
-mcp = FastMCP(name=__project__)
+logger = logging.getLogger(__name__)
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
 
-def get_compute_client():
-    logger.info("entering get_compute_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    token = None
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+# orjson encodes the large list results several times faster than FastMCP's
+# default pydantic_core serializer; FastMCP falls back to the default if it fails
+def serialize_result(data: Any) -> str:
+    return orjson.dumps(data, default=_jsonable, option=orjson.OPT_UTC_Z).decode()
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan, tool_serializer=serialize_result)
+
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
+
+
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.core.ComputeClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
+
+
+@lru_cache(maxsize=1)
+def _create_compute_client() -> oci.core.ComputeClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.core.ComputeClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_compute_client() -> oci.core.ComputeClient:
+    client = _create_compute_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
 
 
 @mcp.tool(description="List Instances in a given compartment")
-def list_instances(
+async def list_instances(
     compartment_id: Annotated[str, "The OCID of the compartment"],
     limit: Annotated[
         int,
@@ -57,6 +138,9 @@ def list_instances(
         "'MOVING', 'PROVISIONING', 'RUNNING', 'STARTING', 'STOPPING', 'STOPPED', "
         "'CREATING_IMAGE', 'TERMINATING', 'TERMINATED'",
     ] = None,
+    display_name: Annotated[
+        str, "The exact display name of the instance to filter on"
+    ] = None,
 ) -> list[Instance]:
     instances: list[Instance] = []
 
@@ -76,8 +160,12 @@ def list_instances(
 
             if lifecycle_state is not None:
                 kwargs["lifecycle_state"] = lifecycle_state
+            if display_name is not None:
+                kwargs["display_name"] = display_name
 
-            response = client.list_instances(**kwargs)
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_instances(**kwargs)
+            )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
 
@@ -95,11 +183,13 @@ def list_instances(
 
 
 @mcp.tool(description="Get Instance with a given instance OCID")
-def get_instance(instance_id: str) -> Instance:
+async def get_instance(instance_id: str) -> Instance:
     try:
         client = get_compute_client()
 
-        response: oci.response.Response = client.get_instance(instance_id=instance_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_instance(instance_id=instance_id)
+        )
         data: oci.core.models.Instance = response.data
         logger.info("Found Instance")
         return map_instance(data)
@@ -121,7 +211,7 @@ DEFAULT_MEMORY_IN_GBS = 12
     description="Create a new instance. "
     "Another word for instance could be compute, server, or virtual machine"
 )
-def launch_instance(
+async def launch_instance(
     compartment_id: Annotated[
         str,
         "This is the ocid of the compartment to create the instance in."
@@ -188,7 +278,9 @@ def launch_instance(
             ),
         )
 
-        response: oci.response.Response = client.launch_instance(launch_details)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.launch_instance(launch_details)
+        )
         data: oci.core.models.Instance = response.data
         logger.info("Launched Instance")
         return map_instance(data)
@@ -199,11 +291,13 @@ def launch_instance(
 
 
 @mcp.tool
-def terminate_instance(instance_id: str) -> Response:
+async def terminate_instance(instance_id: str) -> Response:
     try:
         client = get_compute_client()
 
-        response: oci.response.Response = client.terminate_instance(instance_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.terminate_instance(instance_id)
+        )
         logger.info("Deleted Instance")
         return map_response(response)
 
@@ -215,7 +309,7 @@ def terminate_instance(instance_id: str) -> Response:
 @mcp.tool(
     description="Update instance. " "This may restart the instance so warn the user"
 )
-def update_instance(
+async def update_instance(
     instance_id: Annotated[str, "The ocid of the instance to update"],
     ocpus: Annotated[int, "The total number of cores in the instances"] = None,
     memory_in_gbs: Annotated[
@@ -231,8 +325,10 @@ def update_instance(
             ),
         )
 
-        response: oci.response.Response = client.update_instance(
-            instance_id=instance_id, update_instance_details=update_instance_details
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.update_instance(
+                instance_id=instance_id, update_instance_details=update_instance_details
+            )
         )
         data: oci.core.models.Instance = response.data
         logger.info("Updated Instance")
@@ -246,7 +342,7 @@ def update_instance(
 @mcp.tool(
     description="List images in a given compartment, optionally filtered by operating system"  # noqa
 )
-def list_images(compartment_id: str, operating_system: str = None) -> list[Image]:
+async def list_images(compartment_id: str, operating_system: str = None) -> list[Image]:
     images: list[Image] = []
 
     try:
@@ -257,7 +353,11 @@ def list_images(compartment_id: str, operating_system: str = None) -> list[Image
         next_page: str = None
 
         while has_next_page:
-            response = client.list_images(compartment_id=compartment_id, page=next_page)
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_images(
+                    compartment_id=compartment_id, page=next_page
+                )
+            )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
 
@@ -278,11 +378,13 @@ def list_images(compartment_id: str, operating_system: str = None) -> list[Image
 
 
 @mcp.tool(description="Get Image with a given image OCID")
-def get_image(image_id: str) -> Image:
+async def get_image(image_id: str) -> Image:
     try:
         client = get_compute_client()
 
-        response: oci.response.Response = client.get_image(image_id=image_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_image(image_id=image_id)
+        )
         data: oci.core.models.Image = response.data
         logger.info("Found Image")
         return map_image(data)
@@ -293,7 +395,7 @@ def get_image(image_id: str) -> Image:
 
 
 @mcp.tool(description="Perform the desired action on a given instance")
-def instance_action(
+async def instance_action(
     instance_id: str,
     action: Annotated[
         str,
@@ -303,7 +405,9 @@ def instance_action(
     try:
         client = get_compute_client()
 
-        response: oci.response.Response = client.instance_action(instance_id, action)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.instance_action(instance_id, action)
+        )
         data: oci.core.models.Instance = response.data
         logger.info("Performed instance action")
         return map_instance(data)
@@ -314,7 +418,9 @@ def instance_action(
 
 
 def main() -> None:
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
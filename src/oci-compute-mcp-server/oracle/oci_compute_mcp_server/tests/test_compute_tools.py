@@ -4,11 +4,16 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import os
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, create_autospec, patch
 
 import oci
 import pytest
 from fastmcp import Client
+from fastmcp.tools.tool import default_serializer
+from oracle.oci_compute_mcp_server import server
+from oracle.oci_compute_mcp_server.models import map_instance
 from oracle.oci_compute_mcp_server.server import mcp
 
 
@@ -227,3 +232,87 @@ class TestComputeTools:
 
             assert result["id"] == "instance1"
             assert result["lifecycle_state"] == "STOPPING"
+
+
+class TestComputeClient:
+    @patch("oracle.oci_compute_mcp_server.server.oci.core.ComputeClient")
+    @patch("oracle.oci_compute_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
+    @patch("oracle.oci_compute_mcp_server.server.oci.signer.load_private_key_from_file")
+    @patch("oracle.oci_compute_mcp_server.server.oci.config.from_file")
+    def test_get_compute_client_is_cached(
+        self, mock_config_from_file, mock_load_key, mock_signer, mock_client, tmp_path
+    ):
+        token_file = tmp_path / "token"
+        token_file.write_text("token")
+        mock_config_from_file.return_value = {
+            "key_file": "key.pem",
+            "security_token_file": str(token_file),
+        }
+
+        server._config.cache_clear()
+        server._create_compute_client.cache_clear()
+        server._load_private_key.cache_clear()
+        first = server.get_compute_client()
+        second = server.get_compute_client()
+
+        assert first is second
+        assert first.base_client.session is server._session
+        assert mock_load_key.call_count == 1
+
+        # a refreshed session token swaps the signer on the cached client, the
+        # private key is still the one decoded the first time
+        stat = os.stat(token_file)
+        os.utime(token_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        third = server.get_compute_client()
+
+        assert third is first
+        assert third.base_client.signer is mock_signer.return_value
+        assert mock_signer.call_count == 2
+        assert mock_load_key.call_count == 1
+        assert mock_client.call_count == 1
+        server._config.cache_clear()
+        server._create_compute_client.cache_clear()
+        server._load_private_key.cache_clear()
+
+    @patch("oracle.oci_compute_mcp_server.server._session", None)
+    @patch("oracle.oci_compute_mcp_server.server.oci.core.ComputeClient")
+    @patch("oracle.oci_compute_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
+    @patch("oracle.oci_compute_mcp_server.server.oci.signer.load_private_key_from_file")
+    @patch("oracle.oci_compute_mcp_server.server.oci.config.from_file")
+    def test_get_compute_client_keeps_own_session_without_vendored_requests(
+        self, mock_config_from_file, mock_load_key, mock_signer, mock_client, tmp_path
+    ):
+        token_file = tmp_path / "token"
+        token_file.write_text("token")
+        mock_config_from_file.return_value = {
+            "key_file": "key.pem",
+            "security_token_file": str(token_file),
+        }
+        own_session = mock_client.return_value.base_client.session
+
+        server._config.cache_clear()
+        server._create_compute_client.cache_clear()
+        server._load_private_key.cache_clear()
+        client = server.get_compute_client()
+
+        assert client.base_client.session is own_session
+        server._config.cache_clear()
+        server._create_compute_client.cache_clear()
+        server._load_private_key.cache_clear()
+
+
+class TestSerializeResult:
+    def test_serialize_result_matches_default_serializer(self):
+        instances = [
+            map_instance(
+                oci.core.models.Instance(
+                    id="instance1",
+                    display_name="Instance 1",
+                    lifecycle_state="RUNNING",
+                    time_created=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                    freeform_tags={"team": "a"},
+                )
+            )
+        ]
+
+        assert server.serialize_result(instances) == default_serializer(instances)
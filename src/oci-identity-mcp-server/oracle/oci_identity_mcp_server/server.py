@@ -7,33 +7,140 @@ https://oss.oracle.com/licenses/upl.
 import base64
 import json
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from importlib.util import find_spec
 
+import anyio
 import oci
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 
 from . import __project__, __version__
 
-mcp = FastMCP(name=__project__)
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
 
-def get_identity_client():
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan)
+
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
+
+
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.identity.IdentityClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
+
+
+@lru_cache(maxsize=1)
+def _create_identity_client() -> oci.identity.IdentityClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.identity.IdentityClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_identity_client() -> oci.identity.IdentityClient:
+    client = _create_identity_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
+
+
+# read-only lookups are cached for a short while, an agent tends to repeat the
+# same query several times within one conversation
+READ_CACHE_TTL = 60
+_read_cache = TTLCache(maxsize=1024, ttl=READ_CACHE_TTL)
+
+
+def read_cached(cache: TTLCache):
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = hashkey(fn.__name__, *args, **kwargs)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            result = await fn(*args, **kwargs)
+            cache[key] = result
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 @mcp.tool
-def list_compartments(tenancy_id: str) -> list[dict]:
+@read_cached(_read_cache)
+async def list_compartments(tenancy_id: str) -> list[dict]:
     identity = get_identity_client()
-    compartments = identity.list_compartments(tenancy_id).data
+    compartments: list[oci.identity.models.Compartment] = []
+    has_next_page = True
+    next_page: str = None
+
+    while has_next_page:
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: identity.list_compartments(tenancy_id, page=next_page)
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        compartments.extend(response.data)
+
     return [
         {
             "id": compartment.id,
@@ -46,9 +153,12 @@ def list_compartments(tenancy_id: str) -> list[dict]:
 
 
 @mcp.tool
-def get_tenancy_info(tenancy_id: str) -> dict:
+@read_cached(_read_cache)
+async def get_tenancy_info(tenancy_id: str) -> dict:
     identity = get_identity_client()
-    tenancy = identity.get_tenancy(tenancy_id).data
+    tenancy = (
+        await anyio.to_thread.run_sync(lambda: identity.get_tenancy(tenancy_id))
+    ).data
     return {
         "id": tenancy.id,
         "name": tenancy.name,
@@ -58,11 +168,14 @@ def get_tenancy_info(tenancy_id: str) -> dict:
 
 
 @mcp.tool(description="Lists all of the availability domains in a given tenancy")
-def list_availability_domains(tenancy_id: str) -> list[dict]:
+@read_cached(_read_cache)
+async def list_availability_domains(tenancy_id: str) -> list[dict]:
     identity = get_identity_client()
     ads: list[oci.identity.models.AvailabilityDomain] = (
-        identity.list_availability_domains(tenancy_id).data
-    )
+        await anyio.to_thread.run_sync(
+            lambda: identity.list_availability_domains(tenancy_id)
+        )
+    ).data
     return [
         {
             "id": ad.id,
@@ -74,13 +187,13 @@ def list_availability_domains(tenancy_id: str) -> list[dict]:
 
 
 @mcp.tool
-def get_current_tenancy() -> dict:
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
+async def get_current_tenancy() -> dict:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE"))
     tenancy_id = config["tenancy"]
     identity = get_identity_client()
-    tenancy = identity.get_tenancy(tenancy_id).data
+    tenancy = (
+        await anyio.to_thread.run_sync(lambda: identity.get_tenancy(tenancy_id))
+    ).data
     return {
         "id": tenancy.id,
         "name": tenancy.name,
@@ -90,9 +203,13 @@ def get_current_tenancy() -> dict:
 
 
 @mcp.tool
-def create_auth_token(user_id: str) -> dict:
+async def create_auth_token(user_id: str) -> dict:
     identity = get_identity_client()
-    token = identity.create_auth_token(user_id=user_id).data
+    token = (
+        await anyio.to_thread.run_sync(
+            lambda: identity.create_auth_token(user_id=user_id)
+        )
+    ).data
     return {
         "token": token.token,
         "description": token.description,
@@ -101,11 +218,9 @@ def create_auth_token(user_id: str) -> dict:
 
 
 @mcp.tool
-def get_current_user() -> dict:
+async def get_current_user() -> dict:
     identity = get_identity_client()
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
+    config = _config(os.getenv("OCI_CONFIG_PROFILE"))
 
     # Prefer explicit user from config if present
     user_id = config.get("user")
@@ -137,7 +252,7 @@ def get_current_user() -> dict:
                 "Unable to determine current user OCID from config or security token"
             )
 
-    user = identity.get_user(user_id).data
+    user = (await anyio.to_thread.run_sync(lambda: identity.get_user(user_id))).data
     return {
         "id": user.id,
         "name": user.name,
@@ -146,7 +261,9 @@ def get_current_user() -> dict:
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -9,9 +9,16 @@ from unittest.mock import MagicMock, create_autospec, patch
 import oci
 import pytest
 from fastmcp import Client
+from oracle.oci_identity_mcp_server import server
 from oracle.oci_identity_mcp_server.server import mcp
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    server._config.cache_clear()
+    server._read_cache.clear()
+
+
 class TestIdentityTools:
     @pytest.mark.asyncio
     @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
@@ -30,6 +37,8 @@ class TestIdentityTools:
                 time_created="1970-01-01T00:00:00",
             )
         ]
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
         mock_client.list_compartments.return_value = mock_list_response
 
         async with Client(mcp) as client:
@@ -4,25 +4,31 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Annotated
 
+import anyio
 import oci
 from fastmcp import FastMCP
 
 from . import __project__
 
-logger = Logger(__name__, level="INFO")
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP(name=__project__)
 
 
+# ~/.oci/config is parsed once per profile, not on every client build
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
 def get_logging_client():
-    logger.info("entering get_logging_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = config["security_token_file"]
@@ -92,7 +98,9 @@ def get_log(
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
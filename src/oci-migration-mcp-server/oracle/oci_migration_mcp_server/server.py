@@ -4,37 +4,104 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from importlib.util import find_spec
 
+import anyio
 import oci
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
-mcp = FastMCP(name=__project__)
+logger = logging.getLogger(__name__)
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
 
-def get_migration_client():
-    logger.info("entering get_migration_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    token = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan)
+
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
+
+
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.cloud_migrations.MigrationClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
+
+
+@lru_cache(maxsize=1)
+def _create_migration_client() -> oci.cloud_migrations.MigrationClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.cloud_migrations.MigrationClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_migration_client() -> oci.cloud_migrations.MigrationClient:
+    client = _create_migration_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
 
 
 @mcp.tool
-def get_migration(migration_id: str) -> dict:
+async def get_migration(migration_id: str) -> dict:
     """
     Get details for a specific Migration Project by OCID.
     Args:
@@ -43,26 +110,49 @@ def get_migration(migration_id: str) -> dict:
         dict: Migration project details.
     """
     client = get_migration_client()
-    return client.get_migration(migration_id).data
+    return (
+        await anyio.to_thread.run_sync(lambda: client.get_migration(migration_id))
+    ).data
 
 
 @mcp.tool
-def list_migrations(compartment_id: str, lifecycle_state: str = None) -> list[dict]:
+async def list_migrations(
+    compartment_id: str,
+    lifecycle_state: str = None,
+    display_name: str = None,
+    limit: int = None,
+) -> list[dict]:
     """
-    List Migration Projects for a compartment, optionally filtered by lifecycle state.
+    List Migration Projects for a compartment, optionally filtered by lifecycle state
+    or display name.
     Args:
         compartment_id (str): OCID of the compartment.
         lifecycle_state (str, optional): Filter by lifecycle state.
+        display_name (str, optional): Filter by exact display name.
+        limit (int, optional): Maximum number of migrations to return.
     Returns:
         list of dict: Each dict is a migration object.
     """
     client = get_migration_client()
-    list_args = {"compartment_id": compartment_id}
+    list_args = {"compartment_id": compartment_id, "limit": limit}
 
     if lifecycle_state is not None:
         list_args["lifecycle_state"] = lifecycle_state
+    if display_name is not None:
+        list_args["display_name"] = display_name
+
+    migrations: list[oci.cloud_migrations.models.MigrationSummary] = []
+    has_next_page = True
+    next_page: str = None
+
+    while has_next_page and (limit is None or len(migrations) < limit):
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.list_migrations(**list_args, page=next_page)
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        migrations.extend(response.data.items)
 
-    migrations = client.list_migrations(**list_args).data.items
     return [
         {
             "id": migration.id,
@@ -79,7 +169,9 @@ def list_migrations(compartment_id: str, lifecycle_state: str = None) -> list[di
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
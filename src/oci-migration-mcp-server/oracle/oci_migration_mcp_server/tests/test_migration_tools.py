@@ -55,6 +55,8 @@ class TestMigrationTools:
                 )
             ]
         )
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
         mock_client.list_migrations.return_value = mock_list_response
 
         async with Client(mcp) as client:
@@ -4,40 +4,179 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
+import logging
 import os
-from logging import Logger
-from typing import Annotated
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Annotated, Any
 
+import anyio
 import oci
+import orjson
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 from oci.monitoring.models import SummarizeMetricsDataDetails
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
-mcp = FastMCP(name=__project__)
+logger = logging.getLogger(__name__)
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+# orjson encodes the large list results several times faster than FastMCP's
+# default pydantic_core serializer; FastMCP falls back to the default if it fails
+def serialize_result(data: Any) -> str:
+    return orjson.dumps(data, default=str, option=orjson.OPT_UTC_Z).decode()
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan, tool_serializer=serialize_result)
+
+OCID_PATTERN = re.compile(r"ocid1\.[a-z0-9_]+\.[a-z0-9_.-]+")
+MQL_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+# MQL templates, only validated values are substituted into them
+METRIC_QUERY = "{metric_name}[{resolution}]{filter_clause}.{aggregation}()"
+RESOURCE_ID_FILTER = '{{resourceId="{instance_id}"}}'
+
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
 
-def get_monitoring_client():
-    logger.info("entering get_monitoring_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    token = None
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.monitoring.MonitoringClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
+
+
+@lru_cache(maxsize=1)
+def _create_monitoring_client() -> oci.monitoring.MonitoringClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.monitoring.MonitoringClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_monitoring_client() -> oci.monitoring.MonitoringClient:
+    client = _create_monitoring_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
+
+
+async def summarize_compute_metric(
+    compartment_id: str,
+    start_time: str,
+    end_time: str,
+    metric_name: str,
+    resolution: str,
+    aggregation: str,
+    instance_id: str = None,
+    compartment_id_in_subtree: bool = False,
+) -> list[dict]:
+    if instance_id and not OCID_PATTERN.fullmatch(instance_id):
+        raise ValueError(f"Invalid instance OCID: {instance_id}")
+    for token in (metric_name, resolution, aggregation):
+        if not MQL_TOKEN_PATTERN.fullmatch(token):
+            raise ValueError(f"Invalid metric query parameter: {token}")
+
+    monitoring_client = get_monitoring_client()
+    namespace = "oci_computeagent"
+    filter_clause = (
+        RESOURCE_ID_FILTER.format(instance_id=instance_id) if instance_id else ""
+    )
+    query = METRIC_QUERY.format(
+        metric_name=metric_name,
+        resolution=resolution,
+        filter_clause=filter_clause,
+        aggregation=aggregation,
+    )
+
+    series_list = (
+        await anyio.to_thread.run_sync(
+            lambda: monitoring_client.summarize_metrics_data(
+                compartment_id=compartment_id,
+                summarize_metrics_data_details=SummarizeMetricsDataDetails(
+                    namespace=namespace,
+                    query=query,
+                    start_time=start_time,
+                    end_time=end_time,
+                    resolution=resolution,
+                ),
+                compartment_id_in_subtree=compartment_id_in_subtree,
+            )
+        )
+    ).data
+
+    return [
+        {
+            "dimensions": getattr(series, "dimensions", None),
+            "datapoints": [
+                {"timestamp": p.timestamp, "value": p.value}
+                for p in getattr(series, "aggregated_datapoints", [])
+            ],
+        }
+        for series in series_list
+    ]
 
 
 @mcp.tool
-def get_compute_metrics(
+async def get_compute_metrics(
     compartment_id: str,
     start_time: str,
     end_time: str,
@@ -66,45 +205,65 @@ def get_compute_metrics(
         "Whether to include metrics from all subcompartments of the specified compartment",
     ] = False,
 ) -> list[dict]:
-    monitoring_client = get_monitoring_client()
-    namespace = "oci_computeagent"
-    filter_clause = f'{{resourceId="{instance_id}"}}' if instance_id else ""
-    query = f"{metricName}[{resolution}]{filter_clause}.{aggregation}()"
-
-    series_list = monitoring_client.summarize_metrics_data(
-        compartment_id=compartment_id,
-        summarize_metrics_data_details=SummarizeMetricsDataDetails(
-            namespace=namespace,
-            query=query,
-            start_time=start_time,
-            end_time=end_time,
-            resolution=resolution,
-        ),
-        compartment_id_in_subtree=compartment_id_in_subtree,
-    ).data
+    return await summarize_compute_metric(
+        compartment_id,
+        start_time,
+        end_time,
+        metricName,
+        resolution,
+        aggregation,
+        instance_id,
+        compartment_id_in_subtree,
+    )
 
-    result: list[dict] = []
-    for series in series_list:
-        dims = getattr(series, "dimensions", None)
-        points = []
-        for p in getattr(series, "aggregated_datapoints", []):
-            points.append(
-                {
-                    "timestamp": getattr(p, "timestamp", None),
-                    "value": getattr(p, "value", None),
-                }
+
+@mcp.tool(
+    description="Get both the CPU and the memory utilization of compute instances. "
+    "Prefer this over two get_compute_metrics calls, the two metrics are fetched "
+    "concurrently"
+)
+async def get_compute_utilization(
+    compartment_id: str,
+    start_time: str,
+    end_time: str,
+    resolution: Annotated[
+        str,
+        "The granularity of the metric. Currently we only support: 1m, 5m, 1h, 1d. Default: 1m.",
+    ] = "1m",
+    aggregation: Annotated[
+        str,
+        "The aggregation for the metric. Currently we only support: "
+        "mean, sum, max, min, count. Default: mean",
+    ] = "mean",
+    instance_id: Annotated[
+        str,
+        "Optional compute instance OCID to filter by " "(maps to resourceId dimension)",
+    ] = None,
+    compartment_id_in_subtree: Annotated[
+        bool,
+        "Whether to include metrics from all subcompartments of the specified compartment",
+    ] = False,
+) -> dict:
+    cpu, memory = await asyncio.gather(
+        *(
+            summarize_compute_metric(
+                compartment_id,
+                start_time,
+                end_time,
+                metric_name,
+                resolution,
+                aggregation,
+                instance_id,
+                compartment_id_in_subtree,
             )
-        result.append(
-            {
-                "dimensions": dims,
-                "datapoints": points,
-            }
+            for metric_name in ("CpuUtilization", "MemoryUtilization")
         )
-    return result
+    )
+    return {"cpu": cpu, "memory": memory}
 
 
 @mcp.tool
-def list_alarms(
+async def list_alarms(
     compartment_id: Annotated[
         str,
         "The ID of the compartment containing the resources"
@@ -112,8 +271,20 @@ def list_alarms(
     ],
 ) -> list[dict]:
     monitoring_client = get_monitoring_client()
-    response = monitoring_client.list_alarms(compartment_id=compartment_id)
-    alarms = response.data
+    alarms: list[oci.monitoring.models.AlarmSummary] = []
+    has_next_page = True
+    next_page: str = None
+
+    while has_next_page:
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: monitoring_client.list_alarms(
+                compartment_id=compartment_id, page=next_page
+            )
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        alarms.extend(response.data)
+
     result = []
     for alarm in alarms:
         result.append(
@@ -130,7 +301,9 @@ def list_alarms(
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, create_autospec, patch
 import oci
 import pytest
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from oracle.oci_monitoring_mcp_server.server import mcp
 
 
@@ -42,7 +43,7 @@ class TestMonitoringTools:
                         "metricName": "CpuUtilization",
                         "resolution": "1m",
                         "aggregation": "mean",
-                        "instance_id": "instance1",
+                        "instance_id": "ocid1.instance.oc1.iad.instance1",
                         "compartment_id_in_subtree": False,
                     },
                 )
@@ -57,6 +58,93 @@ class TestMonitoringTools:
             assert result[0]["datapoints"][0]["timestamp"] == "2023-01-01T00:00:00Z"
             assert result[0]["datapoints"][0]["value"] == pytest.approx(42.0)
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_get_compute_metrics_rejects_invalid_instance_id(
+        self, mock_get_client
+    ):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError):
+                await client.call_tool(
+                    "get_compute_metrics",
+                    {
+                        "compartment_id": "compartment1",
+                        "start_time": "2023-01-01T00:00:00Z",
+                        "end_time": "2023-01-01T01:00:00Z",
+                        "metricName": "CpuUtilization",
+                        "instance_id": 'x"} || CpuUtilization[1m]{resourceId="y',
+                    },
+                )
+
+        mock_client.summarize_metrics_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_get_compute_metrics_rejects_trailing_newline(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        async with Client(mcp) as client:
+            for arguments in (
+                {"instance_id": "ocid1.instance.oc1..instance1\n"},
+                {"metricName": "CpuUtilization\n"},
+            ):
+                with pytest.raises(ToolError):
+                    await client.call_tool(
+                        "get_compute_metrics",
+                        {
+                            "compartment_id": "compartment1",
+                            "start_time": "2023-01-01T00:00:00Z",
+                            "end_time": "2023-01-01T01:00:00Z",
+                            "metricName": "CpuUtilization",
+                            **arguments,
+                        },
+                    )
+
+        mock_client.summarize_metrics_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
+    async def test_get_compute_utilization(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        def summarize_metrics_data(**kwargs):
+            query = kwargs["summarize_metrics_data_details"].query
+            series = MagicMock()
+            series.dimensions = {"resourceId": "instance1"}
+            series.aggregated_datapoints = [
+                MagicMock(
+                    timestamp="2023-01-01T00:00:00Z",
+                    value=10.0 if query.startswith("Cpu") else 20.0,
+                )
+            ]
+            response = create_autospec(oci.response.Response)
+            response.data = [series]
+            return response
+
+        mock_client.summarize_metrics_data.side_effect = summarize_metrics_data
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "get_compute_utilization",
+                    {
+                        "compartment_id": "compartment1",
+                        "start_time": "2023-01-01T00:00:00Z",
+                        "end_time": "2023-01-01T01:00:00Z",
+                        "instance_id": "ocid1.instance.oc1.iad.instance1",
+                    },
+                )
+            ).structured_content
+
+            assert mock_client.summarize_metrics_data.call_count == 2
+            assert result["cpu"][0]["datapoints"][0]["value"] == pytest.approx(10.0)
+            assert result["memory"][0]["datapoints"][0]["value"] == pytest.approx(20.0)
+
     @pytest.mark.asyncio
     @patch("oracle.oci_monitoring_mcp_server.server.get_monitoring_client")
     async def test_list_alarms(self, mock_get_client):
@@ -82,6 +170,8 @@ class TestMonitoringTools:
 
         mock_list_response = create_autospec(oci.response.Response)
         mock_list_response.data = [mock_alarm1, mock_alarm2]
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
         mock_client.list_alarms.return_value = mock_list_response
 
         async with Client(mcp) as client:
@@ -4,11 +4,18 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from importlib.util import find_spec
 from typing import Annotated
 
+import anyio
 import oci
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 from oracle.oci_networking_mcp_server.models import (
     NetworkSecurityGroup,
@@ -25,28 +32,131 @@ from oracle.oci_networking_mcp_server.models import (
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
-mcp = FastMCP(name=__project__)
+logger = logging.getLogger(__name__)
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
 
-def get_networking_client():
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    token = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan)
+
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
+
+
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.core.VirtualNetworkClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
+
+
+@lru_cache(maxsize=1)
+def _create_networking_client() -> oci.core.VirtualNetworkClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.core.VirtualNetworkClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_networking_client() -> oci.core.VirtualNetworkClient:
+    client = _create_networking_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
+
+
+# read-only lookups are cached for a short while, an agent tends to repeat the
+# same query several times within one conversation
+READ_CACHE_TTL = 60
+_read_cache = TTLCache(maxsize=1024, ttl=READ_CACHE_TTL)
+
+
+def read_cached(cache: TTLCache):
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = hashkey(fn.__name__, *args, **kwargs)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            result = await fn(*args, **kwargs)
+            cache[key] = result
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 @mcp.tool
-def list_vcns(compartment_id: str) -> list[Vcn]:
+@read_cached(_read_cache)
+async def list_vcns(
+    compartment_id: str,
+    limit: Annotated[
+        int,
+        "The maximum amount of VCNs to return. If None, there is no limit. "
+        "If the value is not None, then it must be a positive number greater than 0.",
+    ] = None,
+    lifecycle_state: Annotated[
+        str,
+        "The lifecycle state of the VCN to filter on. The values can be: "
+        "'PROVISIONING', 'AVAILABLE', 'TERMINATING', 'TERMINATED', 'UPDATING'",
+    ] = None,
+    display_name: Annotated[
+        str, "The exact display name of the VCN to filter on"
+    ] = None,
+) -> list[Vcn]:
     vcns: list[Vcn] = []
 
     try:
@@ -56,8 +166,21 @@ def list_vcns(compartment_id: str) -> list[Vcn]:
         has_next_page = True
         next_page: str = None
 
-        while has_next_page:
-            response = client.list_vcns(compartment_id=compartment_id, page=next_page)
+        while has_next_page and (limit is None or len(vcns) < limit):
+            kwargs = {
+                "compartment_id": compartment_id,
+                "page": next_page,
+                "limit": limit,
+            }
+
+            if lifecycle_state is not None:
+                kwargs["lifecycle_state"] = lifecycle_state
+            if display_name is not None:
+                kwargs["display_name"] = display_name
+
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_vcns(**kwargs)
+            )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
 
@@ -75,11 +198,14 @@ def list_vcns(compartment_id: str) -> list[Vcn]:
 
 
 @mcp.tool
-def get_vcn(vcn_id: str) -> Vcn:
+@read_cached(_read_cache)
+async def get_vcn(vcn_id: str) -> Vcn:
     try:
         client = get_networking_client()
 
-        response: oci.response.Response = client.get_vcn(vcn_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_vcn(vcn_id)
+        )
         data: oci.core.models.Vcn = response.data
         logger.info("Found Vcn")
         return map_vcn(data)
@@ -90,11 +216,14 @@ def get_vcn(vcn_id: str) -> Vcn:
 
 
 @mcp.tool
-def delete_vcn(vcn_id: str) -> Response:
+async def delete_vcn(vcn_id: str) -> Response:
     try:
         client = get_networking_client()
 
-        response: oci.response.Response = client.delete_vcn(vcn_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.delete_vcn(vcn_id)
+        )
+        _read_cache.clear()
         logger.info("Deleted Vcn")
         return map_response(response)
 
@@ -104,7 +233,7 @@ def delete_vcn(vcn_id: str) -> Response:
 
 
 @mcp.tool
-def create_vcn(compartment_id: str, cidr_block: str, display_name: str) -> Vcn:
+async def create_vcn(compartment_id: str, cidr_block: str, display_name: str) -> Vcn:
     try:
         client = get_networking_client()
 
@@ -114,8 +243,11 @@ def create_vcn(compartment_id: str, cidr_block: str, display_name: str) -> Vcn:
             display_name=display_name,
         )
 
-        response: oci.response.Response = client.create_vcn(vcn_details)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.create_vcn(vcn_details)
+        )
         data: oci.core.models.Vcn = response.data
+        _read_cache.clear()
         logger.info("Created Vcn")
         return map_vcn(data)
 
@@ -125,7 +257,24 @@ def create_vcn(compartment_id: str, cidr_block: str, display_name: str) -> Vcn:
 
 
 @mcp.tool
-def list_subnets(compartment_id: str, vcn_id: str = None) -> list[Subnet]:
+@read_cached(_read_cache)
+async def list_subnets(
+    compartment_id: str,
+    vcn_id: str = None,
+    limit: Annotated[
+        int,
+        "The maximum amount of subnets to return. If None, there is no limit. "
+        "If the value is not None, then it must be a positive number greater than 0.",
+    ] = None,
+    lifecycle_state: Annotated[
+        str,
+        "The lifecycle state of the subnet to filter on. The values can be: "
+        "'PROVISIONING', 'AVAILABLE', 'TERMINATING', 'TERMINATED', 'UPDATING'",
+    ] = None,
+    display_name: Annotated[
+        str, "The exact display name of the subnet to filter on"
+    ] = None,
+) -> list[Subnet]:
     subnets: list[Subnet] = []
 
     try:
@@ -135,9 +284,21 @@ def list_subnets(compartment_id: str, vcn_id: str = None) -> list[Subnet]:
         has_next_page = True
         next_page: str = None
 
-        while has_next_page:
-            response = client.list_subnets(
-                compartment_id=compartment_id, vcn_id=vcn_id, page=next_page
+        while has_next_page and (limit is None or len(subnets) < limit):
+            kwargs = {
+                "compartment_id": compartment_id,
+                "vcn_id": vcn_id,
+                "page": next_page,
+                "limit": limit,
+            }
+
+            if lifecycle_state is not None:
+                kwargs["lifecycle_state"] = lifecycle_state
+            if display_name is not None:
+                kwargs["display_name"] = display_name
+
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_subnets(**kwargs)
             )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
@@ -156,11 +317,14 @@ def list_subnets(compartment_id: str, vcn_id: str = None) -> list[Subnet]:
 
 
 @mcp.tool
-def get_subnet(subnet_id: str) -> Subnet:
+@read_cached(_read_cache)
+async def get_subnet(subnet_id: str) -> Subnet:
     try:
         client = get_networking_client()
 
-        response: oci.response.Response = client.get_subnet(subnet_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_subnet(subnet_id)
+        )
         data: oci.core.models.Subnet = response.data
         logger.info("Found Subnet")
         return map_subnet(data)
@@ -171,7 +335,7 @@ def get_subnet(subnet_id: str) -> Subnet:
 
 
 @mcp.tool
-def create_subnet(
+async def create_subnet(
     vcn_id: str, compartment_id: str, cidr_block: str, display_name: str
 ) -> Subnet:
     try:
@@ -184,8 +348,11 @@ def create_subnet(
             display_name=display_name,
         )
 
-        response: oci.response.Response = client.create_subnet(subnet_details)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.create_subnet(subnet_details)
+        )
         data: oci.core.models.Vcn = response.data
+        _read_cache.clear()
         logger.info("Created Subnet")
         return map_subnet(data)
 
@@ -200,7 +367,7 @@ def create_subnet(
     "If the VCN ID is not provided, then the list includes the security lists from all "
     "VCNs in the specified compartment.",
 )
-def list_security_lists(
+async def list_security_lists(
     compartment_id: Annotated[str, "Compartment ocid"],
     vcn_id: Annotated[str, "VCN ocid"] = None,
 ) -> list[SecurityList]:
@@ -214,8 +381,10 @@ def list_security_lists(
         next_page: str = None
 
         while has_next_page:
-            response = client.list_security_lists(
-                compartment_id=compartment_id, vcn_id=vcn_id, page=next_page
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_security_lists(
+                    compartment_id=compartment_id, vcn_id=vcn_id, page=next_page
+                )
             )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
@@ -234,11 +403,13 @@ def list_security_lists(
 
 
 @mcp.tool(name="get_security_list", description="Gets the security list's information.")
-def get_security_list(security_list_id: Annotated[str, "security list id"]):
+async def get_security_list(security_list_id: Annotated[str, "security list id"]):
     try:
         client = get_networking_client()
 
-        response: oci.response.Response = client.get_security_list(security_list_id)
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_security_list(security_list_id)
+        )
         data: oci.core.models.Subnet = response.data
         logger.info("Found Security List")
         return map_security_list(data)
@@ -254,7 +425,7 @@ def get_security_list(security_list_id: Annotated[str, "security list id"]):
     "a compartmentId, but not both. If you specify a vlanId, all other parameters are "
     "ignored.",
 )
-def list_network_security_groups(
+async def list_network_security_groups(
     compartment_id: Annotated[str, "compartment ocid"],
     vlan_id: Annotated[str, "vlan ocid"] = None,
     vcn_id: Annotated[str, "vcn ocid"] = None,
@@ -269,11 +440,13 @@ def list_network_security_groups(
         next_page: str = None
 
         while has_next_page:
-            response = client.list_network_security_groups(
-                compartment_id=compartment_id,
-                vlan_id=vlan_id,
-                vcn_id=vcn_id,
-                page=next_page,
+            response = await anyio.to_thread.run_sync(
+                lambda: client.list_network_security_groups(
+                    compartment_id=compartment_id,
+                    vlan_id=vlan_id,
+                    vcn_id=vcn_id,
+                    page=next_page,
+                )
             )
             has_next_page = response.has_next_page
             next_page = response.next_page if hasattr(response, "next_page") else None
@@ -294,14 +467,14 @@ def list_network_security_groups(
 @mcp.tool(
     description="Gets the specified network security group's information.",
 )
-def get_network_security_group(
+async def get_network_security_group(
     network_security_group_id: Annotated[str, "nsg id"],
 ):
     try:
         client = get_networking_client()
 
-        response: oci.response.Response = client.get_network_security_group(
-            network_security_group_id
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: client.get_network_security_group(network_security_group_id)
         )
         data: oci.core.models.Subnet = response.data
         logger.info("Found Network Security Group")
@@ -313,7 +486,9 @@ def get_network_security_group(
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -9,9 +9,15 @@ from unittest.mock import MagicMock, create_autospec, patch
 import oci
 import pytest
 from fastmcp import Client
+from oracle.oci_networking_mcp_server import server
 from oracle.oci_networking_mcp_server.server import mcp
 
 
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    server._read_cache.clear()
+
+
 class TestNetworkingTools:
     @pytest.mark.asyncio
     @patch("oracle.oci_networking_mcp_server.server.get_networking_client")
@@ -43,6 +49,37 @@ class TestNetworkingTools:
             assert len(result) == 1
             assert result[0]["id"] == "vcn1"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_networking_mcp_server.server.get_networking_client")
+    async def test_list_vcns_filters_server_side(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_list_response = create_autospec(oci.response.Response)
+        mock_list_response.data = []
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
+        mock_client.list_vcns.return_value = mock_list_response
+
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "list_vcns",
+                {
+                    "compartment_id": "compartment1",
+                    "lifecycle_state": "AVAILABLE",
+                    "display_name": "VCN 1",
+                    "limit": 5,
+                },
+            )
+
+        mock_client.list_vcns.assert_called_once_with(
+            compartment_id="compartment1",
+            page=None,
+            limit=5,
+            lifecycle_state="AVAILABLE",
+            display_name="VCN 1",
+        )
+
     @pytest.mark.asyncio
     @patch("oracle.oci_networking_mcp_server.server.get_networking_client")
     async def test_get_vcn(self, mock_get_client):
@@ -66,6 +103,31 @@ class TestNetworkingTools:
 
             assert result["id"] == "vcn1"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_networking_mcp_server.server.get_networking_client")
+    async def test_get_vcn_is_cached_until_delete(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_get_response = create_autospec(oci.response.Response)
+        mock_get_response.data = oci.core.models.Vcn(
+            id="vcn1", display_name="VCN 1", lifecycle_state="AVAILABLE"
+        )
+        mock_client.get_vcn.return_value = mock_get_response
+
+        mock_delete_response = create_autospec(oci.response.Response)
+        mock_delete_response.status = 204
+        mock_client.delete_vcn.return_value = mock_delete_response
+
+        async with Client(mcp) as client:
+            await client.call_tool("get_vcn", {"vcn_id": "vcn1"})
+            await client.call_tool("get_vcn", {"vcn_id": "vcn1"})
+            assert mock_client.get_vcn.call_count == 1
+
+            await client.call_tool("delete_vcn", {"vcn_id": "vcn1"})
+            await client.call_tool("get_vcn", {"vcn_id": "vcn1"})
+            assert mock_client.get_vcn.call_count == 2
+
     @pytest.mark.asyncio
     @patch("oracle.oci_networking_mcp_server.server.get_networking_client")
     async def test_delete_vcn(self, mock_get_client):
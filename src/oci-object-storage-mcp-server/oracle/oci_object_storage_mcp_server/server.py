@@ -4,10 +4,13 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Annotated, List
 
+import anyio
 import oci
 from fastmcp import FastMCP
 from oracle.oci_object_storage_mcp_server.models import (
@@ -24,15 +27,19 @@ from oracle.oci_object_storage_mcp_server.models import (
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP(name=__project__)
 
 
+# ~/.oci/config is parsed once per profile, not on every client build
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
 def get_object_storage_client():
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
     user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
@@ -207,7 +214,9 @@ def upload_object(
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -4,48 +4,166 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import logging
 import os
-from logging import Logger
-from typing import Annotated
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from importlib.util import find_spec
+from typing import Annotated, Any
 
+import anyio
 import oci
+import orjson
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from cryptography.hazmat.primitives import serialization
 from fastmcp import FastMCP
 from oci.resource_search.models import FreeTextSearchDetails, StructuredSearchDetails
 
 from . import __project__, __version__
 
-logger = Logger(__name__, level="INFO")
+try:
+    # the SDK sends requests through its vendored copy, a private module
+    from oci._vendor import requests
+    from oci._vendor.requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
-mcp = FastMCP(name=__project__)
+logger = logging.getLogger(__name__)
 
+# tools run the blocking OCI SDK calls on anyio worker threads; raise the
+# default limit of 40 so concurrent tool calls don't queue up behind it
+WORKER_THREAD_LIMIT = 100
 
-def get_search_client():
-    logger.info("entering get_search_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
-    )
 
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREAD_LIMIT
+    yield
+
+
+# orjson encodes the large list results several times faster than FastMCP's
+# default pydantic_core serializer; FastMCP falls back to the default if it fails
+def serialize_result(data: Any) -> str:
+    return orjson.dumps(data, default=str, option=orjson.OPT_UTC_Z).decode()
+
+
+mcp = FastMCP(name=__project__, lifespan=lifespan, tool_serializer=serialize_result)
+
+OCID_PATTERN = re.compile(r"ocid1\.[a-z0-9_]+\.[a-z0-9_.-]+")
+RESOURCE_TYPE_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+# structured search templates, only validated or quoted values are
+# substituted into them
+ALL_RESOURCES_QUERY = "query all resources where compartmentId = '{compartment_id}'"
+DISPLAY_NAME_QUERY = ALL_RESOURCES_QUERY + " && displayName =~ '{display_name}'"
+IDENTIFIERS_QUERY = ALL_RESOURCES_QUERY + " && ({identifier_clause})"
+IDENTIFIER_CLAUSE = "identifier = '{resource_id}'"
+RESOURCE_TYPE_QUERY = (
+    "query all {resource_type} resources where compartmentId = '{compartment_id}'"
+)
+
+
+def validate_ocid(ocid: str) -> str:
+    if not OCID_PATTERN.fullmatch(ocid):
+        raise ValueError(f"Invalid OCID: {ocid}")
+    return ocid
+
+
+def quote_search_value(value: str) -> str:
+    """Escapes a value for use inside a single quoted search string"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    token = None
+
+# one connection pool shared across client rebuilds; without the vendored
+# requests each client keeps its own session
+MAX_CONNECTIONS = int(os.getenv("OCI_MCP_MAX_CONNECTIONS", WORKER_THREAD_LIMIT))
+_session = None
+if requests is not None:
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+
+_key_file: str = None
+_token_file: str = None
+_token_mtime_ns: int = None
+
+
+@lru_cache(maxsize=8)
+def _config(profile: str) -> dict:
+    return oci.config.from_file(profile_name=profile or oci.config.DEFAULT_PROFILE)
+
+
+@lru_cache
+def _load_private_key(key_file: str):
+    if os.getenv("OCI_MCP_SKIP_RSA_KEY_CHECK") == "1":
+        # skips the slow RSA consistency check; only for keys you generated
+        with open(os.path.expanduser(key_file), "rb") as f:
+            return serialization.load_pem_private_key(
+                f.read().strip(), password=None, unsafe_skip_rsa_key_validation=True
+            )
+    return oci.signer.load_private_key_from_file(key_file)
+
+
+def _load_signer(
+    key_file: str, token_file: str
+) -> oci.auth.signers.SecurityTokenSigner:
+    global _key_file, _token_file, _token_mtime_ns
+    mtime_ns = os.stat(token_file).st_mtime_ns
     with open(token_file, "r") as f:
         token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.resource_search.ResourceSearchClient(config, signer=signer)
+    _key_file, _token_file, _token_mtime_ns = key_file, token_file, mtime_ns
+    return oci.auth.signers.SecurityTokenSigner(token, _load_private_key(key_file))
 
 
-@mcp.tool
-def list_all_resources(compartment_id: str) -> list[dict]:
-    """Returns all resources"""
-    search_client = get_search_client()
-    structured_search = StructuredSearchDetails(
-        type="Structured",
-        query=f"query all resources where compartmentId = '{compartment_id}'",
-    )
-    response = search_client.search_resources(structured_search).data
+@lru_cache(maxsize=1)
+def _create_search_client() -> oci.resource_search.ResourceSearchClient:
+    config = _config(os.getenv("OCI_CONFIG_PROFILE")).copy()
+
+    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+
+    signer = _load_signer(config["key_file"], config["security_token_file"])
+    client = oci.resource_search.ResourceSearchClient(config, signer=signer)
+    if _session is not None:
+        client.base_client.session = _session
+    return client
+
+
+def get_search_client() -> oci.resource_search.ResourceSearchClient:
+    client = _create_search_client()
+    # `oci session refresh` rewrites the token file; only the signer is replaced
+    if os.stat(_token_file).st_mtime_ns != _token_mtime_ns:
+        client.base_client.signer = _load_signer(_key_file, _token_file)
+    return client
+
+
+def structured_search(query: str) -> StructuredSearchDetails:
+    return StructuredSearchDetails(type="Structured", query=query)
+
+
+async def search_all_resources(
+    search_client: oci.resource_search.ResourceSearchClient,
+    search_details: oci.resource_search.models.SearchDetails,
+) -> list[oci.resource_search.models.ResourceSummary]:
+    resources: list[oci.resource_search.models.ResourceSummary] = []
+    has_next_page = True
+    next_page: str = None
+
+    while has_next_page:
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: search_client.search_resources(search_details, page=next_page)
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        resources.extend(response.data.items)
+
+    return resources
+
+
+def map_resources(
+    resources: list[oci.resource_search.models.ResourceSummary], compartment_id: str
+) -> list[dict]:
     return [
         {
             "resource_id": resource.identifier,
@@ -56,41 +174,86 @@ def list_all_resources(compartment_id: str) -> list[dict]:
             "freeform_tags": resource.freeform_tags,
             "defined_tags": resource.defined_tags,
         }
-        for resource in response.items
+        for resource in resources
     ]
 
 
+# read-only lookups are cached for a short while, an agent tends to repeat the
+# same query several times within one conversation
+READ_CACHE_TTL = 60
+_read_cache = TTLCache(maxsize=1024, ttl=READ_CACHE_TTL)
+
+# the set of resource types changes with OCI releases, not with user activity
+_resource_types_cache = TTLCache(maxsize=1, ttl=3600)
+
+
+def read_cached(cache: TTLCache):
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = hashkey(fn.__name__, *args, **kwargs)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            result = await fn(*args, **kwargs)
+            cache[key] = result
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 @mcp.tool
-def search_resources(
+@read_cached(_read_cache)
+async def list_all_resources(compartment_id: str) -> list[dict]:
+    """Returns all resources"""
+    search_client = get_search_client()
+    query = ALL_RESOURCES_QUERY.format(compartment_id=validate_ocid(compartment_id))
+    resources = await search_all_resources(search_client, structured_search(query))
+    return map_resources(resources, compartment_id)
+
+
+@mcp.tool
+async def search_resources(
     compartment_id: str,
     display_name: Annotated[str, "Full display name or display name substring"],
 ) -> list[dict]:
     """Searches for resources by display name"""
     search_client = get_search_client()
-    structured_search = StructuredSearchDetails(
-        type="Structured",
-        query=(
-            f"query all resources where compartmentId = '{compartment_id}' "
-            f"&& displayName =~ '{display_name}'"
+    query = DISPLAY_NAME_QUERY.format(
+        compartment_id=validate_ocid(compartment_id),
+        display_name=quote_search_value(display_name),
+    )
+    resources = await search_all_resources(search_client, structured_search(query))
+    return map_resources(resources, compartment_id)
+
+
+@mcp.tool
+async def get_resources_batch(
+    compartment_id: str,
+    resource_ids: Annotated[list[str], "OCIDs of the resources to look up"],
+) -> list[dict]:
+    """Looks up several resources by OCID with a single search request. Prefer
+    this over calling a get_* tool once per resource"""
+    if not resource_ids:
+        return []
+
+    search_client = get_search_client()
+    query = IDENTIFIERS_QUERY.format(
+        compartment_id=validate_ocid(compartment_id),
+        identifier_clause=" || ".join(
+            IDENTIFIER_CLAUSE.format(resource_id=validate_ocid(resource_id))
+            for resource_id in resource_ids
         ),
     )
-    response = search_client.search_resources(structured_search).data
-    return [
-        {
-            "resource_id": resource.identifier,
-            "compartment_id": compartment_id,
-            "display_name": resource.display_name,
-            "resource_type": resource.resource_type,
-            "lifecycle_state": resource.lifecycle_state,
-            "freeform_tags": resource.freeform_tags,
-            "defined_tags": resource.defined_tags,
-        }
-        for resource in response.items
-    ]
+    resources = await search_all_resources(search_client, structured_search(query))
+    return map_resources(resources, compartment_id)
 
 
 @mcp.tool
-def search_resources_free_form(
+async def search_resources_free_form(
     compartment_id: str,
     text: Annotated[str, "Free-form search string"],
 ) -> list[dict]:
@@ -100,56 +263,48 @@ def search_resources_free_form(
         type="FreeText",
         text=text,
     )
-    response = search_client.search_resources(freetext_search).data
-    return [
-        {
-            "resource_id": resource.identifier,
-            "compartment_id": compartment_id,
-            "display_name": resource.display_name,
-            "resource_type": resource.resource_type,
-            "lifecycle_state": resource.lifecycle_state,
-            "freeform_tags": resource.freeform_tags,
-            "defined_tags": resource.defined_tags,
-        }
-        for resource in response.items
-    ]
+    resources = await search_all_resources(search_client, freetext_search)
+    return map_resources(resources, compartment_id)
 
 
-def search_resources_by_type(compartment_id: str, resource_type: str):
+async def search_resources_by_type(compartment_id: str, resource_type: str):
     """Search for resources by resource type"""
+    if not RESOURCE_TYPE_PATTERN.fullmatch(resource_type):
+        raise ValueError(f"Invalid resource type: {resource_type}")
+
     search_client = get_search_client()
-    structured_search = StructuredSearchDetails(
-        type="Structured",
-        query=(
-            f"query all {resource_type} "
-            f"resources where compartmentId = '{compartment_id}'"
-        ),
+    query = RESOURCE_TYPE_QUERY.format(
+        resource_type=resource_type,
+        compartment_id=validate_ocid(compartment_id),
     )
-    response = search_client.search_resources(structured_search).data
-    return [
-        {
-            "resource_id": resource.identifier,
-            "compartment_id": compartment_id,
-            "display_name": resource.display_name,
-            "resource_type": resource.resource_type,
-            "lifecycle_state": resource.lifecycle_state,
-            "freeform_tags": resource.freeform_tags,
-            "defined_tags": resource.defined_tags,
-        }
-        for resource in response.items
-    ]
+    resources = await search_all_resources(search_client, structured_search(query))
+    return map_resources(resources, compartment_id)
 
 
 @mcp.tool
-def list_resource_types() -> list[str]:
+@read_cached(_resource_types_cache)
+async def list_resource_types() -> list[str]:
     """Returns a list of all supported OCI resource types"""
     search_client = get_search_client()
-    resource_types = search_client.list_resource_types()
-    return [x.name for x in resource_types.data]
+    resource_types: list[oci.resource_search.models.ResourceType] = []
+    has_next_page = True
+    next_page: str = None
+
+    while has_next_page:
+        response: oci.response.Response = await anyio.to_thread.run_sync(
+            lambda: search_client.list_resource_types(page=next_page)
+        )
+        has_next_page = response.has_next_page
+        next_page = response.next_page if hasattr(response, "next_page") else None
+        resource_types.extend(response.data)
+
+    return [x.name for x in resource_types]
 
 
 def main():
-    mcp.run()
+    # uvloop is optional, the default asyncio event loop is used without it
+    use_uvloop = find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
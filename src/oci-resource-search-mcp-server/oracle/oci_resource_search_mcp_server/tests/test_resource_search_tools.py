@@ -9,9 +9,17 @@ from unittest.mock import MagicMock, create_autospec, patch
 import oci
 import pytest
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from oracle.oci_resource_search_mcp_server import server
 from oracle.oci_resource_search_mcp_server.server import mcp
 
 
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    server._read_cache.clear()
+    server._resource_types_cache.clear()
+
+
 class TestResourceSearchTools:
     @pytest.mark.asyncio
     @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
@@ -32,6 +40,8 @@ class TestResourceSearchTools:
                 ]
             )
         )
+        mock_search_response.has_next_page = False
+        mock_search_response.next_page = None
         mock_client.search_resources.return_value = mock_search_response
 
         async with Client(mcp) as client:
@@ -39,7 +49,7 @@ class TestResourceSearchTools:
                 await client.call_tool(
                     "list_all_resources",
                     {
-                        "compartment_id": "compartment1",
+                        "compartment_id": "ocid1.compartment.oc1..compartment1",
                     },
                 )
             ).structured_content["result"]
@@ -47,6 +57,41 @@ class TestResourceSearchTools:
             assert len(result) == 1
             assert result[0]["resource_id"] == "resource1"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_list_all_resources_follows_pages(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        responses = []
+        for i, next_page in enumerate(["page2", None]):
+            response = create_autospec(oci.response.Response)
+            response.data = oci.resource_search.models.ResourceSummaryCollection(
+                items=[
+                    oci.resource_search.models.ResourceSummary(
+                        identifier=f"resource{i + 1}",
+                        display_name=f"Resource {i + 1}",
+                    )
+                ]
+            )
+            response.has_next_page = next_page is not None
+            response.next_page = next_page
+            responses.append(response)
+        mock_client.search_resources.side_effect = responses
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "list_all_resources",
+                    {
+                        "compartment_id": "ocid1.compartment.oc1..compartment1",
+                    },
+                )
+            ).structured_content["result"]
+
+            assert [r["resource_id"] for r in result] == ["resource1", "resource2"]
+            assert mock_client.search_resources.call_args.kwargs["page"] == "page2"
+
     @pytest.mark.asyncio
     @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
     async def test_search_resources(self, mock_get_client):
@@ -66,6 +111,8 @@ class TestResourceSearchTools:
                 ]
             )
         )
+        mock_search_response.has_next_page = False
+        mock_search_response.next_page = None
         mock_client.search_resources.return_value = mock_search_response
 
         async with Client(mcp) as client:
@@ -73,7 +120,7 @@ class TestResourceSearchTools:
                 await client.call_tool(
                     "search_resources",
                     {
-                        "compartment_id": "compartment1",
+                        "compartment_id": "ocid1.compartment.oc1..compartment1",
                         "display_name": "Resource",
                     },
                 )
@@ -82,6 +129,112 @@ class TestResourceSearchTools:
             assert len(result) == 1
             assert result[0]["resource_id"] == "resource1"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_search_resources_quotes_display_name(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_search_response = create_autospec(oci.response.Response)
+        mock_search_response.data = (
+            oci.resource_search.models.ResourceSummaryCollection(items=[])
+        )
+        mock_search_response.has_next_page = False
+        mock_search_response.next_page = None
+        mock_client.search_resources.return_value = mock_search_response
+
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "search_resources",
+                {
+                    "compartment_id": "ocid1.compartment.oc1..compartment1",
+                    "display_name": "x' || displayName =~ 'y",
+                },
+            )
+
+        query = mock_client.search_resources.call_args.args[0].query
+        assert query.endswith("&& displayName =~ 'x\\' || displayName =~ \\'y'")
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_search_resources_rejects_invalid_compartment_id(
+        self, mock_get_client
+    ):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        async with Client(mcp) as client:
+            for compartment_id in (
+                "ocid1.compartment.oc1..compartment1\n",
+                "ocid1.compartment.oc1..x' || displayName =~ 'y",
+            ):
+                with pytest.raises(ToolError):
+                    await client.call_tool(
+                        "search_resources",
+                        {"compartment_id": compartment_id, "display_name": "Resource"},
+                    )
+
+        mock_client.search_resources.assert_not_called()
+
+    def test_search_patterns_reject_trailing_newline(self):
+        with pytest.raises(ValueError):
+            server.validate_ocid("ocid1.compartment.oc1..compartment1\n")
+        assert not server.RESOURCE_TYPE_PATTERN.fullmatch("instance\n")
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
+    async def test_get_resources_batch(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_search_response = create_autospec(oci.response.Response)
+        mock_search_response.data = (
+            oci.resource_search.models.ResourceSummaryCollection(
+                items=[
+                    oci.resource_search.models.ResourceSummary(
+                        identifier="ocid1.instance.oc1.iad.instance1",
+                        display_name="Instance 1",
+                        resource_type="Instance",
+                        lifecycle_state="RUNNING",
+                    ),
+                    oci.resource_search.models.ResourceSummary(
+                        identifier="ocid1.vcn.oc1.iad.vcn1",
+                        display_name="VCN 1",
+                        resource_type="Vcn",
+                        lifecycle_state="AVAILABLE",
+                    ),
+                ]
+            )
+        )
+        mock_search_response.has_next_page = False
+        mock_search_response.next_page = None
+        mock_client.search_resources.return_value = mock_search_response
+
+        async with Client(mcp) as client:
+            call_tool_result = await client.call_tool(
+                "get_resources_batch",
+                {
+                    "compartment_id": "ocid1.compartment.oc1..compartment1",
+                    "resource_ids": [
+                        "ocid1.instance.oc1.iad.instance1",
+                        "ocid1.vcn.oc1.iad.vcn1",
+                    ],
+                },
+            )
+            result = call_tool_result.structured_content["result"]
+
+            assert [r["resource_id"] for r in result] == [
+                "ocid1.instance.oc1.iad.instance1",
+                "ocid1.vcn.oc1.iad.vcn1",
+            ]
+
+        mock_client.search_resources.assert_called_once()
+        query = mock_client.search_resources.call_args.args[0].query
+        assert query.endswith(
+            "&& (identifier = 'ocid1.instance.oc1.iad.instance1'"
+            " || identifier = 'ocid1.vcn.oc1.iad.vcn1')"
+        )
+
     @pytest.mark.asyncio
     @patch("oracle.oci_resource_search_mcp_server.server.get_search_client")
     async def test_search_resources_free_form(self, mock_get_client):
@@ -101,6 +254,8 @@ class TestResourceSearchTools:
                 ]
             )
         )
+        mock_search_response.has_next_page = False
+        mock_search_response.next_page = None
         mock_client.search_resources.return_value = mock_search_response
 
         async with Client(mcp) as client:
@@ -108,7 +263,7 @@ class TestResourceSearchTools:
                 await client.call_tool(
                     "search_resources_free_form",
                     {
-                        "compartment_id": "compartment1",
+                        "compartment_id": "ocid1.compartment.oc1..compartment1",
                         "text": "Resource",
                     },
                 )
@@ -128,6 +283,8 @@ class TestResourceSearchTools:
             oci.resource_search.models.ResourceType(name="instance"),
             oci.resource_search.models.ResourceType(name="volume"),
         ]
+        mock_list_response.has_next_page = False
+        mock_list_response.next_page = None
         mock_client.list_resource_types.return_value = mock_list_response
 
         async with Client(mcp) as client: